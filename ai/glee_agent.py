@@ -1,8 +1,6 @@
 from dotenv import load_dotenv
-from ai.services.agent.ocr_agent import OcrAgent
-from ai.services.agent.orchestrator_agent import OrchestratorAgent
-from ai.services.agent.style_analysis_agent import StyleAnalysisAgent
-from ai.services.agent.summarizer_agent import SummarizerAgent
+from ai.services.agent.agent_registry import agents
+from ai.services.agent.orchestrator_agent import OnSuggestionEvent
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -14,12 +12,7 @@ load_dotenv()  # .env 파일 로드
 
 
 class GleeAgent:
-    ocr_agent: OcrAgent = OcrAgent()
-    summarizer_agent: SummarizerAgent = SummarizerAgent()
-    style_agent: StyleAnalysisAgent = StyleAnalysisAgent()
-
-    orchestrator_agent: OrchestratorAgent = OrchestratorAgent()
-
+    # 에이전트는 agents 레지스트리에서 처음 사용할 때 생성
     @classmethod  # 실제적으로 사용되지 않는 메서드같습니다
     async def parse_suggestion(cls, suggestion: str) -> tuple[str, str]:
         """제안 텍스트에서 제목과 내용을 추출합니다."""
@@ -49,10 +42,10 @@ class GleeAgent:
             raise ValueError("No image files provided.")
 
         # ocr 에이전트를 사용하여 텍스트 추출
-        image_text = await cls.ocr_agent.run(image_files)
+        image_text = await agents.ocr.run(image_files)
 
         # 상황 요약 에이전트를 사용하여 상황 분석
-        situation_string = await cls.summarizer_agent.run(image_text)
+        situation_string = await agents.summarizer.run(image_text)
         return situation_string
 
     # [2] 이미지파일 (최대 4개) 입력 -> 상황, 말투, 용도를 뱉어내는 함수
@@ -62,38 +55,45 @@ class GleeAgent:
             return "", "", ""
 
         # ocr 에이전트를 사용하여 텍스트 추출
-        image_text = await cls.ocr_agent.run(image_files)
+        image_text = await agents.ocr.run(image_files)
 
         # 스타일 분석 에이전트를 사용하여 스타일 분석
-        _, situation, accent, purpose = await cls.style_agent.run(image_text)
+        _, situation, accent, purpose = await agents.style.run(image_text)
         return situation, accent, purpose
 
     # -------------------------------------------------------------------
     # [3] 상황만을 기반으로 글 제안을 생성하는 함수
     @classmethod
-    async def generate_suggestions_situation(cls, situation: str) -> AiSuggestionDto:
-        title, suggestion = await cls.orchestrator_agent.run_reply_mode(situation)
+    async def generate_suggestions_situation(
+        cls, situation: str, on_event: OnSuggestionEvent | None = None
+    ) -> AiSuggestionDto:
+        title, suggestion = await agents.orchestrator.run_reply_mode(situation, on_event)
         return AiSuggestionDto(titles=title, suggestions=suggestion)
 
     # -------------------------------------------------------------------
     # [4] 상황, 말투, 용도를 기반으로 글 제안을 생성하는 함수
     @classmethod
     async def generate_reply_suggestions_accent_purpose(
-        cls, situation: str, accent: str, purpose: str
+        cls, situation: str, accent: str, purpose: str, on_event: OnSuggestionEvent | None = None
     ) -> AiSuggestionDto:
 
-        title, suggestion = await cls.orchestrator_agent.run_manual_mode(situation, accent, purpose, "")
+        title, suggestion = await agents.orchestrator.run_manual_mode(situation, accent, purpose, "", on_event)
         return AiSuggestionDto(titles=title, suggestions=suggestion)
 
     # -------------------------------------------------------------------
     # [5] 상황, 말투, 용도, 상세 설명을 기반으로 글 제안을 생성하는 함수
     @classmethod
     async def generate_reply_suggestions_detail(
-        cls, situation: str, accent: str, purpose: str, detailed_description: str
+        cls,
+        situation: str,
+        accent: str,
+        purpose: str,
+        detailed_description: str,
+        on_event: OnSuggestionEvent | None = None,
     ) -> AiSuggestionDto:
 
-        title, suggestion = await cls.orchestrator_agent.run_manual_mode(
-            situation, accent, purpose, detailed_description
+        title, suggestion = await agents.orchestrator.run_manual_mode(
+            situation, accent, purpose, detailed_description, on_event
         )
         return AiSuggestionDto(titles=title, suggestions=suggestion)
 
@@ -102,10 +102,10 @@ class GleeAgent:
     #  length : 짧게, 길게, 적당함 (short, long, moderate) 예정
     @classmethod
     async def generate_reply_suggestions_detail_length(
-        cls, suggestion: str, length: str, add_description: str
+        cls, suggestion: str, length: str, add_description: str, on_event: OnSuggestionEvent | None = None
     ) -> AiSuggestionDto:
 
-        title, extend_suggestion = await cls.orchestrator_agent.run_manual_mode_extended(
-            suggestion, length, add_description
+        title, extend_suggestion = await agents.orchestrator.run_manual_mode_extended(
+            suggestion, length, add_description, on_event
         )
         return AiSuggestionDto(titles=title, suggestions=extend_suggestion)
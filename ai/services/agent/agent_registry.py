@@ -0,0 +1,54 @@
+from functools import cached_property
+
+from ai.services.agent.feedback_agent import FeedbackAgent
+from ai.services.agent.ocr_agent import OcrAgent
+from ai.services.agent.orchestrator_agent import OrchestratorAgent
+from ai.services.agent.reply_suggestion_agent import ReplySuggestionAgent
+from ai.services.agent.style_analysis_agent import StyleAnalysisAgent
+from ai.services.agent.summarizer_agent import SummarizerAgent
+from ai.services.agent.title_suggestion_agent import TitleSuggestionAgent
+
+
+class AgentRegistry:
+    """에이전트를 처음 사용할 때 한 번만 생성해 GleeAgent 와 OrchestratorAgent 가 같은 인스턴스를 공유"""
+
+    @cached_property
+    def ocr(self) -> OcrAgent:
+        return OcrAgent()
+
+    @cached_property
+    def summarizer(self) -> SummarizerAgent:
+        return SummarizerAgent()
+
+    @cached_property
+    def style(self) -> StyleAnalysisAgent:
+        return StyleAnalysisAgent()
+
+    @cached_property
+    def title(self) -> TitleSuggestionAgent:
+        return TitleSuggestionAgent()
+
+    @cached_property
+    def reply_old(self) -> ReplySuggestionAgent:
+        return ReplySuggestionAgent(variant="old")
+
+    @cached_property
+    def reply_new(self) -> ReplySuggestionAgent:
+        return ReplySuggestionAgent(variant="new")
+
+    @cached_property
+    def feedback(self) -> FeedbackAgent:
+        return FeedbackAgent()
+
+    @cached_property
+    def orchestrator(self) -> OrchestratorAgent:
+        return OrchestratorAgent(
+            summarizer_agent=self.summarizer,
+            title_agent=self.title,
+            reply_agent_old=self.reply_old,
+            reply_agent_new=self.reply_new,
+            feedback_agent=self.feedback,
+        )
+
+
+agents = AgentRegistry()
@@ -1,5 +1,6 @@
 from ai.services.agent.summarizer_agent import SummarizerAgent
 from ai.services.agent.reply_suggestion_agent import ReplySuggestionAgent
+from ai.utils.services import services
 
 
 class FeedbackAgent:
@@ -10,7 +11,11 @@ class FeedbackAgent:
     async def improve_reply(self, output: str, original_input: str, agent: ReplySuggestionAgent) -> str:
         retries = 0
         _output = output
-        while len(_output.strip()) < self.min_length and retries < self.max_retries:
+        while (
+            len(_output.strip()) < self.min_length
+            and retries < self.max_retries
+            and await services.reply.retry_policy.retry(retries, services.reply.breaker)
+        ):
             improved_input = original_input + "\n추가 상세 설명 부탁해."
             reply = await agent.run(improved_input)
             _output = reply[0] if reply else output
@@ -20,7 +25,11 @@ class FeedbackAgent:
     async def improve_summary(self, output: str, original_input: str, agent: SummarizerAgent) -> str:
         retries = 0
         _output = output
-        while len(_output.strip()) < self.min_length and retries < self.max_retries:
+        while (
+            len(_output.strip()) < self.min_length
+            and retries < self.max_retries
+            and await services.situation.retry_policy.retry(retries, services.situation.breaker)
+        ):
             improved_input = original_input + "\n추가 상세 설명 부탁해."
             _output = await agent.run(improved_input)
             retries += 1
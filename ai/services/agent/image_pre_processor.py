@@ -1,35 +1,149 @@
+from dataclasses import dataclass
 from io import BytesIO
+
 from PIL import Image, ImageOps, UnidentifiedImageError
 from loguru import logger
 
+from ai.utils.cpu_executor import image_executor
+from app.core.settings import settings
+
+# Clova OCR 가 받는 포맷 (이 외의 포맷은 다시 인코딩해서 보냄)
+OCR_FORMATS = {"JPEG": "jpg", "PNG": "png", "TIFF": "tiff"}
+EXIF_ORIENTATION = 0x0112
+
+
+@dataclass(frozen=True)
+class PreprocessPolicy:
+    """
+    OCR 업로드 전 이미지 처리 정책
+
+    - max_side: 긴 변의 최대 픽셀 (0 이면 크기를 줄이지 않음)
+    - output_format / quality: 다시 인코딩할 때의 포맷과 JPEG 품질
+      (AUTO 면 OCR 이 받는 포맷은 유지하고 나머지는 JPEG, 단색 위주의 스크린샷은 PNG 가 JPEG 보다 작음)
+    - 회전, 축소, 포맷 변환이 모두 필요 없거나, 다시 인코딩한 결과가 원본보다 크면 원본 바이트를 그대로 사용
+    """
+
+    max_side: int = 2048
+    output_format: str = "AUTO"
+    quality: int = 85
+
+    @classmethod
+    def from_settings(cls) -> "PreprocessPolicy":
+        return cls(
+            max_side=settings.ocr_image_max_side,
+            output_format=settings.ocr_image_format.upper(),
+            quality=settings.ocr_image_quality,
+        )
+
+
+@dataclass(frozen=True)
+class PreprocessedImage:
+    data: bytes
+    extension: str
+    original_bytes: int
+    reencoded: bool
+
+
+@dataclass(frozen=True)
+class PreprocessStats:
+    images: int
+    reencoded: int
+    bytes_in: int
+    bytes_out: int
+    bytes_saved: int
+
+
+def preprocess_bytes(image_bytes: bytes, policy: PreprocessPolicy) -> PreprocessedImage:
+    """정책에 따라 회전/축소/재압축 (CPU 실행기의 스레드/프로세스에서 실행되도록 상태 없이 모듈 수준에 둠)"""
+    try:
+        return _apply_policy(image_bytes, policy)
+
+    except UnidentifiedImageError as e:
+        logger.error(f"[ImagePreprocessor] 올바르지 않은 이미지 데이터: {e}")
+        raise ValueError("올바르지 않은 이미지 데이터입니다.")
+
+    except KeyError as e:
+        logger.error(f"[ImagePreprocessor] 지원되지 않는 이미지 포맷: {policy.output_format}, 오류: {e}")
+        raise ValueError(f"지원되지 않는 이미지 포맷입니다: {policy.output_format}")
+
+    except MemoryError as e:
+        logger.critical("[ImagePreprocessor] 메모리 부족 오류 발생!")
+        raise ValueError(f"이미지가 너무 커서 메모리 부족 오류가 발생했습니다. 오류 : {e}")
+
+    except Exception as e:
+        logger.exception(f"[ImagePreprocessor] 이미지 전처리 중 예상치 못한 오류 발생: {e}")
+        raise RuntimeError(f"이미지 전처리 중 예상치 못한 오류 발생: {e}")
+
+
+def _apply_policy(image_bytes: bytes, policy: PreprocessPolicy) -> PreprocessedImage:
+    with Image.open(BytesIO(image_bytes)) as image:
+        source_format = image.format or ""
+        needs_rotation = image.getexif().get(EXIF_ORIENTATION, 1) != 1
+        needs_resize = policy.max_side > 0 and max(image.size) > policy.max_side
+
+        if not needs_rotation and not needs_resize and source_format in OCR_FORMATS:
+            return PreprocessedImage(image_bytes, OCR_FORMATS[source_format], len(image_bytes), reencoded=False)
+
+        if needs_resize and source_format == "JPEG":
+            # 큰 JPEG 는 디코딩 단계에서 1/2, 1/4, 1/8 로 줄여 읽음 (max_side 이상은 유지)
+            image.draft("RGB", (policy.max_side, policy.max_side))
+
+        transposed = ImageOps.exif_transpose(image)
+        if needs_resize:
+            transposed.thumbnail((policy.max_side, policy.max_side), Image.Resampling.LANCZOS)
+
+        output_format = policy.output_format
+        if output_format == "AUTO":
+            output_format = source_format if source_format in OCR_FORMATS else "JPEG"
+        if output_format == "JPEG" and transposed.mode not in ("RGB", "L"):
+            transposed = transposed.convert("RGB")
+
+        with BytesIO() as output_buffer:
+            # PNG optimize 는 느리므로 JPEG 에만 사용
+            transposed.save(
+                output_buffer, format=output_format, quality=policy.quality, optimize=output_format == "JPEG"
+            )
+            data = output_buffer.getvalue()
+
+    if not needs_rotation and len(data) >= len(image_bytes) and source_format in OCR_FORMATS:
+        return PreprocessedImage(image_bytes, OCR_FORMATS[source_format], len(image_bytes), reencoded=False)
+    return PreprocessedImage(data, OCR_FORMATS[output_format], len(image_bytes), reencoded=True)
+
 
 class ImagePreprocessor:
-    def preprocess(self, image_bytes: bytes, output_format: str = "PNG") -> bytes:
+    def __init__(self, policy: PreprocessPolicy | None = None) -> None:
+        self.policy = policy or PreprocessPolicy.from_settings()
+        self._images = 0
+        self._reencoded = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+
+    def preprocess(self, image_bytes: bytes) -> bytes:
         """이미지 전처리를 수행하고 메모리에서 직접 변환합니다."""
-        try:
-            # 이미지 로드
-            with BytesIO(image_bytes) as input_buffer:
-                with Image.open(input_buffer) as image:
-                    # EXIF 정보에 따른 자동 회전
-                    image = ImageOps.exif_transpose(image)
-
-                    # 출력 버퍼 생성 및 저장
-                    with BytesIO() as output_buffer:
-                        image.save(output_buffer, format=image.format or output_format)
-                        return output_buffer.getvalue()
-
-        except UnidentifiedImageError as e:
-            logger.error(f"[ImagePreprocessor] 올바르지 않은 이미지 데이터: {e}")
-            raise ValueError("올바르지 않은 이미지 데이터입니다.")
-
-        except KeyError as e:
-            logger.error(f"[ImagePreprocessor] 지원되지 않는 이미지 포맷: {output_format}, 오류: {e}")
-            raise ValueError(f"지원되지 않는 이미지 포맷입니다: {output_format}")
-
-        except MemoryError as e:
-            logger.critical("[ImagePreprocessor] 메모리 부족 오류 발생!")
-            raise ValueError(f"이미지가 너무 커서 메모리 부족 오류가 발생했습니다. 오류 : {e}")
-
-        except Exception as e:
-            logger.exception(f"[ImagePreprocessor] 이미지 전처리 중 예상치 못한 오류 발생: {e}")
-            raise RuntimeError(f"이미지 전처리 중 예상치 못한 오류 발생: {e}")
+        return self.preprocess_image(image_bytes).data
+
+    def preprocess_image(self, image_bytes: bytes) -> PreprocessedImage:
+        """정책에 따라 회전/축소/재압축하고, OCR 요청에 사용할 확장자와 함께 반환"""
+        return self._record(preprocess_bytes(image_bytes, self.policy))
+
+    async def preprocess_image_async(self, image_bytes: bytes) -> PreprocessedImage:
+        """preprocess_image 를 CPU 실행기에서 수행 (이벤트 루프를 막지 않음, 포화 시 CpuExecutorBusyError)"""
+        return self._record(await image_executor.run(preprocess_bytes, image_bytes, self.policy))
+
+    def stats(self) -> PreprocessStats:
+        return PreprocessStats(
+            images=self._images,
+            reencoded=self._reencoded,
+            bytes_in=self._bytes_in,
+            bytes_out=self._bytes_out,
+            bytes_saved=self._bytes_in - self._bytes_out,
+        )
+
+    def _record(self, result: PreprocessedImage) -> PreprocessedImage:
+        self._images += 1
+        self._reencoded += int(result.reencoded)
+        self._bytes_in += result.original_bytes
+        self._bytes_out += len(result.data)
+        if result.reencoded:
+            logger.info(f"[ImagePreprocessor] {result.original_bytes} -> {len(result.data)} bytes ({result.extension})")
+        return result
@@ -1,20 +1,28 @@
 import asyncio
+import time
 from loguru import logger
 
 
 from ai.services.agent.image_pre_processor import ImagePreprocessor
+from ai.services.agent.ocr_merger import OcrMerger
 from ai.services.agent.ocr_post_processing_agent import OcrPostProcessingAgent
 from ai.utils.image_dto import ImageDto
-from ai.utils.services import ocr_service
+from ai.utils.ocr_cache import make_ocr_cache_key, ocr_cache
+from ai.utils.ocr_result import OcrImageResult, OcrStatus
+from ai.utils.retry_policy import is_retryable
+from ai.utils.services import services
+from app.core.settings import settings
 
 
 class OcrAgent:
     """ocr 처리를 담당하는 에이전트"""
 
-    def __init__(self, max_retries: int = 2) -> None:
+    def __init__(self, max_retries: int = 2, max_empty_retries: int = 1) -> None:
         self.max_retries = max_retries
+        self.max_empty_retries = max_empty_retries
         self.post_processor: OcrPostProcessingAgent = OcrPostProcessingAgent()
         self.preprocessor: ImagePreprocessor = ImagePreprocessor()
+        self.merger: OcrMerger = OcrMerger()
 
     # 헬퍼 함수: ocr 결과 JSON에서 텍스트 추출
     async def extract_text_from_ocr_result(self, ocr_result: str) -> str:
@@ -37,45 +45,89 @@ class OcrAgent:
 
         return ""
 
-    async def run(self, images: list[tuple[str, bytes]]) -> str:
-        """이미지 파일에서 텍스트를 추출합니다."""
-        aggregated_text = []
-
-        processed_data: list[ImageDto] = []
-        for filename, filedata in images:
-            # 이미지 전처리 적용
-            processed_data.append(ImageDto(name=filename, data=self.preprocessor.preprocess(filedata)))
-
-        retry = 0
-        while retry <= self.max_retries:
+    async def _ocr_image(self, image: ImageDto) -> OcrImageResult:
+        """
+        이미지 한 장을 ocr
+
+        실패(재시도 가능한 오류)했거나 빈 텍스트가 온 경우 그 이미지만 정책에 따라 다시 요청
+        (빈 텍스트는 글자가 없는 이미지일 수 있어 max_empty_retries 번까지만)
+        """
+        started = time.monotonic()
+        backend = services.ocr
+        cache_key: str | None = None
+        if settings.ocr_cache_enabled:
+            # 같은 이미지를 다시 올린 경우 OCR 을 호출하지 않음
+            cache_key = await make_ocr_cache_key(image.data, backend.name)
+            cached: str | None = await ocr_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"OCR 캐시 적중: {image.name}")
+                return OcrImageResult(image.name, cached, OcrStatus.CACHED, self._elapsed_ms(started), attempts=0)
+
+        # 로컬 OCR 엔진은 재시도 정책이 없으므로 한 번만 요청
+        policy = backend.retry_policy
+        attempts = 0
+        empty_retries = 0
+        while True:
+            attempts += 1
+            error: Exception | None = None
             try:
-                # 비동기 ocr 요청 (ClovaOcr.run() 사용)
-                ocr_result = await ocr_service.run(processed_data)
-
-                if isinstance(ocr_result, str) and ocr_result.startswith("Error"):
-                    logger.error(ocr_result)
-                    aggregated_text.append("")
-                    break
-
-                extracted_text = await self.extract_text_from_ocr_result(ocr_result)
-
-                if len(extracted_text.strip()) < 5 and retry < self.max_retries:
-                    retry += 1
-                    logger.warning(f"ocr 결과가 너무 짧음, 재시도 {retry}/{self.max_retries}")
-                    await asyncio.sleep(1)
-                    continue
-                else:
-                    aggregated_text.append(extracted_text)
-                    break
-
+                text = await backend.request_text(image.data, image.name)
             except Exception as e:
-                logger.error(f"ocr 처리 중 오류 발생: {str(e)}")
-                if retry >= self.max_retries:
-                    aggregated_text.append("")
-                    break
-                retry += 1
-                await asyncio.sleep(1)
-
-        raw_text = "\n".join(aggregated_text)
+                text, error = "", e
+            if text:
+                break
+
+            if error is None:
+                retryable = empty_retries < self.max_empty_retries
+                empty_retries += 1
+            else:
+                retryable = is_retryable(error)
+            if (
+                policy is None
+                or attempts > self.max_retries
+                or not retryable
+                or not await policy.retry(attempts - 1, backend.breaker)
+            ):
+                break
+            logger.warning(f"[{image.name}] ocr 재시도 {attempts}/{self.max_retries}: {error or '빈 텍스트'}")
+
+        latency_ms = self._elapsed_ms(started)
+        if error is not None:
+            logger.error(f"ocr 처리 중 오류 발생: {str(error)} for file {image.name}")
+            return OcrImageResult(image.name, "", OcrStatus.FAILED, latency_ms, attempts, error=str(error))
+        if not text:
+            return OcrImageResult(image.name, "", OcrStatus.EMPTY, latency_ms, attempts)
+
+        if cache_key:
+            await ocr_cache.set(cache_key, text)
+        return OcrImageResult(image.name, text, OcrStatus.OK, latency_ms, attempts)
+
+    @staticmethod
+    def _elapsed_ms(started: float) -> float:
+        return round((time.monotonic() - started) * 1000, 2)
+
+    async def ocr_images(self, images: list[tuple[str, bytes]]) -> list[OcrImageResult]:
+        """이미지별 OCR 결과 (입력 순서 유지, 실패한 이미지가 있어도 성공한 이미지의 텍스트는 그대로 둠)"""
+        # 이미지 전처리는 CPU 실행기에서 이미지별로 동시에 수행
+        processed_images = await asyncio.gather(
+            *(self.preprocessor.preprocess_image_async(filedata) for _, filedata in images)
+        )
+        # 다시 인코딩되면 OCR 요청 포맷도 바뀌므로 확장자를 맞춤
+        processed_data = [
+            ImageDto(name=f"{filename.rsplit('.', 1)[0]}.{processed.extension}", data=processed.data)
+            for (filename, _), processed in zip(images, processed_images)
+        ]
+
+        results = list(await asyncio.gather(*(self._ocr_image(image) for image in processed_data)))
+        failed = [result.name for result in results if not result.succeeded]
+        if failed:
+            logger.warning(f"ocr 결과가 없는 이미지 {len(failed)}/{len(results)}개: {failed}")
+        return results
+
+    async def run(self, images: list[tuple[str, bytes]]) -> str:
+        """이미지 파일에서 텍스트를 추출합니다."""
+        results = await self.ocr_images(images)
+        # 스크롤해서 찍은 스크린샷끼리 겹치는 대화는 한 번만 남김
+        raw_text = self.merger.merge([result.text for result in results]).text
         processed_text = self.post_processor.run(raw_text)
         return processed_text
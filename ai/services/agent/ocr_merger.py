@@ -0,0 +1,164 @@
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+from loguru import logger
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+@dataclass(frozen=True)
+class MergeResult:
+    text: str
+    chars_in: int
+    chars_saved: int
+    duplicate_images: int
+    overlaps: int
+
+
+@dataclass(frozen=True)
+class OcrMergeStats:
+    requests: int
+    images: int
+    duplicate_images: int
+    overlaps: int
+    chars_in: int
+    chars_saved: int
+
+
+def _normalize(unit: str) -> str:
+    """공백, 문장부호, 대소문자 차이를 무시 (OCR 이 같은 말풍선을 조금씩 다르게 읽는 경우)"""
+    return _NON_WORD.sub("", unit).lower()
+
+
+def _contains_run(units: list[str], run: list[str]) -> bool:
+    """run 이 units 안에 단위 경계에 맞춰 연속으로 들어 있는지"""
+    size = len(run)
+    return any(units[start : start + size] == run for start in range(len(units) - size + 1))
+
+
+def _split(text: str) -> tuple[list[str], str]:
+    """여러 줄이면 줄 단위로, 한 줄이면 단어 단위로 나눔 (OCR 필드를 공백으로 이어 붙인 텍스트는 한 줄)"""
+    lines = [line for line in text.splitlines() if line.strip()]
+    if len(lines) > 1:
+        return lines, "\n"
+    return text.split(), " "
+
+
+class OcrMerger:
+    """
+    스크롤해서 찍은 연속 스크린샷의 OCR 텍스트를 겹치는 부분 없이 합침
+
+    - 앞 이미지의 끝부분과 다음 이미지의 앞부분에서 (정규화 후) 가장 긴 공통 구간을 찾아 그 구간까지를 다음 이미지에서 제거
+    - 잘린 말풍선이나 상태 표시줄처럼 경계에 끼는 단위는 slack 개까지 건너뛰고 찾음
+    - 앞 이미지 하나와 통째로 같거나, 앞 이미지의 연속된 줄(단어) min_duplicate_lines(words) 개 이상과 같은 이미지는
+      같은 스크린샷을 다시 올린 것으로 보고 제외 (짧게 반복된 대화는 새 이미지일 수 있으므로 제외하지 않음)
+    """
+
+    def __init__(
+        self,
+        min_overlap: int = 4,
+        slack: int = 12,
+        min_line_overlap: int = 2,
+        line_slack: int = 4,
+        min_duplicate_words: int = 12,
+        min_duplicate_lines: int = 4,
+    ) -> None:
+        self.min_overlap = min_overlap
+        self.slack = slack
+        self.min_line_overlap = min_line_overlap
+        self.line_slack = line_slack
+        self.min_duplicate_words = min_duplicate_words
+        self.min_duplicate_lines = min_duplicate_lines
+        self._requests = 0
+        self._images = 0
+        self._duplicate_images = 0
+        self._overlaps = 0
+        self._chars_in = 0
+        self._chars_saved = 0
+
+    def merge(self, texts: list[str]) -> MergeResult:
+        """이미지 순서대로 받은 OCR 텍스트를 합침"""
+        texts = [text.strip() for text in texts if text.strip()]
+        chars_in = sum(len(text) for text in texts)
+        merged: list[str] = []
+        seen: list[list[str]] = []  # 합친 이미지들의 정규화된 단위 목록
+        previous: list[str] = []
+        duplicates = 0
+        overlaps = 0
+
+        for text in texts:
+            units, separator = _split(text)
+            normalized = [_normalize(unit) for unit in units]
+            line_mode = separator == "\n"
+            if self._is_duplicate(normalized, seen, line_mode):
+                duplicates += 1
+                continue
+
+            cut = self._overlap_end(previous, units, line_mode) if previous else 0
+            if cut:
+                overlaps += 1
+            remaining = units[cut:]
+            if remaining:
+                merged.append(separator.join(remaining))
+            seen.append(normalized)
+            previous = units
+
+        text = "\n".join(merged)
+        result = MergeResult(
+            text=text,
+            chars_in=chars_in,
+            chars_saved=max(0, chars_in + max(0, len(texts) - 1) - len(text)),
+            duplicate_images=duplicates,
+            overlaps=overlaps,
+        )
+        self._record(len(texts), result)
+        return result
+
+    def _is_duplicate(self, normalized: list[str], seen: list[list[str]], line_mode: bool) -> bool:
+        """앞 이미지와 통째로 같거나, 앞 이미지의 충분히 긴 연속 구간과 같은지"""
+        min_run = self.min_duplicate_lines if line_mode else self.min_duplicate_words
+        return any(
+            normalized == units or (len(normalized) >= min_run and _contains_run(units, normalized)) for units in seen
+        )
+
+    def _overlap_end(self, previous: list[str], current: list[str], line_mode: bool) -> int:
+        """current 에서 previous 와 겹치는 구간이 끝나는 위치 (겹치지 않으면 0)"""
+        min_overlap = self.min_line_overlap if line_mode else self.min_overlap
+        slack = self.line_slack if line_mode else self.slack
+        a = [_normalize(unit) for unit in previous]
+        b = [_normalize(unit) for unit in current]
+
+        # 앞 이미지의 끝 구간과 다음 이미지의 앞 구간만 비교 (겹침은 경계에서만 생김)
+        a_start = max(0, len(a) - len(b) - slack)
+        matcher = SequenceMatcher(None, a, b, autojunk=False)
+        match = matcher.find_longest_match(a_start, len(a), 0, len(b))
+        if match.size < min_overlap:
+            return 0
+        # 겹친 구간이 앞 이미지의 끝 근처에서 끝나고, 다음 이미지의 앞 근처에서 시작해야 스크롤로 겹친 것
+        if len(a) - (match.a + match.size) > slack or match.b > slack:
+            return 0
+        return match.b + match.size
+
+    def stats(self) -> OcrMergeStats:
+        return OcrMergeStats(
+            requests=self._requests,
+            images=self._images,
+            duplicate_images=self._duplicate_images,
+            overlaps=self._overlaps,
+            chars_in=self._chars_in,
+            chars_saved=self._chars_saved,
+        )
+
+    def _record(self, images: int, result: MergeResult) -> None:
+        self._requests += 1
+        self._images += images
+        self._duplicate_images += result.duplicate_images
+        self._overlaps += result.overlaps
+        self._chars_in += result.chars_in
+        self._chars_saved += result.chars_saved
+        if result.chars_saved:
+            logger.info(
+                f"[OcrMerger] 이미지 {images}개, 중복 이미지 {result.duplicate_images}개, "
+                f"겹침 {result.overlaps}곳, {result.chars_saved}자 절약"
+            )
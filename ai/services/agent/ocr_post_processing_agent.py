@@ -6,8 +6,10 @@ from loguru import logger
 class OcrPostProcessingAgent:
     def run(self, ocr_text: str) -> str:
         cleaned_text = ocr_text
-        cleaned_text = re.sub(r"[^가-힣a-zA-Z0-9\s.,?!]", "", cleaned_text)
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text).strip()
+        # "A:/B:" 화자 표시와 줄바꿈(말풍선 구분)은 남김
+        cleaned_text = re.sub(r"[^가-힣a-zA-Z0-9\s.,?!:]", "", cleaned_text)
+        cleaned_text = re.sub(r"[ \t]+", " ", cleaned_text)
+        cleaned_text = "\n".join(line.strip() for line in cleaned_text.splitlines() if line.strip())
         logger.info(f"Text after cleaning:\n{cleaned_text}")
 
         return cleaned_text
@@ -1,63 +1,122 @@
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
 from ai.services.agent.feedback_agent import FeedbackAgent
-from ai.services.agent.ocr_agent import OcrAgent
 from ai.services.agent.reply_suggestion_agent import ReplySuggestionAgent
-from ai.services.agent.style_analysis_agent import StyleAnalysisAgent
 from ai.services.agent.summarizer_agent import SummarizerAgent
 from ai.services.agent.title_suggestion_agent import TitleSuggestionAgent
+from ai.utils.dag_executor import DagExecutor, OnComplete
 
 
-class OrchestratorAgent:
-    def __init__(self) -> None:
-        self.ocr_agent = OcrAgent()
-        self.summarizer_agent = SummarizerAgent()
-        self.title_agent = TitleSuggestionAgent()
-        self.reply_agent_old = ReplySuggestionAgent(variant="old")
-        self.reply_agent_new = ReplySuggestionAgent(variant="new")
-        self.style_agent = StyleAnalysisAgent()
-        self.feedback_agent = FeedbackAgent()
-
-    async def run_reply_mode(self, input_text: str) -> tuple[list[str], list[str]]:
-        # 상황 요약 생성
-        summary = await self.summarizer_agent.run(input_text)
-        feedback_summary = await self.feedback_agent.improve_summary(summary, input_text, self.summarizer_agent)
-
-        if isinstance(feedback_summary, list):
-            raise ValueError("feedback_summary Type Error")
-        # 제목 생성
-        titles = await self.title_agent.run(feedback_summary)
-
-        # 답장 제안 생성 (기본)
-        replies = await self.reply_agent_old.run(summary)
-        feedback_replies = [
-            await self.feedback_agent.improve_reply(reply, summary, self.reply_agent_old) for reply in replies
-        ]
-
-        if isinstance(feedback_replies, str):
-            raise ValueError("feedback_replies Type Error")
-
-        return titles, replies
+@dataclass(frozen=True)
+class SuggestionEvent:
+    """제목 또는 답장 하나가 완성되었음을 알리는 이벤트 (kind: "title" | "reply")"""
 
-    async def run_manual_mode(
-        self, situation: str, accent: str, purpose: str, details: str
+    kind: str
+    index: int
+    content: str
+
+
+OnSuggestionEvent = Callable[[SuggestionEvent], Awaitable[None]]
+
+
+def _suggestion_events(on_event: OnSuggestionEvent | None, reply_node: str, per_item: bool) -> OnComplete | None:
+    """노드 완료 콜백을 제목/답장 이벤트로 변환 (per_item 이면 add_map 노드의 항목별 완료를 사용)"""
+    if on_event is None:
+        return None
+
+    async def on_complete(name: str, result: Any) -> None:
+        if name == "titles":
+            for index, title in enumerate(result):
+                await on_event(SuggestionEvent("title", index, title))
+        elif name == reply_node and not per_item:
+            for index, reply in enumerate(result):
+                await on_event(SuggestionEvent("reply", index, reply))
+        elif per_item and name.startswith(f"{reply_node}["):
+            await on_event(SuggestionEvent("reply", int(name[len(reply_node) + 1 : -1]), result))
+
+    return on_complete
+
+
+class OrchestratorAgent:
+    def __init__(
+        self,
+        summarizer_agent: SummarizerAgent | None = None,
+        title_agent: TitleSuggestionAgent | None = None,
+        reply_agent_old: ReplySuggestionAgent | None = None,
+        reply_agent_new: ReplySuggestionAgent | None = None,
+        feedback_agent: FeedbackAgent | None = None,
+    ) -> None:
+        """하위 에이전트를 주입받아 사용 (주입하지 않으면 직접 생성)"""
+        self.summarizer_agent = summarizer_agent or SummarizerAgent()
+        self.title_agent = title_agent or TitleSuggestionAgent()
+        self.reply_agent_old = reply_agent_old or ReplySuggestionAgent(variant="old")
+        self.reply_agent_new = reply_agent_new or ReplySuggestionAgent(variant="new")
+        self.feedback_agent = feedback_agent or FeedbackAgent()
+
+    def build_reply_mode(self, input_text: str) -> DagExecutor:
+        """
+        상황 요약 -> (요약 보완 -> 제목) ∥ 답장 그래프
+
+        제목은 보완된 요약으로, 답장은 원래 요약으로 생성하므로 두 갈래는 동시에 실행
+        (기존 동작과 동일하게 답장은 보완 전 결과를 반환하므로 답장별 보완은 호출하지 않음)
+        """
+        dag = DagExecutor("reply_mode")
+
+        async def improve_summary(summary: str) -> str:
+            feedback_summary = await self.feedback_agent.improve_summary(summary, input_text, self.summarizer_agent)
+            if isinstance(feedback_summary, list):
+                raise ValueError("feedback_summary Type Error")
+            return feedback_summary
+
+        async def generate_replies(summary: str) -> list[str]:
+            return await self.reply_agent_old.run(summary)
+
+        async def summarize() -> str:
+            return await self.summarizer_agent.run(input_text)
+
+        dag.add("summary", summarize)
+        dag.add("feedback_summary", improve_summary, "summary")
+        dag.add("titles", self.title_agent.run, "feedback_summary")
+        dag.add("replies", generate_replies, "summary")
+        return dag
+
+    async def run_reply_mode(
+        self, input_text: str, on_event: OnSuggestionEvent | None = None
     ) -> tuple[list[str], list[str]]:
+        run = await self.build_reply_mode(input_text).run(_suggestion_events(on_event, "replies", per_item=False))
+        return run.results["titles"], run.results["replies"]
+
+    def build_manual_mode(self, situation: str, accent: str, purpose: str, details: str) -> DagExecutor:
+        """제목 ∥ (답장 -> 답장별 보완) 그래프"""
         # 입력 정보에 기반하여 전체 프롬프트 생성 (수동 입력으로 받을 경우)
         detailed_input = f"상황: {situation}\n말투: {accent}\n용도: {purpose}\n추가 설명: {details}"
 
-        # 제목 제안 생성
-        titles = await self.title_agent.run(situation)
+        async def generate_titles() -> list[str]:
+            return await self.title_agent.run(situation)
 
-        # 답변 제안 생성 (말투, 용도, 추가 설명 정보 활용)
-        replies = await self.reply_agent_new.run(detailed_input)
-        feedback_replies = [
-            await self.feedback_agent.improve_reply(reply, detailed_input, self.reply_agent_new) for reply in replies
-        ]
+        async def generate_replies() -> list[str]:
+            return await self.reply_agent_new.run(detailed_input)
 
-        return titles, feedback_replies
+        async def improve_reply(reply: str) -> str:
+            return await self.feedback_agent.improve_reply(reply, detailed_input, self.reply_agent_new)
 
-    async def run_manual_mode_extended(
-        self, suggestion: str, length: str, add_description: str
+        dag = DagExecutor("manual_mode")
+        dag.add("titles", generate_titles)
+        dag.add("replies", generate_replies)
+        dag.add_map("feedback_replies", improve_reply, "replies")
+        return dag
+
+    async def run_manual_mode(
+        self, situation: str, accent: str, purpose: str, details: str, on_event: OnSuggestionEvent | None = None
     ) -> tuple[list[str], list[str]]:
+        dag = self.build_manual_mode(situation, accent, purpose, details)
+        run = await dag.run(_suggestion_events(on_event, "feedback_replies", per_item=True))
+        return run.results["titles"], run.results["feedback_replies"]
 
+    def build_manual_mode_extended(self, suggestion: str, length: str, add_description: str) -> DagExecutor:
+        """제목 ∥ (수정 답장 -> 답장별 보완) 그래프"""
         suggestion_input = f"수정하고 싶은 답장: {suggestion}\n"
 
         if length:
@@ -68,12 +127,24 @@ class OrchestratorAgent:
         suggestion_input += "위 내용을 바탕으로 자연스럽게 답장을 수정해서 작성해줘."
 
         # 제목 제안 생성(suggestion_input에서 suggestion으로 수정)
-        titles = await self.title_agent.run(suggestion)
+        async def generate_titles() -> list[str]:
+            return await self.title_agent.run(suggestion)
+
+        async def generate_replies() -> list[str]:
+            return await self.reply_agent_new.run(suggestion_input)
+
+        async def improve_reply(reply: str) -> str:
+            return await self.feedback_agent.improve_reply(reply, suggestion_input, self.reply_agent_new)
 
-        # 답변 제안 생성
-        replies = await self.reply_agent_new.run(suggestion_input)
-        improve_replies = [
-            await self.feedback_agent.improve_reply(reply, suggestion_input, self.reply_agent_new) for reply in replies
-        ]
+        dag = DagExecutor("manual_mode_extended")
+        dag.add("titles", generate_titles)
+        dag.add("replies", generate_replies)
+        dag.add_map("feedback_replies", improve_reply, "replies")
+        return dag
 
-        return titles, improve_replies
+    async def run_manual_mode_extended(
+        self, suggestion: str, length: str, add_description: str, on_event: OnSuggestionEvent | None = None
+    ) -> tuple[list[str], list[str]]:
+        dag = self.build_manual_mode_extended(suggestion, length, add_description)
+        run = await dag.run(_suggestion_events(on_event, "feedback_replies", per_item=True))
+        return run.results["titles"], run.results["feedback_replies"]
@@ -1,4 +1,4 @@
-from ai.utils.services import reply_service
+from ai.utils.services import services
 
 
 class ReplySuggestionAgent:
@@ -11,10 +11,15 @@ class ReplySuggestionAgent:
         suggestions = []
         while retry <= self.max_retries:
             if self.variant == "old":
-                suggestions = await reply_service.generate_basic_reply(input_text)
+                suggestions = await services.reply.generate_basic_reply(input_text)
             else:
-                suggestions = await reply_service.generate_detailed_reply(input_text)
-            if suggestions and len(suggestions[0].strip()) < 10 and retry < self.max_retries:
+                suggestions = await services.reply.generate_detailed_reply(input_text)
+            if (
+                suggestions
+                and len(suggestions[0].strip()) < 10
+                and retry < self.max_retries
+                and await services.reply.retry_policy.retry(retry, services.reply.breaker)
+            ):
                 input_text += "\n좀 더 구체적으로, 길이를 늘려서 답변해줘."
                 retry += 1
                 continue
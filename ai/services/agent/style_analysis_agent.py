@@ -1,4 +1,4 @@
-from ai.utils.services import situation_service
+from ai.utils.services import services
 
 
 class StyleAnalysisAgent:
@@ -23,7 +23,7 @@ class StyleAnalysisAgent:
         return situation, accent, purpose
 
     async def run(self, input_text: str) -> tuple[str, str, str, str]:
-        style_result = await situation_service.make_api_request(
+        style_result = await services.situation.make_api_request(
             "config_style_analysis.yaml", input_text, random_seed=True
         )
         situation, accent, purpose = self.parse_style_analysis(style_result)
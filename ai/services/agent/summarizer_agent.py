@@ -1,4 +1,4 @@
-from ai.utils.services import situation_service
+from ai.utils.services import services
 
 
 class SummarizerAgent:
@@ -9,8 +9,13 @@ class SummarizerAgent:
         retry = 0
         summary = ""
         while retry <= self.max_retries:
-            summary = await situation_service.situation_summary(input_text)
-            if len(summary.strip()) < 10 and retry < self.max_retries:
+            summary = await services.situation.situation_summary(input_text)
+            # 회로가 열려 있거나, 마감 시간이 임박했거나, 재시도 예산이 없으면 지금까지의 결과를 반환
+            if (
+                len(summary.strip()) < 10
+                and retry < self.max_retries
+                and await services.situation.retry_policy.retry(retry, services.situation.breaker)
+            ):
                 input_text += "\n좀 더 자세히 요약해줘."
                 retry += 1
                 continue
@@ -1,6 +1,6 @@
-from ai.utils.services import title_service
+from ai.utils.services import services
 
 
 class TitleSuggestionAgent:
     async def run(self, input_text: str) -> list[str]:
-        return await title_service.generate_title_suggestions(input_text)
+        return await services.title.generate_title_suggestions(input_text)
@@ -2,15 +2,21 @@ from pathlib import Path
 from typing import Any, Tuple
 
 import httpx
-import json
 import os
 import yaml
 
 from loguru import logger
 
 from app.core.settings import settings
+from ai.utils.circuit_breaker import CircuitOpenError, circuit_breakers
+from ai.utils.clova_http import clova_http
+from ai.utils.clova_stream_parser import ClovaStreamError, parse_clova_stream
+from ai.utils.concurrency_limiter import PRIORITY_HIGH, LimiterTimeoutError, upstream_limiters
+from ai.utils.deadline import DeadlineExceededError, within_deadline
 from ai.utils.deduplicate_sentence import deduplicate_sentences
 from ai.utils.get_headers_payloads import get_headers_payloads
+from ai.utils.llm_cache import llm_cache, make_llm_cache_key
+from ai.utils.retry_policy import retry_policies
 
 
 class Analyze:
@@ -19,6 +25,9 @@ class Analyze:
         self.BASE_URL: str = "https://clovastudio.stream.ntruss.com/testapp/v1/chat-completions/HCX-DASH-001"
         self.BEARER_TOKEN: str = os.getenv("CLOVA_AI_BEARER_TOKEN") or settings.CLOVA_AI_BEARER_TOKEN
         self.BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
+        self.limiter = upstream_limiters.studio(self.BASE_URL)
+        self.breaker = circuit_breakers.studio(self.BASE_URL)
+        self.retry_policy = retry_policies.studio(self.BASE_URL)
 
     def _load_config(self, config_name: str) -> dict[str, Any]:
         """설정 파일 로드"""
@@ -28,41 +37,55 @@ class Analyze:
             config: dict[str, Any] = yaml.safe_load(file)
             return config
 
-    def _process_stream_response(self, response_text: str) -> str:
-        """스트림 응답 처리 -> 텍스트 추출"""
-        result_text: str = ""
-        previous_token: str = ""
-
-        for line in response_text.splitlines():
-            if line and line.startswith("data:"):
-                data_str: str = line[len("data:") :].strip()
-                try:
-                    data_json: dict[str, Any] = json.loads(data_str)
-                    token: str = data_json.get("message", {}).get("content", "")
-
-                    if token != previous_token:
-                        result_text += token
-                        previous_token = token
-                except Exception as e:
-                    logger.error(f"Error processing stream response: {e}")
-                    continue
-
-        return result_text.strip()
-
-    async def make_api_request(self, config_name: str, input_text: str, random_seed: bool = False) -> str:
-        """API 요청 및 응답 처리"""
+    async def _process_stream_response(self, response: httpx.Response) -> str:
+        """스트림 응답을 도착하는 대로 처리 -> 최종 result 이벤트의 텍스트 추출"""
+        result = await parse_clova_stream(response.aiter_lines())
+        logger.info(
+            f"Clova usage - input: {result.input_length}, output: {result.output_length}, "
+            f"stop: {result.stop_reason}"
+        )
+        return result.text
+
+    async def make_api_request(
+        self, config_name: str, input_text: str, random_seed: bool = False, use_cache: bool = True
+    ) -> str:
+        """API 요청 및 응답 처리 (고정 시드 요청은 캐시 사용, use_cache=False 로 우회)"""
         config_path: Path = self.BASE_DIR / "config" / config_name
         headers, payload = get_headers_payloads(str(config_path), input_text, random_seed=random_seed)
 
+        cache_key: str | None = None
+        if use_cache and settings.llm_cache_enabled and not random_seed:
+            cache_key = make_llm_cache_key(config_name, self.BASE_URL, input_text, payload["seed"])
+            cached: str | None = await llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"LLM 캐시 적중: {config_name}")
+                return cached
+
+        async def request() -> str:
+            # 요약/분석은 이후 단계가 모두 기다리므로 높은 우선순위로 요청
+            async with within_deadline(), self.breaker.guard(), self.limiter.slot(priority=PRIORITY_HIGH):
+                async with clova_http.client.stream("POST", self.BASE_URL, headers=headers, json=payload) as response:
+                    response.raise_for_status()
+                    return await self._process_stream_response(response)
+
         try:
-            async with httpx.AsyncClient() as client:
-                response: httpx.Response = await client.post(self.BASE_URL, headers=headers, json=payload)
-                response.raise_for_status()
-                return self._process_stream_response(response.text)
+            # 재시도 가능한 오류(연결/5xx/429/스트림 오류)만 재시도 정책에 따라 다시 요청
+            result = await self.retry_policy.call(request, settings.clova_studio_max_retries, self.breaker)
+            if cache_key and result:
+                await llm_cache.set(cache_key, result)
+            return result
         except httpx.RequestError as e:
             logger.error(f"API request failed: {e}")
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP Error: {e}")
+        except ClovaStreamError as e:
+            logger.error(f"Stream Error: {e}")
+        except LimiterTimeoutError as e:
+            logger.error(f"Limiter Timeout: {e}")
+        except CircuitOpenError as e:
+            logger.warning(f"Circuit Open: {e}")
+        except DeadlineExceededError as e:
+            logger.warning(f"Deadline Exceeded: {e}")
 
         return ""
 
@@ -85,9 +108,9 @@ class Analyze:
 
         return "기본 말투", "일반적인 용도"
 
-    async def situation_summary(self, conversation: str) -> str:
+    async def situation_summary(self, conversation: str, use_cache: bool = True) -> str:
         """상황 요약"""
-        result: str = await self.make_api_request("config_situation_summary.yaml", conversation)
+        result: str = await self.make_api_request("config_situation_summary.yaml", conversation, use_cache=use_cache)
         if result:
             result = deduplicate_sentences(result)
             logger.info(f"상황 요약: {result}")
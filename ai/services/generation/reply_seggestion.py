@@ -1,5 +1,4 @@
 import os
-import json
 import yaml
 import httpx
 import asyncio
@@ -11,7 +10,14 @@ from loguru import logger
 from httpx import ConnectTimeout, ReadTimeout
 
 from app.core.settings import settings
-from ai.utils.get_headers_payloads import get_headers_payloads
+from ai.utils.circuit_breaker import CircuitCall, CircuitOpenError, circuit_breakers
+from ai.utils.clova_http import clova_http
+from ai.utils.clova_stream_parser import ClovaStreamError, ClovaStreamResult, parse_clova_stream
+from ai.utils.candidate_parser import parse_candidates
+from ai.utils.concurrency_limiter import OVERLOAD_STATUS_CODES, upstream_limiters
+from ai.utils.deadline import clamp_timeout, within_deadline
+from ai.utils.get_headers_payloads import get_headers_payloads, prompt_configs
+from ai.utils.retry_policy import retry_policies
 from ai.utils.deduplicate_sentence import deduplicate_sentences
 
 
@@ -21,6 +27,9 @@ class ReplySuggestion:
         self.BASE_URL: str = "https://clovastudio.stream.ntruss.com/testapp/v1/chat-completions/HCX-003"
         self.BEARER_TOKEN: Optional[str] = os.getenv("CLOVA_AI_BEARER_TOKEN") or settings.CLOVA_AI_BEARER_TOKEN
         self.BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
+        self.limiter = upstream_limiters.studio(self.BASE_URL)
+        self.breaker = circuit_breakers.studio(self.BASE_URL)
+        self.retry_policy = retry_policies.studio(self.BASE_URL)
 
         # 대체 답변 목록
         self.fallback_replies: list[str] = [
@@ -45,19 +54,30 @@ class ReplySuggestion:
             str(self.BASE_DIR / "config" / config_name), input_text, random_seed=True
         )
 
-        try:
-            response: httpx.Response = await client.post(self.BASE_URL, headers=headers, json=payload, timeout=15.0)
-
-            if response.status_code == 200:
-                return await self._process_stream_response(response)
-            else:
-                logger.error(f"API 응답 오류: {response.status_code} - {response.text}")
-                return self._get_fallback_reply(input_text)
+        async def request() -> str:
+            async with within_deadline(), self.breaker.guard() as call, self.limiter.slot() as slot:
+                async with client.stream(
+                    "POST", self.BASE_URL, headers=headers, json=payload, timeout=clamp_timeout(15.0)
+                ) as response:
+                    if response.status_code != 200:
+                        if response.status_code in OVERLOAD_STATUS_CODES:
+                            slot.mark_overloaded()
+                        await response.aread()
+                        logger.error(f"API 응답 오류: {response.status_code} - {response.text}")
+                        # 5xx/429 는 회로 차단기와 재시도 정책이 판단하도록 예외로 전파
+                        response.raise_for_status()
+                    return await self._process_stream_response(response, call)
 
+        try:
+            return await self.retry_policy.call(request, settings.clova_studio_max_retries, self.breaker)
+        except CircuitOpenError as e:
+            logger.warning(f"회로 차단 중: {e}")
         except (ConnectTimeout, ReadTimeout) as e:
             logger.error(f"API 연결 시간 초과: {e}")
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP 오류: {e}")
+        except ClovaStreamError as e:
+            logger.error(f"스트림 오류 이벤트 수신: {e}")
         except Exception as e:
             logger.error(f"API 요청 중 오류 발생: {e}")
 
@@ -69,12 +89,55 @@ class ReplySuggestion:
         logger.info(f"대체 답변 사용: {fallback_reply}")
         return fallback_reply
 
+    async def _fetch_candidates(self, input_text: str, config_name: str, num_suggestions: int) -> list[str] | None:
+        """한 번의 호출로 여러 답변 후보를 생성 (요청 또는 파싱 실패 시 None, 회로가 열려 있으면 CircuitOpenError)"""
+        headers, payload = get_headers_payloads(
+            str(self.BASE_DIR / "config" / config_name), input_text, random_seed=True, num_candidates=num_suggestions
+        )
+
+        async def request() -> ClovaStreamResult:
+            async with within_deadline(), self.breaker.guard() as call, self.limiter.slot():
+                async with clova_http.client.stream(
+                    "POST", self.BASE_URL, headers=headers, json=payload, timeout=clamp_timeout(20.0)
+                ) as response:
+                    response.raise_for_status()
+                    result = await parse_clova_stream(response.aiter_lines())
+                if not result.text:
+                    call.mark_failure()
+                return result
+
+        try:
+            result = await self.retry_policy.call(request, settings.clova_studio_max_retries, self.breaker)
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            logger.error(f"다중 후보 답변 요청 중 오류 발생: {e}")
+            return None
+
+        candidates = parse_candidates(result.text, num_suggestions)
+        if candidates is None:
+            logger.warning(f"다중 후보 답변 파싱 실패, 개별 호출로 대체합니다: {result.text}")
+            return None
+        return [deduplicate_sentences(candidate) for candidate in candidates]
+
     async def generate_suggestions(self, input_text: str, config_name: str, num_suggestions: int = 3) -> list[str]:
-        """비동기로 여러 개의 답변을 생성"""
+        """비동기로 여러 개의 답변을 생성 (설정에 MULTI_CANDIDATE 가 켜져 있으면 한 번의 호출로 생성)"""
+        # 회로 상태는 guard() 가 판단 (복구 대기 시간이 지나면 HALF_OPEN 으로 바꿔 시험 호출을 보냄)
+        config_path: str = str(self.BASE_DIR / "config" / config_name)
+        if prompt_configs.get(config_path).multi_candidate is not None:
+            try:
+                candidates = await self._fetch_candidates(input_text, config_name, num_suggestions)
+            except CircuitOpenError as e:
+                logger.warning(f"{e} 대체 답변을 반환합니다.")
+                return random.sample(self.fallback_replies, min(num_suggestions, len(self.fallback_replies)))
+            if candidates is not None:
+                for candidate in candidates:
+                    logger.info(f"생성된 답변: {candidate}")
+                return candidates
+
         try:
-            async with httpx.AsyncClient(timeout=20.0) as client:
-                tasks = [self._fetch_reply(client, input_text, config_name) for _ in range(num_suggestions)]
-                suggestions: list[str | BaseException] = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [self._fetch_reply(clova_http.client, input_text, config_name) for _ in range(num_suggestions)]
+            suggestions: list[str | BaseException] = await asyncio.gather(*tasks, return_exceptions=True)
 
             processed_suggestions: list[str] = []
             for suggestion in suggestions:
@@ -100,35 +163,28 @@ class ReplySuggestion:
             logger.error(f"답변 생성 중 예상치 못한 오류 발생: {e}")
             return [self._get_fallback_reply(input_text) for _ in range(num_suggestions)]
 
-    async def _process_stream_response(self, response: httpx.Response) -> str:
-        """비동기적으로 스트림 응답을 처리하여 텍스트 추출"""
-        reply_text: str = ""
-        previous_token: str = ""
+    async def _process_stream_response(self, response: httpx.Response, call: CircuitCall) -> str:
+        """
+        비동기적으로 스트림 응답을 처리하여 텍스트 추출
 
+        error 이벤트와 스트림 도중의 전송 오류는 회로 차단기가 볼 수 있도록 전파하고, 빈 응답은 실패로 기록
+        """
         try:
-            async for line in response.aiter_lines():
-                if line and line.startswith("data:"):
-                    data_str: str = line[len("data:") :].strip()
-                    try:
-                        data_json: dict[str, Any] = json.loads(data_str)
-                        token: str = data_json.get("message", {}).get("content", "")
-
-                        if token != previous_token:
-                            reply_text += token
-                            previous_token = token
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON 디코딩 오류 발생: {e}, 원본 데이터: {data_str}")
-                        continue
-                    except Exception as e:
-                        logger.error(f"스트림 응답 처리 중 오류 발생: {e}")
-                        continue
-
-            if not reply_text.strip():
+            result = await parse_clova_stream(response.aiter_lines())
+            logger.info(
+                f"Clova usage - input: {result.input_length}, output: {result.output_length}, "
+                f"stop: {result.stop_reason}"
+            )
+
+            if not result.text:
                 logger.warning("서버 응답이 비어 있음.")
+                call.mark_failure()
                 return self._get_fallback_reply("빈 응답")
 
-            return deduplicate_sentences(reply_text.strip())
+            return deduplicate_sentences(result.text)
 
+        except (ClovaStreamError, httpx.TransportError):
+            raise
         except Exception as e:
             logger.error(f"스트림 응답 처리 중 예상치 못한 오류 발생: {e}")
             return self._get_fallback_reply("응답 처리 오류")
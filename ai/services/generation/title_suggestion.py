@@ -1,12 +1,19 @@
 import asyncio
 import os
 import httpx
-import json
 from pathlib import Path
 from httpx import AsyncClient, ConnectTimeout, ReadTimeout
 from loguru import logger
 
-from ai.utils.get_headers_payloads import get_headers_payloads
+from ai.utils.circuit_breaker import CircuitOpenError, circuit_breakers
+from ai.utils.clova_http import clova_http
+from ai.utils.clova_stream_parser import ClovaStreamError, ClovaStreamResult, parse_clova_stream
+from ai.utils.candidate_parser import parse_candidates
+from ai.utils.concurrency_limiter import upstream_limiters
+from ai.utils.deadline import clamp_timeout, within_deadline
+from ai.utils.get_headers_payloads import get_headers_payloads, prompt_configs
+from ai.utils.llm_cache import llm_cache, llm_cache_flight, make_llm_cache_key
+from ai.utils.retry_policy import retry_policies
 from app.core.settings import settings
 
 from ai.utils.deduplicate_sentence import deduplicate_sentences
@@ -23,6 +30,9 @@ class TitleSuggestion:
             self.REQUEST_ID = settings.CLOVA_REQ_ID_TITLE
 
         self.BASE_DIR = Path(__file__).resolve().parent.parent.parent
+        self.limiter = upstream_limiters.studio(self.BASE_URL)
+        self.breaker = circuit_breakers.studio(self.BASE_URL)
+        self.retry_policy = retry_policies.studio(self.BASE_URL)
         # 대체 제목 목록 추가
         self.fallback_titles = [
             "이렇게 써보는건 어떨까요!",
@@ -30,42 +40,67 @@ class TitleSuggestion:
             "Glee의 글 제안",
         ]
 
-    async def fetch_title(self, client: AsyncClient, input_text: str, config_path: str) -> str:
-        """비동기 요청을 보내고 제목을 생성"""
+    async def fetch_title(self, client: AsyncClient, input_text: str, config_path: str, use_cache: bool = True) -> str:
+        """
+        비동기 요청을 보내고 제목을 생성 (고정 시드이므로 캐시 사용, use_cache=False 로 우회)
+
+        캐시가 비어 있을 때 같은 키로 동시에 들어온 요청은 한 번만 호출하고 결과를 함께 받음
+        """
         headers, payload = get_headers_payloads(config_path, input_text)
 
-        try:
+        cache_key: str | None = None
+        if use_cache and settings.llm_cache_enabled:
+            cache_key = make_llm_cache_key(Path(config_path).name, self.BASE_URL, input_text, payload["seed"])
+            cached = await llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("LLM 캐시 적중: 제목")
+                return cached
+
+        async def request() -> ClovaStreamResult:
             # 타임아웃 설정 추가 (10초)
-            response = await client.post(self.BASE_URL, headers=headers, json=payload, timeout=10.0)
-            response.raise_for_status()
-            title_text = ""
-
-            async for line in response.aiter_lines():
-                if line and line.startswith("data:"):
-                    data_str = line[len("data:") :].strip()
-                    try:
-                        data_json = json.loads(data_str)
-                        token = data_json.get("message", {}).get("content", "")
-                        title_text += token
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON 디코딩 오류 발생: {e}, 원본 데이터: {data_str}")
-                        continue  # JSON 파싱 오류 발생 시 무시하고 계속 진행
-
-            if not title_text:
-                logger.warning("서버 응답이 비어 있음.")
+            async with within_deadline(), self.breaker.guard() as call, self.limiter.slot():
+                async with client.stream(
+                    "POST", self.BASE_URL, headers=headers, json=payload, timeout=clamp_timeout(10.0)
+                ) as response:
+                    response.raise_for_status()
+                    result = await parse_clova_stream(response.aiter_lines())
+                # 빈 응답은 대체 제목으로 넘어가므로 회로 차단기에는 실패로 기록
+                if not result.text:
+                    call.mark_failure()
+                return result
+
+        async def fetch() -> str:
+            try:
+                result = await self.retry_policy.call(request, settings.clova_studio_max_retries, self.breaker)
+
+                if not result.text:
+                    logger.warning("서버 응답이 비어 있음.")
+                    return self._get_fallback_title(input_text)
+
+                title = deduplicate_sentences(result.text)
+                if cache_key:
+                    await llm_cache.set(cache_key, title)
+                return title
+
+            except CircuitOpenError as e:
+                logger.warning(f"회로 차단 중: {e}")
+                return self._get_fallback_title(input_text)
+            except (ConnectTimeout, ReadTimeout) as e:
+                logger.error(f"API 연결 시간 초과: {e}")
+                return self._get_fallback_title(input_text)
+            except httpx.HTTPStatusError as e:
+                logger.error(f"HTTP 오류: {e}")
+                return self._get_fallback_title(input_text)
+            except ClovaStreamError as e:
+                logger.error(f"스트림 오류 이벤트 수신: {e}")
+                return self._get_fallback_title(input_text)
+            except Exception as e:
+                logger.error(f"제목 생성 중 예상치 못한 오류 발생: {e}")
                 return self._get_fallback_title(input_text)
 
-            return deduplicate_sentences(title_text)
-
-        except (ConnectTimeout, ReadTimeout) as e:
-            logger.error(f"API 연결 시간 초과: {e}")
-            return self._get_fallback_title(input_text)
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP 오류: {e}")
-            return self._get_fallback_title(input_text)
-        except Exception as e:
-            logger.error(f"제목 생성 중 예상치 못한 오류 발생: {e}")
-            return self._get_fallback_title(input_text)
+        if cache_key is None:
+            return await fetch()
+        return await llm_cache_flight.do(cache_key, lambda emit: fetch())
 
     def _get_fallback_title(self, input_text: str) -> str:
         """API 연결 실패 시 대체 제목 반환"""
@@ -96,16 +131,67 @@ class TitleSuggestion:
 
         return title
 
-    async def generate_title_suggestions(self, input_text: str) -> list[str]:
-        """비동기로 여러 제목을 생성"""
+    async def fetch_title_candidates(
+        self, input_text: str, config_path: str, num_titles: int, use_cache: bool = True
+    ) -> list[str] | None:
+        """한 번의 호출로 여러 제목 후보를 생성 (요청 또는 파싱 실패 시 None, 회로가 열려 있으면 CircuitOpenError)"""
+        headers, payload = get_headers_payloads(config_path, input_text, num_candidates=num_titles)
+
+        cache_key: str | None = None
+        if use_cache and settings.llm_cache_enabled:
+            config_name = f"{Path(config_path).name}#{num_titles}"
+            cache_key = make_llm_cache_key(config_name, self.BASE_URL, input_text, payload["seed"])
+        text: str | None = await llm_cache.get(cache_key) if cache_key else None
+
+        if text is None:
+
+            async def request() -> str:
+                async with within_deadline(), self.breaker.guard() as call, self.limiter.slot():
+                    async with clova_http.client.stream(
+                        "POST", self.BASE_URL, headers=headers, json=payload, timeout=clamp_timeout(10.0)
+                    ) as response:
+                        response.raise_for_status()
+                        text = (await parse_clova_stream(response.aiter_lines())).text
+                    if not text:
+                        call.mark_failure()
+                    return text
+
+            try:
+                text = await self.retry_policy.call(request, settings.clova_studio_max_retries, self.breaker)
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                logger.error(f"다중 후보 제목 요청 중 오류 발생: {e}")
+                return None
+
+        candidates = parse_candidates(text, num_titles)
+        if candidates is None:
+            logger.warning(f"다중 후보 제목 파싱 실패, 개별 호출로 대체합니다: {text}")
+            return None
+        if cache_key:
+            await llm_cache.set(cache_key, text)
+        return [deduplicate_sentences(candidate) for candidate in candidates]
+
+    async def generate_title_suggestions(self, input_text: str, use_cache: bool = True) -> list[str]:
+        """비동기로 여러 제목을 생성 (설정에 MULTI_CANDIDATE 가 켜져 있으면 한 번의 호출로 생성)"""
         BASE_DIR = self.BASE_DIR
         config_path = str(BASE_DIR / "config" / "config_title_suggestion.yaml")
 
+        # 회로 상태는 guard() 가 판단 (복구 대기 시간이 지나면 HALF_OPEN 으로 바꿔 시험 호출을 보냄)
+        if prompt_configs.get(config_path).multi_candidate is not None:
+            try:
+                candidates = await self.fetch_title_candidates(input_text, config_path, 3, use_cache)
+            except CircuitOpenError as e:
+                logger.warning(f"{e} 대체 제목을 반환합니다.")
+                return list(self.fallback_titles)
+            if candidates is not None:
+                for candidate in candidates:
+                    logger.info(f"생성된 제목: {candidate}")
+                return candidates
+
         try:
-            # 타임아웃 설정 추가 (30초)
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                tasks = [self.fetch_title(client, input_text, config_path) for _ in range(3)]
-                titles = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [self.fetch_title(clova_http.client, input_text, config_path, use_cache) for _ in range(3)]
+            titles = await asyncio.gather(*tasks, return_exceptions=True)
 
             # 예외 처리: 예외가 발생한 경우 대체 제목으로 교체
             processed_titles = []
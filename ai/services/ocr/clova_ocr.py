@@ -8,11 +8,18 @@ from typing import Any
 import httpx
 from loguru import logger
 
+from ai.services.ocr.ocr_layout import transcript_from_clova
+from ai.utils.circuit_breaker import CircuitOpenError, circuit_breakers
+from ai.utils.concurrency_limiter import PRIORITY_HIGH, upstream_limiters
+from ai.utils.deadline import within_deadline
 from ai.utils.image_dto import ImageDto
+from ai.utils.retry_policy import retry_policies
 from app.core.settings import settings
 
 
 class ClovaOcr:
+    name = "clova"
+
     def __init__(self) -> None:
         """Clova OCR API를 사용하는 클래스"""
         self.URL: str = os.getenv("CLOVA_OCR_URL", settings.CLOVA_OCR_URL)
@@ -21,10 +28,33 @@ class ClovaOcr:
         if not self.URL or not self.SECRET_KEY:
             logger.error("OCR API URL 또는 SECRET_KEY가 설정되지 않았습니다.")
 
-        self.client: httpx.AsyncClient = httpx.AsyncClient()
+        self._client: httpx.AsyncClient | None = None
+        self.limiter = upstream_limiters.ocr()
+        self.breaker = circuit_breakers.ocr()
+        self.retry_policy = retry_policies.ocr()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """OCR 클라이언트 (최초 사용 시 생성해 이벤트 루프 밖에서 만들어지지 않도록 함)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient()
+        return self._client
 
     async def ocr_request(self, image_data: bytes, filename: str) -> str:
-        """비동기 OCR 요청을 보내고 텍스트를 추출하여 반환"""
+        """비동기 OCR 요청을 보내고 텍스트를 추출하여 반환 (실패 시 빈 문자열)"""
+        try:
+            return await self.request_text(image_data, filename)
+        except CircuitOpenError as e:
+            logger.warning(f"{e} for file {filename}")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP Error: {e.response.status_code} - {e.response.text} for file {filename}")
+        except Exception as e:
+            logger.error(f"Unexpected Error: {str(e)} for file {filename}")
+
+        return ""
+
+    async def request_text(self, image_data: bytes, filename: str) -> str:
+        """OCR 요청을 보내고 텍스트를 추출하여 반환 (실패 시 예외를 그대로 전파해 재시도 여부를 판단할 수 있게 함)"""
         file_ext: str = filename.split(".")[-1].lower()
 
         request_json: dict[str, Any] = {
@@ -41,7 +71,7 @@ class ClovaOcr:
             "X-ocr-SECRET": self.SECRET_KEY,
         }
 
-        try:
+        async with within_deadline(), self.breaker.guard(), self.limiter.slot(priority=PRIORITY_HIGH):
             response: httpx.Response = await self.client.post(
                 self.URL,
                 headers=headers,
@@ -49,23 +79,18 @@ class ClovaOcr:
                 files=files,  # ✅ 파일은 multipart/form-data로 보냄
             )
             response.raise_for_status()
-            result: dict[str, Any] = response.json()
-            return self.extract_text_from_result(result, filename)
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP Error: {e.response.status_code} - {e.response.text} for file {filename}")
-        except Exception as e:
-            logger.error(f"Unexpected Error: {str(e)} for file {filename}")
-
-        return ""
+        result: dict[str, Any] = response.json()
+        return self.extract_text_from_result(result, filename)
 
     async def close(self) -> None:
         """클라이언트 세션을 닫음"""
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
 
     @staticmethod
     def extract_text_from_result(result: dict[str, Any], filename: str) -> str:
-        """OCR 결과에서 텍스트를 추출하여 반환"""
+        """OCR 결과에서 텍스트를 추출하여 반환 (필드 좌표로 말풍선과 화자를 복원한 "A:/B:" 대화록)"""
         if "images" not in result or not result["images"]:
             logger.error(f"[{filename}] OCR 결과에 'images' 키가 없습니다: {result}")
             return ""
@@ -74,7 +99,17 @@ class ClovaOcr:
             logger.error(f"[{filename}] OCR 결과에 'fields' 키가 없습니다: {result}")
             return ""
 
-        extracted_text: str = " ".join(field["inferText"] for field in result["images"][0]["fields"])
+        transcript = (
+            transcript_from_clova(result["images"][0], settings.ocr_min_confidence)
+            if settings.ocr_layout_transcript
+            else None
+        )
+        # 필드 좌표가 없으면 기존처럼 필드 텍스트를 공백으로 이어 붙임
+        extracted_text: str = (
+            transcript
+            if transcript is not None
+            else " ".join(field["inferText"] for field in result["images"][0]["fields"])
+        )
         logger.info(f"[{filename}] 추출된 텍스트: {extracted_text.strip()}")
         return extracted_text.strip()
 
@@ -0,0 +1,60 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from ai.services.ocr.clova_ocr import ClovaOcr
+from ai.utils.circuit_breaker import CircuitBreaker
+from ai.utils.retry_policy import RetryPolicy
+from app.core.settings import settings
+
+
+class FixtureOcr:
+    """
+    미리 저장해 둔 Clova OCR 응답(JSON)으로 답하는 OCR (네트워크 없이 결정적인 결과가 필요한 테스트/부하 테스트용)
+
+    settings.ocr_fixture_dir 에서 "<파일 이름>.json", "<이미지 sha256>.json", settings.ocr_fixture_default(설정한 경우) 순으로 찾고
+    맞는 픽스처가 없으면 FileNotFoundError 발생 (빈 텍스트로 넘어가 잘못된 결과로 측정되지 않도록)
+    """
+
+    name = "fixture"
+    retry_policy: RetryPolicy | None = None
+    breaker: CircuitBreaker | None = None
+
+    def __init__(self, fixture_dir: str | None = None) -> None:
+        self.fixture_dir = Path(fixture_dir or settings.ocr_fixture_dir)
+        self._texts: dict[Path, str] = {}
+
+    def _candidates(self, image_data: bytes, filename: str) -> list[Path]:
+        """
+        찾아볼 픽스처 경로 (업로드 파일 이름은 사용자 입력이므로 디렉터리 부분을 버리고 이름만 사용)
+
+        fixture_dir 밖을 가리키는 경로는 제외
+        """
+        candidates = [
+            self.fixture_dir / f"{Path(filename).stem}.json",
+            self.fixture_dir / f"{hashlib.sha256(image_data).hexdigest()}.json",
+        ]
+        if settings.ocr_fixture_default:
+            candidates.append(self.fixture_dir / settings.ocr_fixture_default)
+        root = self.fixture_dir.resolve()
+        return [path for path in candidates if path.resolve().is_relative_to(root)]
+
+    def _load(self, path: Path) -> str:
+        if path not in self._texts:
+            result: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+            self._texts[path] = ClovaOcr.extract_text_from_result(result, path.name)
+        return self._texts[path]
+
+    async def request_text(self, image_data: bytes, filename: str) -> str:
+        candidates = self._candidates(image_data, filename)
+        for path in candidates:
+            if path.is_file():
+                return self._load(path)
+        logger.error(f"[{filename}] OCR 픽스처가 없습니다: {self.fixture_dir}")
+        raise FileNotFoundError(f"OCR 픽스처가 없습니다: {', '.join(path.name for path in candidates)}")
+
+    async def close(self) -> None:
+        return None
@@ -0,0 +1,45 @@
+from typing import Protocol
+
+from ai.utils.circuit_breaker import CircuitBreaker
+from ai.utils.retry_policy import RetryPolicy
+
+OCR_BACKENDS = ("clova", "tesseract", "fixture")
+
+
+class OcrBackend(Protocol):
+    """
+    이미지 한 장에서 텍스트를 추출하는 OCR 엔진
+
+    - request_text 는 실패 시 예외를 그대로 전파 (재시도 여부는 OcrAgent 가 retry_policy 로 판단)
+    - 네트워크를 쓰지 않는 엔진은 retry_policy / breaker 를 None 으로 두어 재시도하지 않음
+    """
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def retry_policy(self) -> RetryPolicy | None: ...
+
+    @property
+    def breaker(self) -> CircuitBreaker | None: ...
+
+    async def request_text(self, image_data: bytes, filename: str) -> str: ...
+
+    async def close(self) -> None: ...
+
+
+def create_ocr_backend(name: str) -> OcrBackend:
+    """설정값(clova / tesseract / fixture)으로 OCR 엔진 생성"""
+    if name == "clova":
+        from ai.services.ocr.clova_ocr import ClovaOcr
+
+        return ClovaOcr()
+    if name == "tesseract":
+        from ai.services.ocr.tesseract_ocr import TesseractOcr
+
+        return TesseractOcr()
+    if name == "fixture":
+        from ai.services.ocr.fixture_ocr import FixtureOcr
+
+        return FixtureOcr()
+    raise ValueError(f"지원하지 않는 OCR 엔진입니다: {name} (가능한 값: {', '.join(OCR_BACKENDS)})")
@@ -0,0 +1,158 @@
+import re
+from dataclasses import dataclass
+from statistics import median
+from typing import Any
+
+# 화자 표시 (왼쪽 말풍선은 상대방, 오른쪽 말풍선은 사용자)
+LEFT_SPEAKER = "A"
+RIGHT_SPEAKER = "B"
+
+# 이미지 위쪽에서 이 비율 안에 있는 줄은 상태 표시줄(시각, 배터리 등)로 보고 제외
+STATUS_BAR_RATIO = 0.06
+
+_TIMESTAMP = re.compile(r"(?:(?:오전|오후)\s*)?\d{1,2}:\d{2}")
+_DATE_LINE = re.compile(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일(?:\s*[월화수목금토일]요일)?$")
+_INPUT_BAR = re.compile(r"^(?:메시지\s*입력|메시지를\s*입력하세요)")
+_READ_COUNT = re.compile(r"^\d{1,2}$")
+
+
+@dataclass(frozen=True)
+class OcrField:
+    text: str
+    confidence: float
+    left: float
+    top: float
+    right: float
+    bottom: float
+
+    @property
+    def height(self) -> float:
+        return self.bottom - self.top
+
+    @property
+    def center_y(self) -> float:
+        return (self.top + self.bottom) / 2
+
+    @classmethod
+    def from_clova(cls, field: dict[str, Any]) -> "OcrField | None":
+        """Clova OCR 응답의 field (inferText, inferConfidence, boundingPoly) 를 변환 (좌표가 없으면 None)"""
+        vertices = field.get("boundingPoly", {}).get("vertices") or []
+        xs = [vertex.get("x", 0.0) for vertex in vertices]
+        ys = [vertex.get("y", 0.0) for vertex in vertices]
+        if not xs or not ys:
+            return None
+        return cls(
+            text=str(field.get("inferText", "")).strip(),
+            confidence=float(field.get("inferConfidence", 1.0)),
+            left=min(xs),
+            top=min(ys),
+            right=max(xs),
+            bottom=max(ys),
+        )
+
+
+@dataclass
+class _Line:
+    fields: list[OcrField]
+
+    @property
+    def left(self) -> float:
+        return min(field.left for field in self.fields)
+
+    @property
+    def right(self) -> float:
+        return max(field.right for field in self.fields)
+
+    @property
+    def top(self) -> float:
+        return min(field.top for field in self.fields)
+
+    @property
+    def bottom(self) -> float:
+        return max(field.bottom for field in self.fields)
+
+    @property
+    def height(self) -> float:
+        return self.bottom - self.top
+
+
+def _group_lines(fields: list[OcrField]) -> list[_Line]:
+    """세로 중심이 가까운 필드끼리 한 줄로 묶음"""
+    lines: list[_Line] = []
+    for field in sorted(fields, key=lambda field: field.center_y):
+        if lines:
+            line = lines[-1]
+            line_center = (line.top + line.bottom) / 2
+            if abs(field.center_y - line_center) <= min(field.height, line.height) / 2:
+                line.fields.append(field)
+                continue
+        lines.append(_Line([field]))
+    return lines
+
+
+def _drop_chrome(line: _Line, text_height: float) -> str:
+    """말풍선 옆 시각, 읽음 숫자 같은 UI 요소를 지운 줄 텍스트"""
+    fields = [
+        field
+        for field in line.fields
+        # 읽음 숫자는 본문 글자보다 작게 표시됨
+        if not (_READ_COUNT.match(field.text) and field.height < text_height * 0.8 and len(line.fields) > 1)
+    ]
+    text = " ".join(field.text for field in sorted(fields, key=lambda field: field.left) if field.text)
+    text = _TIMESTAMP.sub("", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def build_transcript(
+    fields: list[OcrField],
+    image_width: float | None = None,
+    image_height: float | None = None,
+    min_confidence: float = 0.5,
+) -> str:
+    """
+    OCR 필드 좌표로 줄과 말풍선을 복원해 "A: ..." / "B: ..." 형식의 대화록을 만듦
+
+    - 신뢰도가 min_confidence 미만인 필드, 상태 표시줄, 날짜 구분선, 입력창, 시각, 읽음 숫자는 제외
+    - 왼쪽 여백보다 오른쪽 여백이 좁은 줄은 오른쪽(사용자) 말풍선으로 봄
+    - 같은 쪽에 세로로 붙어 있는 줄은 한 말풍선으로 이어 붙임
+    """
+    fields = [field for field in fields if field.text and field.confidence >= min_confidence]
+    if not fields:
+        return ""
+
+    width = image_width or max(field.right for field in fields)
+    height = image_height or max(field.bottom for field in fields)
+    text_height = median(field.height for field in fields)
+
+    messages: list[tuple[str, str, float]] = []  # (화자, 텍스트, 마지막 줄 bottom)
+    for line in _group_lines(fields):
+        if line.bottom < height * STATUS_BAR_RATIO:
+            continue
+        text = _drop_chrome(line, text_height)
+        if not text or _DATE_LINE.match(text) or _INPUT_BAR.match(text):
+            continue
+
+        speaker = RIGHT_SPEAKER if width - line.right < line.left else LEFT_SPEAKER
+        if messages:
+            last_speaker, last_text, last_bottom = messages[-1]
+            if last_speaker == speaker and line.top - last_bottom < line.height * 0.5:
+                messages[-1] = (speaker, f"{last_text} {text}", line.bottom)
+                continue
+        messages.append((speaker, text, line.bottom))
+
+    return "\n".join(f"{speaker}: {text}" for speaker, text, _ in messages)
+
+
+def transcript_from_clova(image: dict[str, Any], min_confidence: float = 0.5) -> str | None:
+    """Clova OCR 응답의 images[i] 로 대화록 생성 (필드 좌표가 없으면 None)"""
+    fields = [OcrField.from_clova(field) for field in image.get("fields", [])]
+    if not fields or any(field is None for field in fields):
+        return None
+
+    converted = image.get("convertedImageInfo") or {}
+    return build_transcript(
+        [field for field in fields if field is not None],
+        image_width=converted.get("width"),
+        image_height=converted.get("height"),
+        min_confidence=min_confidence,
+    )
@@ -0,0 +1,92 @@
+import asyncio
+import shutil
+
+from loguru import logger
+
+from ai.services.ocr.ocr_layout import OcrField, build_transcript
+from ai.utils.circuit_breaker import CircuitBreaker
+from ai.utils.deadline import within_deadline
+from ai.utils.retry_policy import RetryPolicy
+from app.core.settings import settings
+
+# tesseract tsv 출력에서 단어 단위 행의 level
+_WORD_LEVEL = "5"
+
+
+def parse_tsv(tsv: str) -> list[OcrField]:
+    """tesseract tsv 출력의 단어 행을 OcrField 로 변환 (conf 는 0~100 이므로 0~1 로 바꿈)"""
+    fields: list[OcrField] = []
+    for row in tsv.splitlines()[1:]:
+        columns = row.split("\t")
+        if len(columns) < 12 or columns[0] != _WORD_LEVEL or not columns[11].strip():
+            continue
+        left, top, width, height = (float(value) for value in columns[6:10])
+        fields.append(
+            OcrField(
+                text=columns[11].strip(),
+                confidence=max(0.0, float(columns[10])) / 100,
+                left=left,
+                top=top,
+                right=left + width,
+                bottom=top + height,
+            )
+        )
+    return fields
+
+
+class TesseractOcr:
+    """
+    네트워크 없이 로컬 CPU 에서 실행하는 OCR (개발/부하 테스트/CI 용)
+
+    tesseract 실행 파일과 언어 데이터(settings.ocr_tesseract_lang, 기본 kor+eng)가 설치되어 있어야 하며,
+    단어 좌표로 Clova 와 같은 "A:/B:" 대화록을 만듦
+    """
+
+    name = "tesseract"
+    retry_policy: RetryPolicy | None = None
+    breaker: CircuitBreaker | None = None
+
+    def __init__(self) -> None:
+        self.command = shutil.which(settings.ocr_tesseract_command) or settings.ocr_tesseract_command
+        self.lang = settings.ocr_tesseract_lang
+        # tesseract 프로세스는 CPU 를 다 쓰므로 CPU 실행기 작업자 수만큼만 동시에 실행
+        self._slots = asyncio.Semaphore(settings.cpu_executor_workers)
+
+    async def request_text(self, image_data: bytes, filename: str) -> str:
+        """
+        OCR 결과 텍스트 (tesseract 가 없거나 실패하면 예외 전파)
+
+        요청 마감 시간이나 settings.ocr_tesseract_timeout 이 지나면 프로세스를 종료하고 예외 전파
+        """
+        async with within_deadline(), self._slots:
+            process = await asyncio.create_subprocess_exec(
+                self.command,
+                "stdin",
+                "stdout",
+                "-l",
+                self.lang,
+                "tsv",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(image_data), timeout=settings.ocr_tesseract_timeout
+                )
+            finally:
+                # 시간 초과나 취소로 빠져나온 경우 프로세스가 CPU 를 계속 쓰지 않도록 종료
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+
+        if process.returncode != 0:
+            raise RuntimeError(f"tesseract 실패 ({process.returncode}): {stderr.decode('utf-8', 'replace').strip()}")
+
+        fields = parse_tsv(stdout.decode("utf-8", "replace"))
+        text = build_transcript(fields, min_confidence=settings.ocr_min_confidence)
+        logger.info(f"[{filename}] 추출된 텍스트: {text}")
+        return text
+
+    async def close(self) -> None:
+        return None
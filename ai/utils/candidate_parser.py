@@ -0,0 +1,29 @@
+import re
+
+# "[1] ..." 형식을 우선 사용하고, 없으면 "1. ..." / "1) ..." 형식을 사용
+_BRACKET_MARKER = re.compile(r"^[ \t]*\[(\d+)\][ \t]*", re.MULTILINE)
+_NUMBER_MARKER = re.compile(r"^[ \t]*(\d+)[.)][ \t]+", re.MULTILINE)
+_QUOTES = "\"'“”‘’"
+
+
+def parse_candidates(text: str, expected: int) -> list[str] | None:
+    """
+    번호로 구분된 후보 목록을 파싱합니다.
+    서로 다른 후보를 expected 개 이상 찾지 못하면 None 을 반환합니다.
+    """
+    markers = list(_BRACKET_MARKER.finditer(text)) or list(_NUMBER_MARKER.finditer(text))
+    if len(markers) < expected:
+        return None
+
+    candidates: list[str] = []
+    seen: set[str] = set()
+    for index, marker in enumerate(markers):
+        end = markers[index + 1].start() if index + 1 < len(markers) else len(text)
+        candidate = text[marker.end() : end].strip().strip(_QUOTES).strip()
+        if candidate and candidate not in seen:
+            seen.add(candidate)
+            candidates.append(candidate)
+
+    if len(candidates) < expected:
+        return None
+    return candidates[:expected]
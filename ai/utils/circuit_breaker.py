@@ -0,0 +1,269 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+
+import httpx
+from loguru import logger
+
+from ai.utils.clova_http import clova_http
+from ai.utils.clova_stream_parser import ClovaStreamError
+from ai.utils.get_headers_payloads import base_headers
+from app.core.settings import settings
+
+Probe = Callable[[], Awaitable[bool]]
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 업스트림 호출 없이 거절된 경우 발생하는 예외"""
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    name: str
+    state: str
+    consecutive_failures: int
+    failures: int
+    successes: int
+    rejected: int
+    opened: int
+    probes: int
+
+
+class CircuitCall:
+    """회로를 통과한 호출 (예외 없이 실패를 알게 된 경우 mark_failure 호출)"""
+
+    def __init__(self) -> None:
+        self.failed = False
+
+    def mark_failure(self) -> None:
+        self.failed = True
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """
+    회로 차단 대상이 되는 업스트림 장애인지 판단
+
+    4xx 요청 오류와 제한기 대기 초과(LimiterTimeoutError, 우리 쪽 대기열 문제)는 제외
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return isinstance(error, (httpx.TransportError, ClovaStreamError))
+
+
+class CircuitBreaker:
+    """
+    업스트림 엔드포인트별 회로 차단기
+
+    - CLOSED: 정상 호출, 연속 실패가 failure_threshold 에 도달하면 OPEN
+    - OPEN: 호출 없이 CircuitOpenError 발생 (서비스는 즉시 대체 응답 반환)
+    - HALF_OPEN: 복구 확인을 위해 한 건만 통과, 성공 시 CLOSED / 실패 시 다시 OPEN
+
+    probe 가 있으면 OPEN 상태에서 백그라운드로 복구를 확인한 뒤 HALF_OPEN 으로 전환하고,
+    없으면 recovery_timeout 이 지난 뒤 들어온 요청을 HALF_OPEN 시험 호출로 사용
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        probe: Probe | None = None,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.probe = probe
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._probe_task: asyncio.Task[None] | None = None
+
+        self._consecutive_failures = 0
+        self._failures = 0
+        self._successes = 0
+        self._rejected = 0
+        self._opened = 0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """OPEN 상태 여부 (에이전트가 재시도를 건너뛸 때 사용)"""
+        return self._state is CircuitState.OPEN
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (HALF_OPEN 에서는 시험 호출 한 건만 허용)"""
+        if self._state is CircuitState.OPEN:
+            recovered = self.probe is None and time.monotonic() - self._opened_at >= self.recovery_timeout
+            if not recovered:
+                self._rejected += 1
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._state is CircuitState.HALF_OPEN:
+            if self._trial_in_flight:
+                self._rejected += 1
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self, trial: bool = False) -> None:
+        self._successes += 1
+        self._consecutive_failures = 0
+        if trial:
+            self._trial_in_flight = False
+        if self._state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self, trial: bool = False) -> None:
+        self._failures += 1
+        self._consecutive_failures += 1
+        if trial:
+            self._trial_in_flight = False
+        if self._state is CircuitState.HALF_OPEN or (
+            self._state is CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._open()
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[CircuitCall]:
+        """회로가 닫혀 있을 때만 호출을 통과시키고, 결과를 기록"""
+        if not self.allow_request():
+            raise CircuitOpenError(f"[{self.name}] 회로가 열려 있어 요청을 보내지 않습니다.")
+
+        trial = self._state is CircuitState.HALF_OPEN
+        call = CircuitCall()
+        try:
+            yield call
+        except asyncio.CancelledError:
+            # 결과를 모르는 채로 취소된 호출은 기록하지 않음 (시험 호출이면 다음 요청이 다시 시도)
+            if trial:
+                self._trial_in_flight = False
+            raise
+        except Exception as e:
+            if is_upstream_failure(e):
+                call.mark_failure()
+            if call.failed:
+                self.record_failure(trial)
+            elif trial:
+                # 업스트림 상태와 무관한 오류(4xx, 제한기 대기 초과, 파싱 오류 등)는 성공/실패로 기록하지 않음
+                # (시험 호출이면 HALF_OPEN 을 유지하고 다음 요청이 다시 시험)
+                self._trial_in_flight = False
+            raise
+        self._record(call, trial)
+
+    def _record(self, call: CircuitCall, trial: bool) -> None:
+        if call.failed:
+            self.record_failure(trial)
+        else:
+            self.record_success(trial)
+
+    def stats(self) -> CircuitBreakerStats:
+        return CircuitBreakerStats(
+            name=self.name,
+            state=self._state.value,
+            consecutive_failures=self._consecutive_failures,
+            failures=self._failures,
+            successes=self._successes,
+            rejected=self._rejected,
+            opened=self._opened,
+            probes=self._probes,
+        )
+
+    async def close(self) -> None:
+        """백그라운드 복구 확인 작업을 종료"""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            await asyncio.gather(self._probe_task, return_exceptions=True)
+            self._probe_task = None
+
+    def _open(self) -> None:
+        self._opened += 1
+        self._opened_at = time.monotonic()
+        self._transition(CircuitState.OPEN)
+        if self.probe is not None and (self._probe_task is None or self._probe_task.done()):
+            self._probe_task = asyncio.create_task(self._probe_until_recovered())
+
+    async def _probe_until_recovered(self) -> None:
+        assert self.probe is not None
+        while self._state is CircuitState.OPEN:
+            await asyncio.sleep(self.recovery_timeout)
+            self._probes += 1
+            try:
+                recovered = await self.probe()
+            except Exception as e:
+                logger.warning(f"[{self.name}] 복구 확인 요청 실패: {e}")
+                recovered = False
+            if recovered and self._state is CircuitState.OPEN:
+                self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state is self._state:
+            return
+        log = logger.warning if state is CircuitState.OPEN else logger.info
+        log(f"[{self.name}] 회로 상태 변경: {self._state.value} -> {state.value}")
+        self._state = state
+
+
+def _studio_probe(url: str) -> Probe:
+    """최소 토큰으로 Clova Studio 응답 여부를 확인하는 복구 확인 요청"""
+
+    async def probe() -> bool:
+        payload = {"messages": [{"role": "user", "content": "ping"}], "maxTokens": 1}
+        response = await clova_http.client.post(url, headers=dict(base_headers()), json=payload, timeout=5.0)
+        return response.status_code < 500 and response.status_code != 429
+
+    return probe
+
+
+class CircuitBreakerRegistry:
+    """Clova Studio 모델별, Clova OCR 용 회로 차단기를 보관"""
+
+    def __init__(self) -> None:
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def studio(self, url: str) -> CircuitBreaker:
+        """Clova Studio 모델(URL 마지막 경로)별 회로 차단기 (백그라운드 복구 확인 사용)"""
+        name = f"clova-studio:{url.rstrip('/').rsplit('/', 1)[-1]}"
+        if name not in self._breakers:
+            self._breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                recovery_timeout=settings.circuit_breaker_recovery_timeout,
+                probe=_studio_probe(url) if settings.circuit_breaker_probe else None,
+            )
+        return self._breakers[name]
+
+    def ocr(self) -> CircuitBreaker:
+        """Clova OCR 회로 차단기 (이미지 없이 확인할 수 없으므로 시험 호출로 복구 확인)"""
+        name = "clova-ocr"
+        if name not in self._breakers:
+            self._breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                recovery_timeout=settings.circuit_breaker_recovery_timeout,
+            )
+        return self._breakers[name]
+
+    def stats(self) -> list[CircuitBreakerStats]:
+        return [breaker.stats() for breaker in self._breakers.values()]
+
+    async def close(self) -> None:
+        for breaker in self._breakers.values():
+            await breaker.close()
+
+
+circuit_breakers = CircuitBreakerRegistry()
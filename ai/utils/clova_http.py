@@ -0,0 +1,95 @@
+import importlib.util
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from app.core.settings import settings
+
+
+@dataclass(frozen=True)
+class HttpPoolStats:
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    open_connections: int
+    idle_connections: int
+    total_requests: int
+
+
+class ClovaHttpClient:
+    """Clova Studio 호출(요약, 스타일 분석, 제목, 답변)이 공유하는 커넥션 풀"""
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        http2: bool,
+    ) -> None:
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # h2 패키지가 없으면 HTTP/1.1 keep-alive 로 동작
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.warning("h2 패키지가 설치되어 있지 않아 HTTP/1.1 로 Clova Studio 에 연결합니다.")
+
+        self._transport: httpx.AsyncHTTPTransport | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._total_requests = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 클라이언트 반환 (lifespan 밖에서 호출되면 최초 사용 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits)
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                event_hooks={"request": [self._count_request]},
+            )
+            logger.info(f"Clova Studio 커넥션 풀 생성 (http2={self.http2}, limits={self.limits})")
+        return self._client
+
+    async def _count_request(self, request: httpx.Request) -> None:
+        self._total_requests += 1
+
+    async def start(self) -> None:
+        """앱 시작 시 커넥션 풀을 생성"""
+        _ = self.client
+
+    async def close(self) -> None:
+        """앱 종료 시 커넥션 풀을 닫음"""
+        if self._client is not None:
+            await self._client.aclose()
+            logger.info("Clova Studio 커넥션 풀 종료")
+        self._client = None
+        self._transport = None
+
+    def stats(self) -> HttpPoolStats:
+        """커넥션 풀 사용 현황"""
+        connections: list[Any] = []
+        if self._transport is not None and self._client is not None and not self._client.is_closed:
+            # httpx 내부 속성(_pool)이라 버전이 바뀌면 없을 수 있음 (없으면 0 으로 보고)
+            pool = getattr(self._transport, "_pool", None)
+            connections = list(getattr(pool, "connections", None) or [])
+
+        return HttpPoolStats(
+            http2=self.http2,
+            max_connections=self.limits.max_connections or 0,
+            max_keepalive_connections=self.limits.max_keepalive_connections or 0,
+            open_connections=len(connections),
+            idle_connections=sum(1 for connection in connections if getattr(connection, "is_idle", lambda: False)()),
+            total_requests=self._total_requests,
+        )
+
+
+clova_http = ClovaHttpClient(
+    max_connections=settings.clova_http_max_connections,
+    max_keepalive_connections=settings.clova_http_max_keepalive_connections,
+    keepalive_expiry=settings.clova_http_keepalive_expiry,
+    http2=settings.clova_http2,
+)
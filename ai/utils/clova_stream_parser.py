@@ -0,0 +1,109 @@
+import json
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class ClovaStreamResult:
+    text: str
+    stop_reason: str | None = None
+    input_length: int | None = None
+    output_length: int | None = None
+    token_events: int = 0
+
+
+class ClovaStreamError(Exception):
+    """Clova Studio 스트림에서 error 이벤트를 받은 경우 발생하는 예외"""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(f"Clova Studio stream error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+class ClovaStreamParser:
+    """
+    Clova Studio chat-completions SSE 스트림 파서
+
+    - event: token  -> 본문은 파싱하지 않고 보관만 함 (result 이벤트가 없을 때만 사용)
+    - event: result -> 최종 집계 메시지와 사용량 정보를 사용
+    - event: error  -> ClovaStreamError 발생
+    """
+
+    def __init__(self) -> None:
+        self._event: str = ""
+        self._token_data: list[str] = []
+        self._result: ClovaStreamResult | None = None
+        self.done: bool = False
+
+    def feed(self, line: str) -> bool:
+        """SSE 한 줄을 처리하고, 스트림이 끝났으면 True 반환"""
+        if line.startswith("event:"):
+            self._event = line[6:].strip()
+            return False
+        if not line.startswith("data:"):
+            return False
+
+        data_str = line[5:].strip()
+        if self._event == "token":
+            self._token_data.append(data_str)
+            return False
+
+        if self._event == "result":
+            self._result = self._build_result(self._load(data_str))
+            self.done = True
+        elif self._event == "error":
+            status = self._load(data_str).get("status", {})
+            raise ClovaStreamError(str(status.get("code", "")), str(status.get("message", data_str)))
+        elif self._event == "signal" or data_str == "[DONE]":
+            self.done = True
+        return self.done
+
+    def result(self) -> ClovaStreamResult:
+        """최종 결과 반환 (result 이벤트가 없으면 token 이벤트를 이어 붙임)"""
+        if self._result is not None:
+            return self._result
+
+        if self._token_data:
+            logger.warning("Clova Studio 스트림에 result 이벤트가 없어 token 이벤트로 결과를 구성합니다.")
+        tokens = [self._load(data_str).get("message", {}).get("content", "") for data_str in self._token_data]
+        return ClovaStreamResult(text="".join(tokens).strip(), token_events=len(self._token_data))
+
+    def _build_result(self, data: dict[str, Any]) -> ClovaStreamResult:
+        return ClovaStreamResult(
+            text=data.get("message", {}).get("content", "").strip(),
+            stop_reason=data.get("stopReason"),
+            input_length=data.get("inputLength"),
+            output_length=data.get("outputLength"),
+            token_events=len(self._token_data),
+        )
+
+    @staticmethod
+    def _load(data_str: str) -> dict[str, Any]:
+        try:
+            data: dict[str, Any] = json.loads(data_str)
+            return data
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON 디코딩 오류 발생: {e}, 원본 데이터: {data_str}")
+            return {}
+
+
+def parse_clova_stream_lines(lines: Iterable[str]) -> ClovaStreamResult:
+    """이미 수신한 SSE 줄들을 파싱"""
+    parser = ClovaStreamParser()
+    for line in lines:
+        if parser.feed(line):
+            break
+    return parser.result()
+
+
+async def parse_clova_stream(lines: AsyncIterator[str]) -> ClovaStreamResult:
+    """SSE 스트림을 도착하는 대로 파싱하고, 종료 이벤트를 받으면 읽기를 멈춤"""
+    parser = ClovaStreamParser()
+    async for line in lines:
+        if parser.feed(line):
+            break
+    return parser.result()
@@ -0,0 +1,248 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import httpx
+from loguru import logger
+
+from ai.utils.clova_stream_parser import ClovaStreamError
+from app.core.settings import settings
+
+# 숫자가 작을수록 먼저 처리 (분석 > 생성 > 백그라운드 작업)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+
+OVERLOAD_STATUS_CODES = (429, 503)
+DECREASE_COOLDOWN_SECONDS = 1.0
+
+_request_priority: ContextVar[int | None] = ContextVar("request_priority", default=None)
+
+
+@contextmanager
+def priority_scope(priority: int) -> Iterator[None]:
+    """현재 컨텍스트(및 하위 태스크)의 업스트림 호출 우선순위를 지정"""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class LimiterTimeoutError(Exception):
+    """대기열에서 제한 시간 안에 슬롯을 얻지 못한 경우 발생하는 예외"""
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    name: str
+    limit: float
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+    acquired: int
+    timeouts: int
+    overloads: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class LimiterSlot:
+    """획득한 슬롯 (응답 코드로만 과부하를 알 수 있는 경우 mark_overloaded 호출)"""
+
+    def __init__(self) -> None:
+        self.overloaded = False
+
+    def mark_overloaded(self) -> None:
+        self.overloaded = True
+
+
+class AdaptiveLimiter:
+    """
+    업스트림 엔드포인트별 동시 요청 수 제한기 (AIMD)
+
+    - 429/503, 타임아웃, 목표 지연시간 초과 시 한도를 곱셈적으로 감소
+    - 정상 응답마다 한도를 1/limit 씩 가산적으로 증가
+    - 한도를 넘는 요청은 우선순위 큐에서 대기하고, timeout 이 지나면 LimiterTimeoutError 발생
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        min_limit: int = 1,
+        latency_target: float = 15.0,
+        queue_timeout: float | None = None,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.latency_target = latency_target
+        self.queue_timeout = queue_timeout
+        self.decrease_factor = decrease_factor
+
+        self._limit: float = float(max_limit)
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._last_decrease = 0.0
+
+        self._acquired = 0
+        self._timeouts = 0
+        self._overloads = 0
+        self._max_queue_depth = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    async def acquire(self, priority: int | None = None, timeout: float | None = None) -> None:
+        """슬롯 획득 (한도 초과 시 우선순위 순서로 대기, priority_scope 가 지정되어 있으면 그 값을 우선 사용)"""
+        started = time.monotonic()
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._record_wait(started)
+            return
+
+        scoped_priority = _request_priority.get()
+        if scoped_priority is not None:
+            priority = scoped_priority
+        elif priority is None:
+            priority = PRIORITY_NORMAL
+        timeout = timeout if timeout is not None else self.queue_timeout
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        # 취소된 대기자만 남아 있던 경우 바로 슬롯을 받을 수 있음
+        self._wake()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 슬롯을 반납
+                self.release()
+            else:
+                waiter.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                self._timeouts += 1
+                raise LimiterTimeoutError(f"[{self.name}] {timeout}초 동안 업스트림 슬롯을 얻지 못했습니다.")
+            raise
+        self._record_wait(started)
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, priority: int | None = None, timeout: float | None = None) -> AsyncIterator[LimiterSlot]:
+        """슬롯을 획득한 상태로 업스트림 호출을 감싸고, 결과에 따라 한도를 조정"""
+        await self.acquire(priority, timeout)
+        slot = LimiterSlot()
+        started = time.monotonic()
+        try:
+            yield slot
+        except httpx.TimeoutException:
+            slot.mark_overloaded()
+            raise
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in OVERLOAD_STATUS_CODES:
+                slot.mark_overloaded()
+            raise
+        except ClovaStreamError as e:
+            if e.code.startswith("429"):
+                slot.mark_overloaded()
+            raise
+        finally:
+            self._on_complete(time.monotonic() - started, slot.overloaded)
+            self.release()
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            name=self.name,
+            limit=round(self._limit, 2),
+            in_flight=self._in_flight,
+            queue_depth=self.queue_depth,
+            max_queue_depth=self._max_queue_depth,
+            acquired=self._acquired,
+            timeouts=self._timeouts,
+            overloads=self._overloads,
+            avg_wait_ms=round(self._total_wait / self._acquired * 1000, 2) if self._acquired else 0.0,
+            max_wait_ms=round(self._max_wait * 1000, 2),
+        )
+
+    def _on_complete(self, latency: float, overloaded: bool) -> None:
+        now = time.monotonic()
+        if overloaded or latency > self.latency_target:
+            self._overloads += 1
+            if now - self._last_decrease >= DECREASE_COOLDOWN_SECONDS:
+                self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                self._last_decrease = now
+                logger.warning(f"[{self.name}] 업스트림 과부하 감지, 동시 요청 한도 감소: {self.limit}")
+        else:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _record_wait(self, started: float) -> None:
+        waited = time.monotonic() - started
+        self._acquired += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+
+
+class LimiterRegistry:
+    """Clova Studio 모델별, Clova OCR 용 제한기를 보관"""
+
+    def __init__(self) -> None:
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+
+    def studio(self, url: str) -> AdaptiveLimiter:
+        """Clova Studio 모델(URL 마지막 경로)별 제한기"""
+        name = f"clova-studio:{url.rstrip('/').rsplit('/', 1)[-1]}"
+        if name not in self._limiters:
+            self._limiters[name] = AdaptiveLimiter(
+                name,
+                max_limit=settings.clova_studio_max_concurrency,
+                min_limit=settings.clova_limiter_min_concurrency,
+                latency_target=settings.clova_studio_latency_target,
+                queue_timeout=settings.clova_limiter_queue_timeout,
+            )
+        return self._limiters[name]
+
+    def ocr(self) -> AdaptiveLimiter:
+        """Clova OCR 제한기"""
+        name = "clova-ocr"
+        if name not in self._limiters:
+            self._limiters[name] = AdaptiveLimiter(
+                name,
+                max_limit=settings.clova_ocr_max_concurrency,
+                min_limit=settings.clova_limiter_min_concurrency,
+                latency_target=settings.clova_ocr_latency_target,
+                queue_timeout=settings.clova_limiter_queue_timeout,
+            )
+        return self._limiters[name]
+
+    def stats(self) -> list[LimiterStats]:
+        return [limiter.stats() for limiter in self._limiters.values()]
+
+
+upstream_limiters = LimiterRegistry()
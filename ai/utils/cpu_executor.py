@@ -0,0 +1,133 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from loguru import logger
+
+from app.core.settings import settings
+
+T = TypeVar("T")
+
+
+class CpuExecutorBusyError(Exception):
+    """실행기가 포화 상태여서 제한 시간 안에 작업을 넣지 못한 경우 발생하는 예외"""
+
+
+@dataclass(frozen=True)
+class CpuExecutorStats:
+    name: str
+    kind: str
+    max_workers: int
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+    avg_queue_wait_ms: float
+    max_queue_wait_ms: float
+    avg_cpu_ms: float
+    total_cpu_ms: float
+
+
+def _timed_call(func: Callable[..., T], args: tuple[Any, ...]) -> tuple[T, float, float]:
+    """작업자(스레드/프로세스)에서 실행되어 시작 시각과 CPU 시간을 함께 반환 (프로세스 풀에서도 쓰도록 모듈 수준에 둠)"""
+    started = time.monotonic()
+    cpu_started = time.thread_time()
+    result = func(*args)
+    return result, started, time.thread_time() - cpu_started
+
+
+class CpuExecutor:
+    """
+    이벤트 루프를 막는 CPU 작업(이미지 디코딩/인코딩)을 실행하는 제한된 풀
+
+    - kind 가 thread 면 스레드 풀, process 면 프로세스 풀 (함수와 인자는 pickle 가능해야 함)
+    - 실행 중 + 대기 중인 작업이 max_workers + max_queue 를 넘으면 queue_timeout 동안 기다린 뒤 CpuExecutorBusyError
+    - 풀은 처음 사용할 때 생성하고, 앱 종료 시 shutdown 으로 정리
+    """
+
+    def __init__(self, name: str, kind: str, max_workers: int, max_queue: int, queue_timeout: float) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 실행기 종류입니다: {kind}")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._executor: Executor | None = None
+        self._admission = asyncio.Semaphore(max_workers + max_queue)
+        self._submitted = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_cpu = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+            logger.info(f"[{self.name}] CPU 실행기 생성 ({self.kind}, workers={self.max_workers})")
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """func(*args) 를 풀에서 실행하고 결과를 반환"""
+        try:
+            await asyncio.wait_for(self._admission.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise CpuExecutorBusyError(f"[{self.name}] CPU 작업 대기열이 가득 찼습니다.")
+
+        submitted = time.monotonic()
+        self._submitted += 1
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, _timed_call, func, args)
+            result, started, cpu_seconds = await future
+        finally:
+            self._submitted -= 1
+            self._admission.release()
+
+        waited = max(0.0, started - submitted)
+        self._completed += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        self._total_cpu += cpu_seconds
+        return result
+
+    def stats(self) -> CpuExecutorStats:
+        completed = self._completed
+        return CpuExecutorStats(
+            name=self.name,
+            kind=self.kind,
+            max_workers=self.max_workers,
+            running=min(self._submitted, self.max_workers),
+            queued=max(0, self._submitted - self.max_workers),
+            completed=completed,
+            rejected=self._rejected,
+            avg_queue_wait_ms=round(self._total_wait / completed * 1000, 2) if completed else 0.0,
+            max_queue_wait_ms=round(self._max_wait * 1000, 2),
+            avg_cpu_ms=round(self._total_cpu / completed * 1000, 2) if completed else 0.0,
+            total_cpu_ms=round(self._total_cpu * 1000, 2),
+        )
+
+    def shutdown(self) -> None:
+        """앱 종료 시 풀 정리 (실행 중인 작업은 끝까지 수행)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            logger.info(f"[{self.name}] CPU 실행기 종료")
+        self._executor = None
+
+
+image_executor = CpuExecutor(
+    "image",
+    kind=settings.cpu_executor_kind,
+    max_workers=settings.cpu_executor_workers,
+    max_queue=settings.cpu_executor_max_queue,
+    queue_timeout=settings.cpu_executor_queue_timeout,
+)
@@ -0,0 +1,145 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+
+NodeFunc = Callable[..., Awaitable[Any]]
+OnComplete = Callable[[str, Any], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class DagNode:
+    name: str
+    func: NodeFunc
+    deps: tuple[str, ...]
+    # True 이면 의존 노드 결과(리스트)의 각 항목에 func 를 동시에 적용
+    fan_out: bool = False
+
+
+@dataclass(frozen=True)
+class NodeTiming:
+    name: str
+    started_ms: float
+    duration_ms: float
+    status: str
+
+
+@dataclass
+class DagRun:
+    results: dict[str, Any] = field(default_factory=dict)
+    timings: list[NodeTiming] = field(default_factory=list)
+    total_ms: float = 0.0
+
+
+class DagExecutor:
+    """
+    의존 관계가 있는 비동기 작업을 그래프로 실행하는 실행기
+
+    - 의존 노드가 모두 끝난 노드부터 바로 시작하므로 독립된 단계는 동시에 실행됨
+    - 한 노드가 실패하거나 실행이 취소되면 남은 노드를 모두 취소
+    - 노드별 시작 시점과 소요 시간을 기록
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._nodes: dict[str, DagNode] = {}
+
+    def add(self, name: str, func: NodeFunc, *deps: str) -> None:
+        """노드 추가 (func 는 deps 순서대로 의존 노드 결과를 인자로 받음)"""
+        self._add(DagNode(name, func, deps))
+
+    def add_map(self, name: str, func: NodeFunc, dep: str, *extra_deps: str) -> None:
+        """
+        dep 결과 리스트의 각 항목을 func(item, *extra_deps 결과) 로 동시에 처리하는 노드 추가
+        (결과는 같은 순서의 리스트)
+        """
+        self._add(DagNode(name, func, (dep, *extra_deps), fan_out=True))
+
+    async def run(self, on_complete: OnComplete | None = None) -> DagRun:
+        """
+        그래프 실행
+
+        on_complete 는 노드가 끝날 때마다 (노드 이름, 결과) 로 호출되고,
+        add_map 노드는 항목마다 ("이름[i]", 항목 결과) 로도 호출됨
+        """
+        run = DagRun()
+        started = time.monotonic()
+        tasks: dict[str, asyncio.Task[Any]] = {}
+        for node in self._nodes.values():
+            tasks[node.name] = asyncio.create_task(
+                self._run_node(node, tasks, run, started, on_complete), name=f"{self.name}:{node.name}"
+            )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            run.total_ms = round((time.monotonic() - started) * 1000, 2)
+            logger.info(
+                f"[{self.name}] 총 {run.total_ms}ms - "
+                + ", ".join(f"{timing.name}={timing.duration_ms}ms({timing.status})" for timing in run.timings)
+            )
+        return run
+
+    async def _run_node(
+        self,
+        node: DagNode,
+        tasks: dict[str, asyncio.Task[Any]],
+        run: DagRun,
+        run_started: float,
+        on_complete: OnComplete | None,
+    ) -> Any:
+        args: list[Any] = [await tasks[dep] for dep in node.deps]
+
+        node_started = time.monotonic()
+        status = "failed"
+        try:
+            if node.fan_out:
+                result: Any = await self._run_fan_out(node, args[0], args[1:], on_complete)
+            else:
+                result = await node.func(*args)
+            status = "done"
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            run.timings.append(
+                NodeTiming(
+                    name=node.name,
+                    started_ms=round((node_started - run_started) * 1000, 2),
+                    duration_ms=round((time.monotonic() - node_started) * 1000, 2),
+                    status=status,
+                )
+            )
+
+        run.results[node.name] = result
+        if on_complete is not None:
+            await on_complete(node.name, result)
+        return result
+
+    async def _run_fan_out(
+        self, node: DagNode, items: Sequence[Any], extra_args: Sequence[Any], on_complete: OnComplete | None
+    ) -> list[Any]:
+        async def run_item(index: int, item: Any) -> Any:
+            result = await node.func(item, *extra_args)
+            if on_complete is not None:
+                await on_complete(f"{node.name}[{index}]", result)
+            return result
+
+        return list(await asyncio.gather(*(run_item(index, item) for index, item in enumerate(items))))
+
+    def _add(self, node: DagNode) -> None:
+        if node.name in self._nodes:
+            raise ValueError(f"[{self.name}] 이미 등록된 노드입니다: {node.name}")
+        # 의존 노드는 먼저 등록되어 있어야 하므로 순환이 생기지 않음
+        missing = [dep for dep in node.deps if dep not in self._nodes]
+        if missing:
+            raise ValueError(f"[{self.name}] {node.name} 의 의존 노드가 등록되지 않았습니다: {missing}")
+        self._nodes[node.name] = node
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+_request_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """요청 마감 시간이 지나 업스트림 호출을 중단한 경우 발생하는 예외"""
+
+
+@contextmanager
+def deadline_scope(seconds: float | None, inherit: bool = True) -> Iterator[None]:
+    """
+    현재 컨텍스트(및 하위 태스크)의 마감 시간을 지금부터 seconds 초 뒤로 지정
+
+    이미 더 이른 마감 시간이 있으면 그대로 유지하고, inherit=False 면 기존 마감 시간을 무시
+    (요청과 별개로 계속 실행되는 백그라운드 작업용). seconds 가 None 이면 마감 시간을 두지 않음
+    """
+    deadline = time.monotonic() + seconds if seconds is not None else None
+    current = _request_deadline.get() if inherit else None
+    if current is not None and (deadline is None or current < deadline):
+        deadline = current
+
+    token = _request_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """마감 시간까지 남은 초 (마감 시간이 없으면 None)"""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def has_budget(seconds: float) -> bool:
+    """남은 시간이 seconds 이상인지 (재시도 여부 판단용, 마감 시간이 없으면 항상 True)"""
+    left = remaining()
+    return left is None or left >= seconds
+
+
+def clamp_timeout(timeout: float) -> float:
+    """업스트림 타임아웃을 남은 시간 이하로 줄임"""
+    left = remaining()
+    return timeout if left is None else max(0.001, min(timeout, left))
+
+
+@asynccontextmanager
+async def within_deadline() -> AsyncIterator[None]:
+    """마감 시간이 되면 감싼 업스트림 호출을 취소하고 DeadlineExceededError 발생"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError("요청 마감 시간이 지나 업스트림을 호출하지 않습니다.")
+
+    timeout = asyncio.timeout(left)
+    try:
+        async with timeout:
+            yield
+    except TimeoutError as e:
+        if timeout.expired():
+            raise DeadlineExceededError("요청 마감 시간이 지나 업스트림 호출을 취소했습니다.") from e
+        raise
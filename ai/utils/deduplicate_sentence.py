@@ -1,9 +1,96 @@
+import math
+import re
+from collections import Counter
+
+from app.core.settings import settings
+
+# 마침표, 물음표, 느낌표, 줄바꿈으로 끝나는 문장 (마지막 문장은 구분자 없이 끝날 수 있음)
+_SENTENCE = re.compile(r"[^.?!\n]*[.?!\n]|[^.?!\n]+$")
+_NON_WORD = re.compile(r"[\W_]+")
+SHINGLE_SIZE = 3
+DEDUP_MODES = ("exact", "normalized", "fuzzy")
+
+
+def _normalize(sentence: str) -> str:
+    """공백, 문장부호, 대소문자 차이를 무시한 비교용 문자열"""
+    return _NON_WORD.sub("", sentence).lower()
+
+
+def _shingles(key: str) -> set[str]:
+    if len(key) <= SHINGLE_SIZE:
+        return {key}
+    return {key[i : i + SHINGLE_SIZE] for i in range(len(key) - SHINGLE_SIZE + 1)}
+
+
+class _SeenSentences:
+    """
+    이미 남긴 문장 집합
+
+    - exact: 문장 그대로, normalized: 공백/문장부호/대소문자 무시
+    - fuzzy: normalized 에 더해 글자 3-gram 자카드 유사도가 threshold 이상이면 중복 (3-gram 역색인으로 후보만 비교)
+    """
+
+    def __init__(self, mode: str, threshold: float, sentences: list[str]) -> None:
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"지원하지 않는 중복 제거 방식입니다: {mode}")
+        if not 0 < threshold <= 1:
+            raise ValueError(f"유사도 기준은 0 초과 1 이하여야 합니다: {threshold}")
+        self.mode = mode
+        self.threshold = threshold
+        # 드문 3-gram 부터 정렬해야 앞부분(prefix)이 겹치는 후보가 적음
+        self._frequency: Counter[str] = Counter()
+        if mode == "fuzzy":
+            self._frequency.update(shingle for sentence in sentences for shingle in _shingles(self._key(sentence)))
+        self._keys: set[str] = set()
+        self._shingles: list[set[str]] = []
+        self._index: dict[str, list[int]] = {}
+
+    def add(self, sentence: str) -> bool:
+        """처음 보는 문장이면 기록하고 True, 중복이면 False"""
+        key = self._key(sentence)
+        if key in self._keys:
+            return False
+        if self.mode == "fuzzy":
+            shingles = _shingles(key)
+            prefix = self._prefix(shingles)
+            if self._is_similar(shingles, prefix):
+                return False
+            for shingle in prefix:
+                self._index.setdefault(shingle, []).append(len(self._shingles))
+            self._shingles.append(shingles)
+        self._keys.add(key)
+        return True
+
+    def _key(self, sentence: str) -> str:
+        return sentence if self.mode == "exact" else _normalize(sentence) or sentence
+
+    def _prefix(self, shingles: set[str]) -> list[str]:
+        """
+        유사도가 threshold 이상인 두 집합은 (같은 순서로 정렬했을 때) 앞쪽 len - ceil(threshold * len) + 1 개 안에서
+        반드시 하나 이상 겹치므로 이 부분만 색인 (prefix filtering)
+        """
+        size = len(shingles) - math.ceil(self.threshold * len(shingles)) + 1
+        return sorted(shingles, key=lambda shingle: (self._frequency[shingle], shingle))[: max(1, size)]
+
+    def _is_similar(self, shingles: set[str], prefix: list[str]) -> bool:
+        candidates = {candidate for shingle in prefix for candidate in self._index.get(shingle, ())}
+        for candidate in candidates:
+            other = self._shingles[candidate]
+            # 크기가 threshold 비율 이상 차이 나면 유사도가 threshold 에 못 미침
+            if not self.threshold * len(other) <= len(shingles) <= len(other) / self.threshold:
+                continue
+            common = len(shingles & other)
+            if common / (len(shingles) + len(other) - common) >= self.threshold:
+                return True
+        return False
+
+
 # 중복되는 문장 제거
-def deduplicate_sentences(text: str) -> str:
+def deduplicate_sentences(text: str, mode: str | None = None, threshold: float | None = None) -> str:
     """
     문자열에서 중복되는 문장을 제거합니다.
     1. 문자열 전체가 두 번 반복되는 경우
-    2. 개별 문장이 반복되는 경우
+    2. 개별 문장이 반복되는 경우 (mode: exact / normalized / fuzzy, 기본값은 settings.dedup_mode)
     """
     if not text:
         return text
@@ -16,27 +103,28 @@ def deduplicate_sentences(text: str) -> str:
         return text[:half_len].strip()
 
     # 2. 개별 문장이 반복되는 경우 처리
-    # 마침표, 물음표, 느낌표, 줄바꿈으로 문장 구분
-    sentences = []
-    current_sentence = ""
-
-    for i, char in enumerate(text):
-        current_sentence += char
-        # 문장 구분자를 만났거나 마지막 문자인 경우
-        if char in [".", "?", "!", "\n"] or i == len(text) - 1:
-            current_sentence = current_sentence.strip()
-            # 빈 문장이 아니고 중복되지 않은 경우에만 추가
-            if current_sentence and current_sentence not in sentences:
-                sentences.append(current_sentence)
-            current_sentence = ""
+    pieces = [(match.group().strip(), match.group().endswith("\n")) for match in _SENTENCE.finditer(text)]
+    seen = _SeenSentences(
+        mode or settings.dedup_mode,
+        threshold if threshold is not None else settings.dedup_similarity_threshold,
+        [sentence for sentence, _ in pieces if sentence],
+    )
+    sentences: list[str] = []
+    separators: list[str] = []  # 각 문장 뒤에 붙일 원래 구분자 (줄바꿈 또는 공백)
+
+    for sentence, ends_with_newline in pieces:
+        # 빈 문장이 아니고 중복되지 않은 경우에만 추가
+        if sentence:
+            if seen.add(sentence):
+                sentences.append(sentence)
+                separators.append("\n" if ends_with_newline else " ")
+        elif ends_with_newline and separators:
+            separators[-1] = "\n"
 
     # 결과 조합 시 원래 구분자 유지
-    result = ""
+    parts: list[str] = []
     for i, sentence in enumerate(sentences):
         if i > 0:
-            # 이전 문장이 줄바꿈으로 끝나지 않았다면 공백 추가
-            if not sentences[i - 1].endswith(("\n", ".", "?", "!")):
-                result += " "
-        result += sentence
-
-    return result
+            parts.append(separators[i - 1])
+        parts.append(sentence)
+    return "".join(parts)
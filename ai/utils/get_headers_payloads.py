@@ -1,8 +1,47 @@
+import os
 import yaml
 import random
-from typing import Optional, Union, Dict, Any, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, Union, Dict, Any, Mapping, Tuple
+
+from loguru import logger
+
 from app.core.settings import settings
 
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+HYPER_PARAM_KEYS = (
+    "topP",
+    "topK",
+    "maxTokens",
+    "temperature",
+    "repeatPenalty",
+    "stopBefore",
+    "includeAiFilters",
+)
+
+
+@dataclass(frozen=True)
+class MultiCandidateConfig:
+    """한 번의 호출로 여러 후보를 받기 위한 추가 지시문과 토큰 한도"""
+
+    instruction: str
+    max_tokens: int
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """YAML 설정을 검증해 미리 만들어 둔 페이로드 템플릿 (호출마다 메시지와 시드만 채움)"""
+
+    name: str
+    system_prompt: str
+    hyper_params: Mapping[str, Any]
+    seed: int | None
+    mtime: float
+    multi_candidate: MultiCandidateConfig | None = None
+
 
 def load_config(file_path: str) -> Dict[str, Any]:
     """YAML 파일을 로드하여 딕셔너리 형태로 반환합니다."""
@@ -11,14 +50,77 @@ def load_config(file_path: str) -> Dict[str, Any]:
     return config
 
 
-def get_headers_payloads(
-    config_path: Union[str, Dict[str, Any]], conversation: Optional[str] = None, random_seed: bool = False
-) -> Tuple[Dict[str, str], Dict[str, Any]]:
-    """헤더와 페이로드를 반환하는 함수"""
+def compile_config(config: Dict[str, Any], name: str, mtime: float = 0.0) -> PromptTemplate:
+    """설정 딕셔너리를 검증하여 불변 템플릿으로 변환합니다."""
+    if not isinstance(config, dict) or "SYSTEM_PROMPT" not in config or "HYPER_PARAM" not in config:
+        raise ValueError(f"{name}: SYSTEM_PROMPT 와 HYPER_PARAM 항목이 필요합니다.")
+
+    hyper_param: Dict[str, Any] = config["HYPER_PARAM"]
+    missing = [key for key in HYPER_PARAM_KEYS if key not in hyper_param]
+    if missing:
+        raise ValueError(f"{name}: HYPER_PARAM 에 {missing} 항목이 없습니다.")
+
+    multi_candidate: MultiCandidateConfig | None = None
+    multi_config: Dict[str, Any] = config.get("MULTI_CANDIDATE") or {}
+    if multi_config.get("enabled"):
+        if "{count}" not in multi_config.get("instruction", ""):
+            raise ValueError(f"{name}: MULTI_CANDIDATE.instruction 에 {{count}} 자리표시자가 필요합니다.")
+        multi_candidate = MultiCandidateConfig(
+            instruction=multi_config["instruction"],
+            max_tokens=multi_config.get("maxTokens", hyper_param["maxTokens"]),
+        )
+
+    return PromptTemplate(
+        name=name,
+        system_prompt=config["SYSTEM_PROMPT"],
+        hyper_params=MappingProxyType({key: hyper_param[key] for key in HYPER_PARAM_KEYS}),
+        seed=hyper_param.get("seed"),
+        mtime=mtime,
+        multi_candidate=multi_candidate,
+    )
 
-    # config_path가 문자열이면 파일에서 로드, 딕셔너리면 그대로 사용
-    config: Dict[str, Any] = load_config(config_path) if isinstance(config_path, str) else config_path
 
+class PromptConfigCache:
+    """ai/config 의 프롬프트 설정을 한 번만 읽어 템플릿으로 보관하는 캐시"""
+
+    def __init__(self, config_dir: Path, reload_on_change: bool = False) -> None:
+        self.config_dir = config_dir
+        self.reload_on_change = reload_on_change
+        self._templates: Dict[str, PromptTemplate] = {}
+
+    def load_all(self) -> None:
+        """앱 시작 시 설정 디렉토리의 모든 설정을 로드하고 검증"""
+        for config_path in sorted(self.config_dir.glob("*.yaml")):
+            try:
+                self._load(str(config_path))
+            except ValueError as e:
+                # config_no_Img.yaml 처럼 다른 스키마를 쓰는 미사용 설정은 건너뜀
+                logger.warning(f"프롬프트 설정을 건너뜁니다: {e}")
+        logger.info(f"프롬프트 설정 {len(self._templates)}개 로드 완료")
+
+    def get(self, config_path: str) -> PromptTemplate:
+        """설정 파일 경로에 해당하는 템플릿 반환 (없으면 최초 1회 로드)"""
+        template = self._templates.get(config_path)
+        if template is None:
+            return self._load(config_path)
+        if self.reload_on_change and os.stat(config_path).st_mtime != template.mtime:
+            logger.info(f"프롬프트 설정 변경 감지, 다시 로드합니다: {config_path}")
+            return self._load(config_path)
+        return template
+
+    def _load(self, config_path: str) -> PromptTemplate:
+        mtime = os.stat(config_path).st_mtime
+        template = compile_config(load_config(config_path), Path(config_path).name, mtime)
+        self._templates[config_path] = template
+        return template
+
+
+prompt_configs = PromptConfigCache(CONFIG_DIR, reload_on_change=settings.prompt_config_reload)
+
+
+@lru_cache(maxsize=1)
+def base_headers() -> Tuple[Tuple[str, str], ...]:
+    """Clova Studio 공통 헤더 (환경 변수는 최초 1회만 읽음)"""
     # 환경 변수에서 토큰과 요청 ID 가져오기
     BEARER_TOKEN: Optional[str] = settings.CLOVA_AI_BEARER_TOKEN
     REQUEST_ID: Optional[str] = settings.CLOVA_REQ_ID_REPLY_SUMMARY
@@ -26,34 +128,52 @@ def get_headers_payloads(
     if not BEARER_TOKEN or not REQUEST_ID:
         raise ValueError("CLOVA_AI_BEARER_TOKEN 또는 CLOVA_REQ_ID_REPLY_SUMMARY 환경 변수가 설정되지 않았습니다.")
 
+    return (
+        ("Authorization", f"Bearer {BEARER_TOKEN}"),
+        ("X-NCP-CLOVASTUDIO-REQUEST-ID", REQUEST_ID),
+        ("Content-Type", "application/json"),
+        ("Accept", "text/event-stream"),
+    )
+
+
+def get_headers_payloads(
+    config_path: Union[str, Dict[str, Any]],
+    conversation: Optional[str] = None,
+    random_seed: bool = False,
+    num_candidates: Optional[int] = None,
+) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """헤더와 페이로드를 반환하는 함수 (num_candidates 지정 시 한 번에 여러 후보를 요청)"""
+
+    # config_path가 문자열이면 캐시된 템플릿 사용, 딕셔너리면 그대로 컴파일
+    template: PromptTemplate = (
+        prompt_configs.get(config_path) if isinstance(config_path, str) else compile_config(config_path, "inline")
+    )
+
     # 헤더 생성
-    headers: Dict[str, str] = {
-        "Authorization": f"Bearer {BEARER_TOKEN}",
-        "X-NCP-CLOVASTUDIO-REQUEST-ID": REQUEST_ID,
-        "Content-Type": "application/json",
-        "Accept": "text/event-stream",
-    }
+    headers: Dict[str, str] = dict(base_headers())
 
     # 기본 시스템 메시지 설정
-    messages: list[Dict[str, str]] = [{"role": "system", "content": config["SYSTEM_PROMPT"]}]
+    system_prompt: str = template.system_prompt
+    if num_candidates is not None:
+        if template.multi_candidate is None:
+            raise ValueError(f"{template.name}: MULTI_CANDIDATE 설정이 활성화되어 있지 않습니다.")
+        system_prompt += "\n" + template.multi_candidate.instruction.format(count=num_candidates)
+    messages: list[Dict[str, str]] = [{"role": "system", "content": system_prompt}]
 
     if conversation:
         messages.append({"role": "user", "content": conversation})
 
     # 랜덤 시드 설정
-    seed: int = random.randint(0, 10000) if random_seed else config["HYPER_PARAM"]["seed"]
+    if random_seed:
+        seed: int = random.randint(0, 10000)
+    elif template.seed is not None:
+        seed = template.seed
+    else:
+        raise ValueError(f"{template.name}: 고정 시드를 사용하려면 HYPER_PARAM.seed 가 필요합니다.")
 
     # 페이로드 생성
-    payload: Dict[str, Any] = {
-        "messages": messages,
-        "topP": config["HYPER_PARAM"]["topP"],
-        "topK": config["HYPER_PARAM"]["topK"],
-        "maxTokens": config["HYPER_PARAM"]["maxTokens"],
-        "temperature": config["HYPER_PARAM"]["temperature"],
-        "repeatPenalty": config["HYPER_PARAM"]["repeatPenalty"],
-        "stopBefore": config["HYPER_PARAM"]["stopBefore"],
-        "includeAiFilters": config["HYPER_PARAM"]["includeAiFilters"],
-        "seed": seed,
-    }
+    payload: Dict[str, Any] = {"messages": messages, **template.hyper_params, "seed": seed}
+    if num_candidates is not None and template.multi_candidate is not None:
+        payload["maxTokens"] = template.multi_candidate.max_tokens
 
     return headers, payload
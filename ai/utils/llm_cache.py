@@ -0,0 +1,25 @@
+import hashlib
+
+from ai.utils.response_cache import MongoCacheTier, ResponseCache, TtlLruCache
+from ai.utils.single_flight import SingleFlight
+from app.core.settings import settings
+
+
+def make_llm_cache_key(config_name: str, model_url: str, input_text: str, seed: int) -> str:
+    """(설정 이름, 모델 URL, 입력, 시드) 로 캐시 키 생성"""
+    raw = "\x1f".join([config_name, model_url, input_text, str(seed)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# 고정 시드로 호출되는(결과가 결정적인) LLM 응답 캐시
+llm_cache: ResponseCache[str] = ResponseCache(
+    TtlLruCache(
+        max_entries=settings.llm_cache_max_entries,
+        max_bytes=settings.llm_cache_max_bytes,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        sizeof=lambda value: len(value.encode("utf-8")),
+    ),
+    mongo_tier=MongoCacheTier("llm_cache", settings.llm_cache_ttl_seconds) if settings.llm_cache_mongo else None,
+)
+# 캐시가 비어 있을 때 같은 키로 동시에 들어온 호출을 하나로 묶어 캐시를 한 번만 채움
+llm_cache_flight: SingleFlight[str, None] = SingleFlight("llm-cache")
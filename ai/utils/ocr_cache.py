@@ -0,0 +1,118 @@
+import hashlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from io import BytesIO
+from typing import Iterator
+
+from PIL import Image
+
+from ai.utils.cpu_executor import image_executor
+from ai.utils.response_cache import MongoCacheTier, ResponseCache, TtlLruCache
+from app.core.settings import settings
+
+# 지각 해시(dHash) 격자 크기 (32x32 = 1024비트, 채팅 스크린샷은 배치가 비슷해 작은 격자면 다른 대화끼리 가까워짐)
+PHASH_SIZE = 32
+
+# OCR 텍스트 형식 버전 (대화록 생성 방식이 바뀌면 올려서 이전 형식으로 저장된 캐시를 쓰지 않도록 함)
+OCR_TEXT_FORMAT_VERSION = 2
+
+# 지각 해시로 찾은 캐시 키를 공유할 범위 (사용자 id, 없으면 비로그인 사용자)
+_cache_scope: ContextVar[str | None] = ContextVar("ocr_cache_scope", default=None)
+
+
+@contextmanager
+def ocr_cache_scope(user_id: object | None) -> Iterator[None]:
+    """현재 컨텍스트의 OCR 캐시 사용자 범위를 지정 (비슷한 이미지는 같은 사용자의 이미지끼리만 같은 키를 사용)"""
+    token = _cache_scope.set(str(user_id) if user_id else None)
+    try:
+        yield
+    finally:
+        _cache_scope.reset(token)
+
+
+def perceptual_hash(image_bytes: bytes, hash_size: int = PHASH_SIZE) -> tuple[int, int]:
+    """
+    (가로세로 비율 백분율, dHash) 반환
+
+    dHash 는 흑백으로 줄인 (hash_size + 1) x hash_size 이미지에서 가로로 이웃한 픽셀의 밝기 비교로 만든 비트열
+    (CPU 실행기의 스레드/프로세스에서 실행되도록 모듈 수준에 둠)
+    """
+    with Image.open(BytesIO(image_bytes)) as image:
+        width, height = image.size
+        image.draft("L", (hash_size * 8, hash_size * 8))
+        pixels = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR).tobytes()
+
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | int(pixels[offset + col] > pixels[offset + col + 1])
+    return width * 100 // max(height, 1), bits
+
+
+class PerceptualKeyIndex:
+    """
+    최근 본 이미지의 지각 해시 목록
+
+    다시 압축되거나 크기가 바뀐 이미지는 dHash 가 몇 비트씩 달라지므로, 같은 사용자의 이미지 중 가로세로 비율이 같고
+    해밍 거리가 max_distance 이하인 해시가 있으면 그 해시의 캐시 키를 그대로 사용
+    (다른 사용자의 비슷한 대화 화면과 섞이지 않도록 사용자 범위가 다르면 비교하지 않음)
+    """
+
+    def __init__(self, max_entries: int, max_distance: int) -> None:
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self._keys: OrderedDict[str, tuple[str, int, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def resolve(self, scope: str, aspect: int, bits: int) -> str:
+        for key, (known_scope, known_aspect, known_bits) in self._keys.items():
+            if known_scope == scope and known_aspect == aspect and (known_bits ^ bits).bit_count() <= self.max_distance:
+                self._keys.move_to_end(key)
+                return key
+
+        key = f"phash:{scope}:{aspect}:{bits:x}"
+        self._keys[key] = (scope, aspect, bits)
+        while len(self._keys) > self.max_entries:
+            self._keys.popitem(last=False)
+        return key
+
+
+def _key_prefix(backend: str) -> str:
+    """OCR 엔진 이름과 텍스트 형식 (엔진이나 대화록 형식이 다르면 같은 이미지라도 다른 키를 사용)"""
+    transcript = "layout" if settings.ocr_layout_transcript else "flat"
+    return f"{backend}:v{OCR_TEXT_FORMAT_VERSION}-{transcript}"
+
+
+async def make_ocr_cache_key(image_bytes: bytes, backend: str, mode: str | None = None) -> str:
+    """
+    전처리된 이미지 바이트로 캐시 키 생성 (OCR 엔진 이름과 텍스트 형식 버전을 접두사로 붙임)
+
+    - sha256: 바이트가 완전히 같은 이미지만 적중
+    - phash: 같은 사용자가 다시 압축된 같은 스크린샷을 올려도 적중 (디코딩이 필요해 CPU 실행기에서 계산)
+      사용자 범위가 없으면(비로그인) 누구의 이미지인지 구분할 수 없으므로 sha256 키 사용
+    """
+    mode = mode or settings.ocr_cache_key_mode
+    scope = _cache_scope.get()
+    if mode == "phash" and scope is not None:
+        aspect, bits = await image_executor.run(perceptual_hash, image_bytes)
+        return f"{_key_prefix(backend)}:{phash_index.resolve(scope, aspect, bits)}"
+    if mode in ("sha256", "phash"):
+        return f"{_key_prefix(backend)}:sha256:{hashlib.sha256(image_bytes).hexdigest()}"
+    raise ValueError(f"지원하지 않는 OCR 캐시 키 방식입니다: {mode}")
+
+
+# 같은 이미지를 다시 올렸을 때 유료 OCR 호출을 건너뛰기 위한 이미지별 OCR 텍스트 캐시
+ocr_cache: ResponseCache[str] = ResponseCache(
+    TtlLruCache(
+        max_entries=settings.ocr_cache_max_entries,
+        max_bytes=settings.ocr_cache_max_bytes,
+        ttl_seconds=settings.ocr_cache_ttl_seconds,
+        sizeof=lambda value: len(value.encode("utf-8")),
+    ),
+    mongo_tier=MongoCacheTier("ocr_cache", settings.ocr_cache_ttl_seconds) if settings.ocr_cache_mongo else None,
+)
+phash_index = PerceptualKeyIndex(settings.ocr_cache_max_entries, settings.ocr_cache_phash_max_distance)
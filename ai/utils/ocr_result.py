@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class OcrStatus(Enum):
+    OK = "ok"
+    CACHED = "cached"
+    EMPTY = "empty"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class OcrImageResult:
+    """이미지 한 장의 OCR 결과 (attempts 는 실제 OCR 요청 횟수, 캐시 적중이면 0)"""
+
+    name: str
+    text: str
+    status: OcrStatus
+    latency_ms: float
+    attempts: int
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status in (OcrStatus.OK, OcrStatus.CACHED)
@@ -0,0 +1,161 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Generic, TypeVar
+
+import pymongo
+from loguru import logger
+
+from app.utils.mongo import db
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    l2_hits: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class TtlLruCache(Generic[V]):
+    """항목 수, 바이트 크기, TTL 제한을 가진 프로세스 내 LRU 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        sizeof: Callable[[V], int],
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sizeof = sizeof
+        self._entries: OrderedDict[str, tuple[V, float, int]] = OrderedDict()
+        self._size_bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get(self, key: str) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: V, ttl_seconds: float | None = None) -> None:
+        size = self.sizeof(value) + len(key)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        expires_at = time.monotonic() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+        self._entries[key] = (value, expires_at, size)
+        self._size_bytes += size
+
+        while len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def pop(self, key: str) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._remove(key)
+        return entry[0] if entry[1] > time.monotonic() else None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._size_bytes -= size
+
+
+class MongoCacheTier:
+    """TTL 인덱스를 사용하는 MongoDB 2차 캐시"""
+
+    def __init__(self, collection_name: str, ttl_seconds: float) -> None:
+        self._collection = db[collection_name]
+        self.ttl_seconds = ttl_seconds
+
+    async def set_index(self) -> None:
+        """expires_at 이 지나면 MongoDB 가 문서를 자동 삭제하도록 설정"""
+        await self._collection.create_index([("expires_at", pymongo.ASCENDING)], expireAfterSeconds=0)
+
+    async def get(self, key: str) -> Any | None:
+        document = await self._collection.find_one({"_id": key, "expires_at": {"$gt": datetime.now()}})
+        return document["value"] if document else None
+
+    async def set(self, key: str, value: Any) -> None:
+        expires_at = datetime.now() + timedelta(seconds=self.ttl_seconds)
+        await self._collection.replace_one({"_id": key}, {"value": value, "expires_at": expires_at}, upsert=True)
+
+
+class ResponseCache(Generic[V]):
+    """프로세스 내 LRU(1차) + 선택적 MongoDB(2차) 로 구성된 응답 캐시"""
+
+    def __init__(self, memory: TtlLruCache[V], mongo_tier: MongoCacheTier | None = None) -> None:
+        self.memory = memory
+        self.mongo_tier = mongo_tier
+        self.hits = 0
+        self.misses = 0
+        self.l2_hits = 0
+
+    async def get(self, key: str) -> V | None:
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        if self.mongo_tier is not None:
+            l2_value: V | None = None
+            try:
+                l2_value = await self.mongo_tier.get(key)
+            except Exception as e:
+                logger.error(f"MongoDB 캐시 조회 실패: {e}")
+            if l2_value is not None:
+                self.hits += 1
+                self.l2_hits += 1
+                self.memory.set(key, l2_value)
+                return l2_value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: V) -> None:
+        self.memory.set(key, value)
+        if self.mongo_tier is not None:
+            try:
+                await self.mongo_tier.set(key, value)
+            except Exception as e:
+                logger.error(f"MongoDB 캐시 저장 실패: {e}")
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            l2_hits=self.l2_hits,
+            evictions=self.memory.evictions,
+            entries=len(self.memory),
+            size_bytes=self.memory.size_bytes,
+        )
@@ -0,0 +1,217 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+import httpx
+from loguru import logger
+
+from ai.utils.circuit_breaker import CircuitBreaker
+from ai.utils.clova_stream_parser import ClovaStreamError
+from ai.utils.deadline import has_budget
+from app.core.settings import settings
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = (408, 429)
+
+
+@dataclass(frozen=True)
+class RetryPolicyStats:
+    name: str
+    retries: int
+    budget_exhausted: int
+    tokens: float
+    capacity: float
+
+
+@dataclass(frozen=True)
+class RequestRetryStats:
+    requests: int
+    requests_with_retries: int
+    total_retries: int
+    max_retries_per_request: int
+
+
+@dataclass
+class RequestRetries:
+    """한 요청이 사용한 재시도 횟수 (업스트림별)"""
+
+    by_upstream: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_upstream.values())
+
+
+_request_retries: ContextVar[RequestRetries | None] = ContextVar("request_retries", default=None)
+
+
+@contextmanager
+def retry_tracking() -> Iterator[RequestRetries]:
+    """현재 컨텍스트(및 하위 태스크)에서 일어난 재시도를 집계"""
+    retries = RequestRetries()
+    token = _request_retries.set(retries)
+    try:
+        yield retries
+    finally:
+        _request_retries.reset(token)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    재시도하면 성공할 수 있는 오류인지 판단
+
+    연결/타임아웃, 5xx, 408/429, 스트림 error 이벤트만 재시도하고, 회로 차단/마감 시간 초과/제한기 대기 초과/4xx 는 제외
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.TransportError, ClovaStreamError))
+
+
+class RetryBudget:
+    """업스트림별 재시도 토큰 버킷 (장애 중 재시도가 요청량을 부풀리지 않도록 초당 refill_per_second 개까지만 허용)"""
+
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+
+class RetryPolicy:
+    """
+    업스트림별 재시도 정책
+
+    - 재시도 전 full jitter 지수 백오프로 대기 (uniform(0, min(max_delay, base_delay * 2^attempt)))
+    - 회로가 열려 있거나, 마감 시간까지 여유가 없거나, 재시도 예산이 바닥나면 재시도하지 않음
+    - 재시도 횟수는 업스트림별로, 그리고 retry_tracking 안이면 요청별로도 집계
+    """
+
+    def __init__(self, name: str, base_delay: float, max_delay: float, budget: RetryBudget) -> None:
+        self.name = name
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self._retries = 0
+        self._budget_exhausted = 0
+
+    def backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def retry(self, attempt: int, breaker: CircuitBreaker | None = None) -> bool:
+        """attempt 번째 재시도를 해도 되는지 판단하고, 된다면 백오프만큼 기다린 뒤 True 반환"""
+        if breaker is not None and breaker.is_open:
+            return False
+        delay = self.backoff_delay(attempt)
+        if not has_budget(settings.deadline_min_retry_seconds + delay):
+            return False
+        if not self.budget.try_acquire():
+            self._budget_exhausted += 1
+            logger.warning(f"[{self.name}] 재시도 예산이 바닥나 재시도하지 않습니다.")
+            return False
+
+        self._retries += 1
+        request_retries = _request_retries.get()
+        if request_retries is not None:
+            request_retries.by_upstream[self.name] = request_retries.by_upstream.get(self.name, 0) + 1
+        await asyncio.sleep(delay)
+        return True
+
+    async def call(
+        self, func: Callable[[], Awaitable[T]], max_retries: int, breaker: CircuitBreaker | None = None
+    ) -> T:
+        """재시도 가능한 오류가 나면 정책에 따라 func 를 다시 호출 (마지막 오류는 그대로 전파)"""
+        attempt = 0
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                if attempt >= max_retries or not is_retryable(e) or not await self.retry(attempt, breaker):
+                    raise
+                attempt += 1
+                logger.warning(f"[{self.name}] 재시도 {attempt}/{max_retries}: {e}")
+
+    def stats(self) -> RetryPolicyStats:
+        return RetryPolicyStats(
+            name=self.name,
+            retries=self._retries,
+            budget_exhausted=self._budget_exhausted,
+            tokens=round(self.budget.tokens, 2),
+            capacity=self.budget.capacity,
+        )
+
+
+class RetryPolicyRegistry:
+    """Clova Studio 모델별, Clova OCR 용 재시도 정책과 요청별 재시도 집계를 보관"""
+
+    def __init__(self) -> None:
+        self._policies: dict[str, RetryPolicy] = {}
+        self._requests = 0
+        self._requests_with_retries = 0
+        self._total_retries = 0
+        self._max_retries_per_request = 0
+
+    def studio(self, url: str) -> RetryPolicy:
+        """Clova Studio 모델(URL 마지막 경로)별 재시도 정책"""
+        return self._get(f"clova-studio:{url.rstrip('/').rsplit('/', 1)[-1]}")
+
+    def ocr(self) -> RetryPolicy:
+        """Clova OCR 재시도 정책"""
+        return self._get("clova-ocr")
+
+    def _get(self, name: str) -> RetryPolicy:
+        if name not in self._policies:
+            self._policies[name] = RetryPolicy(
+                name,
+                base_delay=settings.retry_base_delay,
+                max_delay=settings.retry_max_delay,
+                budget=RetryBudget(
+                    capacity=settings.retry_budget_capacity,
+                    refill_per_second=settings.retry_budget_refill_per_second,
+                ),
+            )
+        return self._policies[name]
+
+    def record_request(self, retries: RequestRetries) -> None:
+        """요청 하나가 끝났을 때 그 요청이 사용한 재시도 횟수를 집계"""
+        self._requests += 1
+        if retries.total:
+            self._requests_with_retries += 1
+            self._total_retries += retries.total
+            self._max_retries_per_request = max(self._max_retries_per_request, retries.total)
+
+    def stats(self) -> list[RetryPolicyStats]:
+        return [policy.stats() for policy in self._policies.values()]
+
+    def request_stats(self) -> RequestRetryStats:
+        return RequestRetryStats(
+            requests=self._requests,
+            requests_with_retries=self._requests_with_retries,
+            total_retries=self._total_retries,
+            max_retries_per_request=self._max_retries_per_request,
+        )
+
+
+retry_policies = RetryPolicyRegistry()
@@ -1,10 +1,36 @@
+from functools import cached_property
+
 from ai.services.analysis.analyze_situation import Analyze
 from ai.services.generation.reply_seggestion import ReplySuggestion
 from ai.services.generation.title_suggestion import TitleSuggestion
-from ai.services.ocr.clova_ocr import ClovaOcr
+from ai.services.ocr.ocr_backend import OcrBackend, create_ocr_backend
+from app.core.settings import settings
+
+
+class ServiceRegistry:
+    """Clova 서비스를 처음 사용할 때 한 번만 생성해 공유 (import 시점에는 아무것도 만들지 않음)"""
+
+    @cached_property
+    def ocr(self) -> OcrBackend:
+        """settings.ocr_backend 로 고른 OCR 엔진 (clova / tesseract / fixture)"""
+        return create_ocr_backend(settings.ocr_backend)
+
+    @cached_property
+    def situation(self) -> Analyze:
+        return Analyze()
+
+    @cached_property
+    def reply(self) -> ReplySuggestion:
+        return ReplySuggestion()
+
+    @cached_property
+    def title(self) -> TitleSuggestion:
+        return TitleSuggestion()
+
+    async def close(self) -> None:
+        """앱 종료 시 서비스가 가진 클라이언트를 닫음 (생성되지 않은 서비스는 건너뜀)"""
+        if "ocr" in self.__dict__:
+            await self.ocr.close()
 
 
-ocr_service = ClovaOcr()
-situation_service = Analyze()
-reply_service = ReplySuggestion()
-title_service = TitleSuggestion()
+services = ServiceRegistry()
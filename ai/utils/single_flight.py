@@ -0,0 +1,112 @@
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+E = TypeVar("E")
+
+Emit = Callable[[E], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    name: str
+    leaders: int
+    coalesced: int
+    cancelled: int
+    in_flight: int
+    coalesce_rate: float
+
+
+class _Flight(Generic[T, E]):
+    def __init__(self) -> None:
+        self.task: asyncio.Task[T] | None = None
+        self.waiters = 0
+        self.events: list[E] = []
+        self.listeners: list[Emit[E]] = []
+
+    async def emit(self, event: E) -> None:
+        self.events.append(event)
+        for listener in list(self.listeners):
+            try:
+                await listener(event)
+            except Exception as e:
+                logger.error(f"single-flight 이벤트 전달 실패: {e}")
+
+
+def make_flight_key(scope: str, *parts: str | None) -> str:
+    """공백을 정규화한 입력과 범위(사용자)로 키 생성"""
+    normalized = [" ".join(part.split()) if part else "" for part in parts]
+    return hashlib.sha256(json.dumps([scope, *normalized], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class SingleFlight(Generic[T, E]):
+    """
+    같은 키로 동시에 들어온 요청이 하나의 실행을 공유하도록 묶는 도구
+
+    - 처음 들어온 요청(leader)만 func 를 실행하고, 뒤따라온 요청(follower)은 같은 결과를 받음
+    - func 가 emit 으로 보낸 이벤트는 모든 대기자의 on_event 로 전달 (늦게 합류하면 지난 이벤트부터 재전송)
+    - 모든 대기자가 취소되면 공유 중인 실행도 취소
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._flights: dict[str, _Flight[T, E]] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.cancelled = 0
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[Emit[E]], Coroutine[Any, Any, T]],
+        on_event: Emit[E] | None = None,
+    ) -> T:
+        flight = self._flights.get(key)
+        if flight is None or flight.task is None or flight.task.done():
+            flight = _Flight()
+            flight.task = asyncio.create_task(func(flight.emit))
+            self._flights[key] = flight
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+            logger.info(f"[{self.name}] 진행 중인 동일 요청에 합류 (대기자 {flight.waiters + 1}명)")
+
+        task = flight.task
+        flight.waiters += 1
+        if on_event is not None:
+            past_events = list(flight.events)
+            flight.listeners.append(on_event)
+
+        try:
+            if on_event is not None:
+                for event in past_events:
+                    await on_event(event)
+            return await asyncio.shield(task)
+        finally:
+            flight.waiters -= 1
+            if on_event is not None:
+                flight.listeners.remove(on_event)
+            if flight.waiters == 0:
+                if not task.done():
+                    task.cancel()
+                    self.cancelled += 1
+                    logger.info(f"[{self.name}] 모든 대기자가 떠나 공유 실행을 취소합니다.")
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    def stats(self) -> SingleFlightStats:
+        total = self.leaders + self.coalesced
+        return SingleFlightStats(
+            name=self.name,
+            leaders=self.leaders,
+            coalesced=self.coalesced,
+            cancelled=self.cancelled,
+            in_flight=len(self._flights),
+            coalesce_rate=round(self.coalesced / total, 4) if total else 0.0,
+        )
@@ -32,3 +32,15 @@ class ContentLength(Enum):
     MODERATE = "moderate"  # 적당함
     EXTEND = "long"  # 더 길게
     DEFAULT = ""
+
+
+class JobType(Enum):
+    GENERATE = "generate"
+    REGENERATE = "regenerate"
+
+
+class JobStatus(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
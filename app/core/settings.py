@@ -26,6 +26,100 @@ class Settings(BaseSettings):
 
     test_jwt_token: str | None = None
 
+    # Clova Studio 커넥션 풀 설정
+    clova_http_max_connections: int = 100
+    clova_http_max_keepalive_connections: int = 20
+    clova_http_keepalive_expiry: float = 30.0
+    clova_http2: bool = True
+
+    # 프롬프트 설정 파일 수정 시 자동 재로드 (개발용)
+    prompt_config_reload: bool = False
+
+    # 고정 시드 LLM 응답 캐시
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 1024
+    llm_cache_max_bytes: int = 8 * 1024 * 1024
+    llm_cache_ttl_seconds: float = 600.0
+    llm_cache_mongo: bool = False
+
+    # 생성 결과의 중복 문장 제거 (exact: 그대로 비교, normalized: 공백/문장부호 무시, fuzzy: 3-gram 유사도 이상이면 중복)
+    dedup_mode: str = "exact"
+    dedup_similarity_threshold: float = 0.85
+
+    # 이미지별 OCR 결과 캐시 (키 방식: sha256 은 같은 바이트만, phash 는 dHash 해밍 거리 이내의 다시 압축된 이미지도 적중)
+    ocr_cache_enabled: bool = True
+    ocr_cache_max_entries: int = 512
+    ocr_cache_max_bytes: int = 4 * 1024 * 1024
+    ocr_cache_ttl_seconds: float = 3600.0
+    ocr_cache_mongo: bool = False
+    ocr_cache_key_mode: str = "sha256"
+    # 같은 스크린샷을 다시 압축하거나 줄이면 1024비트 중 10비트 안팎이 달라지고, 다른 대화는 100비트 이상 달라짐
+    ocr_cache_phash_max_distance: int = 8
+
+    # OCR 엔진 (clova: Clova OCR API, tesseract: 로컬 tesseract 실행 파일, fixture: 저장된 Clova 응답 JSON)
+    ocr_backend: str = "clova"
+    ocr_tesseract_command: str = "tesseract"
+    ocr_tesseract_lang: str = "kor+eng"
+    ocr_tesseract_timeout: float = 30.0
+    # 이름/sha256 으로 찾지 못한 이미지에 쓸 픽스처 (비어 있으면 픽스처가 없을 때 예외 발생)
+    ocr_fixture_dir: str = "test/assets"
+    ocr_fixture_default: str = ""
+
+    # OCR 필드 좌표로 "A:/B:" 대화록 생성 (신뢰도 미만 필드는 제외)
+    ocr_layout_transcript: bool = True
+    ocr_min_confidence: float = 0.5
+
+    # OCR 업로드 전 이미지 처리 (긴 변 최대 픽셀, 다시 인코딩할 포맷과 품질)
+    ocr_image_max_side: int = 2048
+    ocr_image_format: str = "AUTO"
+    ocr_image_quality: int = 85
+
+    # 이미지 전처리 CPU 실행기 (thread | process, 실행 중 + 대기 작업이 workers + max_queue 를 넘으면 대기 후 거절)
+    cpu_executor_kind: str = "thread"
+    cpu_executor_workers: int = 4
+    cpu_executor_max_queue: int = 16
+    cpu_executor_queue_timeout: float = 5.0
+
+    # Clova 업스트림 동시 요청 제한 (AIMD)
+    clova_studio_max_concurrency: int = 16
+    clova_ocr_max_concurrency: int = 8
+    clova_limiter_min_concurrency: int = 1
+    clova_limiter_queue_timeout: float = 10.0
+    clova_studio_latency_target: float = 15.0
+    clova_ocr_latency_target: float = 5.0
+
+    # Clova 업스트림 회로 차단기
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_recovery_timeout: float = 30.0
+    circuit_breaker_probe: bool = True
+
+    # 비동기 생성 작업 (워커 풀, 리스 기반 회수)
+    job_worker_concurrency: int = 4
+    job_lease_seconds: float = 60.0
+    job_poll_interval: float = 1.0
+    job_max_attempts: int = 3
+    job_stream_poll_interval: float = 0.5
+    job_stream_max_seconds: float = 300.0
+
+    # 요청 마감 시간 (헤더로 더 짧게 지정 가능, 남은 시간이 min_retry 보다 적으면 재시도하지 않음)
+    request_deadline_seconds: float = 45.0
+    request_deadline_max_seconds: float = 120.0
+    request_deadline_header: str = "X-Request-Deadline"
+    deadline_min_retry_seconds: float = 3.0
+
+    # 업스트림 재시도 (full jitter 지수 백오프, 업스트림별 토큰 버킷 예산)
+    # Clova Studio 호출은 연결/타임아웃, 5xx, 408/429, 스트림 error 이벤트만 clova_studio_max_retries 번까지 재시도
+    clova_studio_max_retries: int = 1
+    retry_base_delay: float = 0.2
+    retry_max_delay: float = 2.0
+    retry_budget_capacity: float = 10.0
+    retry_budget_refill_per_second: float = 1.0
+
+    # 이미지 분석 직후 글 제안 예측 생성 (max_concurrency 가 0이면 비활성화)
+    speculation_ttl_seconds: float = 120.0
+    speculation_max_entries: int = 256
+    speculation_max_concurrency: int = 4
+
     # 추가해야 할 필드들
     host: str
     api_key: str
@@ -0,0 +1,163 @@
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any
+
+import pymongo
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+
+from app.core.enums import JobStatus
+from app.job.job_document import JobDocument, JobDTO, JobEvent
+from app.utils.models.suggestion import Suggestion
+from app.utils.mongo import db
+
+
+class JobCollection:
+    """MongoDB `jobs` 컬렉션을 관리하는 클래스 (워커는 리스를 잡은 작업만 갱신)"""
+
+    _collection = db["jobs"]
+
+    @classmethod
+    async def set_index(cls) -> None:
+        """필요한 인덱스 설정"""
+        await cls._collection.create_index([("status", pymongo.ASCENDING), ("created_at", pymongo.ASCENDING)])
+        await cls._collection.create_index([("lease_expires_at", pymongo.ASCENDING)])
+
+    @classmethod
+    async def create(cls, job_dto: JobDTO) -> JobDocument:
+        """MongoDB에 작업 저장 후 문서 반환"""
+        result = await cls._collection.insert_one(asdict(job_dto))
+        return cls._to_document({**asdict(job_dto), "_id": result.inserted_id})
+
+    @classmethod
+    async def get_by_id(cls, job_id: str) -> JobDocument | None:
+        """ID를 기반으로 작업 조회 (잘못된 ID 면 None)"""
+        try:
+            data = await cls._collection.find_one({"_id": ObjectId(job_id)})
+        except InvalidId:
+            return None
+        return cls._to_document(data) if data else None
+
+    @classmethod
+    async def claim(cls, worker_id: str, lease_seconds: float, max_attempts: int) -> JobDocument | None:
+        """
+        대기 중이거나 리스가 만료된 작업 하나를 가져와 리스를 잡음
+
+        워커가 죽어 리스가 만료된 작업은 다른 워커가 다시 가져가며,
+        max_attempts 번 시도한 작업은 실패 처리
+        """
+        now = datetime.now()
+        await cls._collection.update_many(
+            {
+                "status": JobStatus.RUNNING.value,
+                "lease_expires_at": {"$lt": now},
+                "attempts": {"$gte": max_attempts},
+            },
+            {
+                "$set": {
+                    "status": JobStatus.FAILED.value,
+                    "error": "작업 시도 횟수를 초과했습니다.",
+                    "lease_owner": None,
+                    "updated_at": now,
+                }
+            },
+        )
+
+        data = await cls._collection.find_one_and_update(
+            {
+                "$or": [
+                    {"status": JobStatus.PENDING.value},
+                    {"status": JobStatus.RUNNING.value, "lease_expires_at": {"$lt": now}},
+                ],
+                "attempts": {"$lt": max_attempts},
+            },
+            {
+                "$set": {
+                    "status": JobStatus.RUNNING.value,
+                    "lease_owner": worker_id,
+                    "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                    # 재시도는 처음부터 다시 생성하므로 이전 진행 상황은 비움
+                    "events": [],
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", pymongo.ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        return cls._to_document(data) if data else None
+
+    @classmethod
+    async def renew_lease(cls, job_id: ObjectId, worker_id: str, lease_seconds: float) -> bool:
+        """리스 연장 (다른 워커가 회수했으면 False)"""
+        now = datetime.now()
+        result = await cls._collection.update_one(
+            {"_id": job_id, "lease_owner": worker_id, "status": JobStatus.RUNNING.value},
+            {"$set": {"lease_expires_at": now + timedelta(seconds=lease_seconds), "updated_at": now}},
+        )
+        return result.modified_count > 0
+
+    @classmethod
+    async def push_event(cls, job_id: ObjectId, worker_id: str, event: JobEvent) -> None:
+        """완성된 제목/답장을 진행 상황에 추가"""
+        await cls._collection.update_one(
+            {"_id": job_id, "lease_owner": worker_id},
+            {"$push": {"events": asdict(event)}, "$set": {"updated_at": datetime.now()}},
+        )
+
+    @classmethod
+    async def complete(cls, job_id: ObjectId, worker_id: str, result: list[Suggestion]) -> bool:
+        """작업 성공 처리"""
+        return await cls._finish(
+            job_id, worker_id, {"status": JobStatus.SUCCEEDED.value, "result": [asdict(item) for item in result]}
+        )
+
+    @classmethod
+    async def fail(cls, job_id: ObjectId, worker_id: str, error: str) -> bool:
+        """작업 실패 처리"""
+        return await cls._finish(job_id, worker_id, {"status": JobStatus.FAILED.value, "error": error})
+
+    @classmethod
+    async def release(cls, job_id: ObjectId, worker_id: str) -> bool:
+        """종료 중인 워커가 작업을 대기 상태로 되돌림 (시도 횟수는 차감)"""
+        result = await cls._collection.update_one(
+            {"_id": job_id, "lease_owner": worker_id, "status": JobStatus.RUNNING.value},
+            {
+                "$set": {
+                    "status": JobStatus.PENDING.value,
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "updated_at": datetime.now(),
+                },
+                "$inc": {"attempts": -1},
+            },
+        )
+        return result.modified_count > 0
+
+    @classmethod
+    async def _finish(cls, job_id: ObjectId, worker_id: str, fields: dict[str, Any]) -> bool:
+        result = await cls._collection.update_one(
+            {"_id": job_id, "lease_owner": worker_id},
+            {"$set": {**fields, "lease_owner": None, "lease_expires_at": None, "updated_at": datetime.now()}},
+        )
+        return result.modified_count > 0
+
+    @staticmethod
+    def _to_document(data: dict[Any, Any]) -> JobDocument:
+        result = data.get("result")
+        return JobDocument(
+            user_id=data.get("user_id"),
+            job_type=data["job_type"],
+            status=data["status"],
+            params=data["params"],
+            events=[JobEvent(**event) for event in data.get("events", [])],
+            result=[Suggestion(**item) for item in result] if result is not None else None,
+            error=data.get("error"),
+            attempts=data.get("attempts", 0),
+            lease_owner=data.get("lease_owner"),
+            lease_expires_at=data.get("lease_expires_at"),
+            updated_at=data["updated_at"],
+            created_at=data["created_at"],
+            _id=data["_id"],
+        )
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+
+from app.utils.models.base_document import BaseDocument
+from app.utils.models.suggestion import Suggestion
+
+
+@dataclass(kw_only=True)
+class JobEvent:
+    """작업 진행 중 완성된 제목(kind="title") 또는 답장(kind="reply")"""
+
+    kind: str
+    index: int
+    content: str
+
+
+@dataclass
+class JobDocument(BaseDocument):
+    user_id: ObjectId | None
+    job_type: str
+    status: str
+    params: dict[str, Any]
+    events: list[JobEvent]
+    result: list[Suggestion] | None
+    error: str | None
+    attempts: int
+    lease_owner: str | None
+    lease_expires_at: datetime | None
+    updated_at: datetime
+    created_at: datetime
+
+
+@dataclass(kw_only=True)
+class JobDTO:
+    user_id: ObjectId | None
+    job_type: str
+    status: str
+    params: dict[str, Any]
+    updated_at: datetime
+    created_at: datetime
+    events: list[JobEvent] = field(default_factory=list)
+    result: list[Suggestion] | None = None
+    error: str | None = None
+    attempts: int = 0
+    lease_owner: str | None = None
+    lease_expires_at: datetime | None = None
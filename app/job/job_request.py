@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+from app.suggester.suggester_request import GenerateSuggestionRequest, RegenerateSuggestionRequest
+
+
+class CreateJobRequest(BaseModel):
+    """generate 또는 regenerate 중 하나만 지정"""
+
+    generate: GenerateSuggestionRequest | None = None
+    regenerate: RegenerateSuggestionRequest | None = None
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.core.enums import JobStatus, JobType
+from app.suggester.suggester_response import GenerateSuggestionsResponse
+
+
+class CreateJobResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    job_type: JobType
+    status: JobStatus
+    attempts: int
+    titles: list[str]
+    replies: list[str]
+    result: GenerateSuggestionsResponse | None
+    error: str | None
+    updated_at: datetime
+    created_at: datetime
+
+
+class JobStatusEvent(BaseModel):
+    status: JobStatus
+    attempts: int
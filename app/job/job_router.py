@@ -0,0 +1,98 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from loguru import logger
+
+from app.core.enums import JobStatus
+from app.core.settings import settings
+from app.job.job_collection import JobCollection
+from app.job.job_request import CreateJobRequest
+from app.job.job_response import CreateJobResponse, JobResponse, JobStatusEvent
+from app.job.job_service import JobService
+from app.job.job_worker import job_worker_pool
+from app.suggester.suggester_response import StreamErrorEvent, SuggestionStreamEvent
+from app.user.user_document import UserDocument
+from app.utils.jwt_handler import JwtHandler
+from app.utils.sse import SSE_HEADERS, sse_event
+
+router = APIRouter(prefix="/suggester/jobs", tags=["job"])
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value)
+
+
+@router.post("", status_code=202, response_model=CreateJobResponse, summary="글 생성 작업을 대기열에 추가")
+async def create_job(
+    request: CreateJobRequest,
+    user: UserDocument | None = Depends(JwtHandler.get_optional_current_user),  # ✅ JWT 인증된 사용자
+) -> CreateJobResponse:
+    job = await JobService.create_job(user, request)
+    job_worker_pool.notify()
+    logger.info(f"Created job {job.id} - User: {user.nickname if user else 'Guest'}, Type: {job.job_type}")
+    return CreateJobResponse(job_id=str(job.id), status=JobStatus(job.status))
+
+
+@router.get("/{job_id}", response_model=JobResponse, summary="글 생성 작업의 진행 상황과 결과 조회")
+async def get_job(
+    job_id: str,
+    user: UserDocument | None = Depends(JwtHandler.get_optional_current_user),  # ✅ JWT 인증된 사용자
+) -> JobResponse:
+    job = await JobService.get_job(job_id, user)
+    return JobService.to_response(job)
+
+
+async def _stream_job(job_id: str) -> AsyncIterator[str]:
+    """
+    작업 문서를 주기적으로 조회해 새로 완성된 제목/답장과 상태 변화를 이벤트로 전송
+
+    job_stream_max_seconds 가 지나도 끝나지 않으면(워커가 없는 경우 등) 504 error 이벤트를 보내고 종료
+    """
+    sent_events = 0
+    last_status: tuple[str, int] | None = None
+    stream_deadline = time.monotonic() + settings.job_stream_max_seconds
+    while True:
+        job = await JobCollection.get_by_id(job_id)
+        if job is None:
+            yield sse_event("error", StreamErrorEvent(status_code=404, detail="Job not found"))
+            return
+
+        if (job.status, job.attempts) != last_status:
+            last_status = (job.status, job.attempts)
+            # 재시도가 시작되면 처음부터 다시 생성하므로 진행 상황도 처음부터 다시 전송
+            sent_events = 0
+            yield sse_event("status", JobStatusEvent(status=JobStatus(job.status), attempts=job.attempts))
+
+        for event in job.events[sent_events:]:
+            yield sse_event(event.kind, SuggestionStreamEvent(index=event.index, content=event.content))
+        sent_events = len(job.events)
+
+        if job.status in FINISHED_STATUSES:
+            response = JobService.to_response(job)
+            if response.result is not None:
+                yield sse_event("result", response.result)
+            else:
+                yield sse_event("error", StreamErrorEvent(status_code=500, detail=job.error or "Job failed"))
+            return
+
+        if time.monotonic() >= stream_deadline:
+            logger.warning(f"작업 스트림 최대 시간 초과: {job_id} ({job.status})")
+            yield sse_event("error", StreamErrorEvent(status_code=504, detail="Job stream timed out"))
+            return
+
+        await asyncio.sleep(settings.job_stream_poll_interval)
+
+
+@router.get(
+    "/{job_id}/stream",
+    summary="글 생성 작업의 SSE 버전 - status/title/reply 이벤트와 마지막 result(또는 error) 이벤트 전송",
+    response_class=StreamingResponse,
+)
+async def stream_job(
+    job_id: str,
+    user: UserDocument | None = Depends(JwtHandler.get_optional_current_user),  # ✅ JWT 인증된 사용자
+) -> StreamingResponse:
+    # 권한 확인은 스트림을 열기 전에 수행
+    await JobService.get_job(job_id, user)
+    return StreamingResponse(_stream_job(job_id), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+from fastapi import HTTPException
+
+from ai.services.agent.orchestrator_agent import OnSuggestionEvent
+from app.core.enums import JobStatus, JobType
+from app.history.history_service import HistoryService
+from app.job.job_collection import JobCollection
+from app.job.job_document import JobDocument, JobDTO
+from app.job.job_request import CreateJobRequest
+from app.job.job_response import JobResponse
+from app.suggester.suggester_response import GenerateSuggestion, GenerateSuggestionsResponse
+from app.suggester.suggester_service import SuggesterService
+from app.user.user_document import UserDocument
+from app.utils.models.suggestion import Suggestion
+
+
+class JobService:
+
+    @staticmethod
+    async def create_job(user: UserDocument | None, request: CreateJobRequest) -> JobDocument:
+        """생성 작업을 대기열에 추가"""
+        if request.generate is not None and request.regenerate is None:
+            job_type = JobType.GENERATE
+            params = request.generate.model_dump(mode="json")
+        elif request.regenerate is not None and request.generate is None:
+            job_type = JobType.REGENERATE
+            params = request.regenerate.model_dump(mode="json")
+        else:
+            raise HTTPException(status_code=400, detail="Exactly one of generate or regenerate is required")
+
+        job_dto = JobDTO(
+            user_id=user.id if user else None,
+            job_type=job_type.value,
+            status=JobStatus.PENDING.value,
+            params=params,
+            updated_at=datetime.now(),
+            created_at=datetime.now(),
+        )
+        return await JobCollection.create(job_dto)
+
+    @staticmethod
+    async def get_job(job_id: str, user: UserDocument | None) -> JobDocument:
+        """작업 조회 (로그인 사용자가 만든 작업은 본인만 조회 가능)"""
+        job = await JobCollection.get_by_id(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if job.user_id is not None and (user is None or user.id != job.user_id):
+            raise HTTPException(status_code=403, detail="Access denied")
+        return job
+
+    @staticmethod
+    async def run_job(job: JobDocument, on_event: OnSuggestionEvent) -> list[Suggestion]:
+        """작업 파라미터로 글 제안을 생성하고 히스토리에 저장"""
+        params = job.params
+        if job.job_type == JobType.GENERATE.value:
+            response = await SuggesterService.generate_suggestions(
+                situation=params["situation"],
+                tone=params["tone"],
+                usage=params["usage"],
+                detail=params["detail"],
+                on_event=on_event,
+                user_id=job.user_id,
+            )
+        else:
+            response = await SuggesterService.regenerate_suggestions(
+                exist_suggestion=params["exist_suggestion"],
+                length=params["length"],
+                detail=params["detail"],
+                on_event=on_event,
+                user_id=job.user_id,
+            )
+
+        result = [
+            Suggestion(title=title, content=suggestion)
+            for title, suggestion in zip(response.titles, response.suggestions)
+        ]
+        if job.user_id is not None:
+            await HistoryService.create_history(job.user_id, result)
+        return result
+
+    @staticmethod
+    def to_response(job: JobDocument) -> JobResponse:
+        """작업 문서를 응답으로 변환 (진행 중이면 지금까지 완성된 제목/답장 포함)"""
+        events = sorted(job.events, key=lambda event: event.index)
+        result = (
+            GenerateSuggestionsResponse(
+                suggestions=[GenerateSuggestion(title=item.title, content=item.content) for item in job.result]
+            )
+            if job.result is not None
+            else None
+        )
+        return JobResponse(
+            job_id=str(job.id),
+            job_type=JobType(job.job_type),
+            status=JobStatus(job.status),
+            attempts=job.attempts,
+            titles=[event.content for event in events if event.kind == "title"],
+            replies=[event.content for event in events if event.kind == "reply"],
+            result=result,
+            error=job.error,
+            updated_at=job.updated_at,
+            created_at=job.created_at,
+        )
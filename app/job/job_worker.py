@@ -0,0 +1,131 @@
+import asyncio
+import os
+import socket
+import uuid
+from typing import Any
+
+from loguru import logger
+
+from ai.services.agent.orchestrator_agent import SuggestionEvent
+from ai.utils.deadline import deadline_scope
+from app.core.settings import settings
+from app.job.job_collection import JobCollection
+from app.job.job_document import JobDocument, JobEvent
+from app.job.job_service import JobService
+
+
+class JobWorkerPool:
+    """
+    MongoDB 의 생성 작업을 처리하는 프로세스 내 워커 풀
+
+    - concurrency 개의 워커가 리스를 잡고 작업을 하나씩 처리
+    - 처리 중에는 lease_seconds / 3 마다 리스를 연장하고, 연장에 실패하면(다른 워커가 회수) 작업을 취소
+    - 프로세스가 죽으면 리스가 만료된 뒤 다른 워커(또는 재시작된 워커)가 작업을 다시 가져감
+    """
+
+    def __init__(self, concurrency: int, lease_seconds: float, poll_interval: float, max_attempts: int) -> None:
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.pool_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._workers: list[asyncio.Task[None]] = []
+        self._wakeup = asyncio.Event()
+
+    async def start(self) -> None:
+        """앱 시작 시 워커 실행"""
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker_loop(f"{self.pool_id}-{index}"), name=f"job-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+        logger.info(f"작업 워커 {self.concurrency}개 시작 ({self.pool_id})")
+
+    async def stop(self) -> None:
+        """앱 종료 시 워커 종료 (처리 중이던 작업은 대기 상태로 되돌림)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("작업 워커 종료")
+
+    def notify(self) -> None:
+        """새 작업이 추가되었음을 알려 대기 중인 워커를 바로 깨움"""
+        self._wakeup.set()
+
+    async def _worker_loop(self, worker_id: str) -> None:
+        while True:
+            try:
+                job = await JobCollection.claim(worker_id, self.lease_seconds, self.max_attempts)
+            except Exception as e:
+                logger.error(f"[{worker_id}] 작업 조회 실패: {e}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            try:
+                await self._run(worker_id, job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 리스 연장/완료/실패 기록 중 오류가 나도 워커는 계속 동작 (리스가 만료되면 다른 워커가 다시 처리)
+                logger.exception(f"[{worker_id}] 작업 처리 중 오류 발생: {job.id} - {e}")
+
+    async def _run(self, worker_id: str, job: JobDocument) -> None:
+        logger.info(f"[{worker_id}] 작업 시작: {job.id} ({job.job_type}, 시도 {job.attempts})")
+
+        async def on_event(event: SuggestionEvent) -> None:
+            await JobCollection.push_event(
+                job.id, worker_id, JobEvent(kind=event.kind, index=event.index, content=event.content)
+            )
+
+        with deadline_scope(settings.request_deadline_seconds):
+            work = asyncio.create_task(JobService.run_job(job, on_event))
+        try:
+            while not work.done():
+                await asyncio.wait({work}, timeout=self.lease_seconds / 3)
+                if not work.done() and not await JobCollection.renew_lease(job.id, worker_id, self.lease_seconds):
+                    logger.warning(f"[{worker_id}] 리스를 잃어 작업을 중단합니다: {job.id}")
+                    return
+        except asyncio.CancelledError:
+            await self._cancel(work)
+            await JobCollection.release(job.id, worker_id)
+            raise
+        finally:
+            # 어떤 경로로 빠져나가든 작업이 리스 없이 계속 실행되지 않도록 취소
+            await self._cancel(work)
+
+        if work.cancelled():
+            logger.error(f"[{worker_id}] 작업이 취소되었습니다: {job.id}")
+            await JobCollection.fail(job.id, worker_id, "cancelled")
+            return
+        try:
+            result = work.result()
+        except Exception as e:
+            logger.error(f"[{worker_id}] 작업 실패: {job.id} - {e}")
+            await JobCollection.fail(job.id, worker_id, str(e) or type(e).__name__)
+            return
+
+        await JobCollection.complete(job.id, worker_id, result)
+        logger.info(f"[{worker_id}] 작업 완료: {job.id}")
+
+    @staticmethod
+    async def _cancel(work: "asyncio.Task[Any]") -> None:
+        """작업이 끝나지 않았으면 취소하고 정리될 때까지 기다림"""
+        if not work.done():
+            work.cancel()
+        await asyncio.gather(work, return_exceptions=True)
+
+
+job_worker_pool = JobWorkerPool(
+    concurrency=settings.job_worker_concurrency,
+    lease_seconds=settings.job_lease_seconds,
+    poll_interval=settings.job_poll_interval,
+    max_attempts=settings.job_max_attempts,
+)
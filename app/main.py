@@ -5,17 +5,37 @@ from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+from ai.utils.circuit_breaker import circuit_breakers
+from ai.utils.clova_http import clova_http
+from ai.utils.cpu_executor import image_executor
+from ai.utils.get_headers_payloads import prompt_configs
+from ai.utils.services import services
 from app.auth.auth_router import router as auth_router
 from app.suggester.suggester_router import router as analyze_router
 from app.history.history_router import router as history_router
+from app.job.job_router import router as job_router
+from app.job.job_worker import job_worker_pool
+from app.monitoring.monitoring_router import router as monitoring_router
+from app.suggester.suggestion_speculator import suggestion_speculator
 from app.core.settings import settings
 from app.utils import mongo
+from app.utils.deadline_middleware import DeadlineMiddleware
+from app.utils.retry_tracking_middleware import RetryTrackingMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await mongo.set_indexes()
+    prompt_configs.load_all()
+    await clova_http.start()
+    await job_worker_pool.start()
     yield
+    await job_worker_pool.stop()
+    await suggestion_speculator.close()
+    await circuit_breakers.close()
+    await services.close()
+    await clova_http.close()
+    image_executor.shutdown()
 
 
 # ✅ Lifespan을 FastAPI에 연결하여 사용
@@ -25,6 +45,8 @@ app = FastAPI(lifespan=lifespan)
 app.include_router(auth_router)
 app.include_router(analyze_router)
 app.include_router(history_router)
+app.include_router(job_router)
+app.include_router(monitoring_router)
 
 # ✅ CORS 미들웨어 추가
 app.add_middleware(
@@ -35,6 +57,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 요청 마감 시간 미들웨어 추가
+app.add_middleware(DeadlineMiddleware)
+
+# ✅ 요청별 재시도 집계 미들웨어 추가
+app.add_middleware(RetryTrackingMiddleware)
+
 # ✅ SessionMiddleware 추가
 app.add_middleware(
     SessionMiddleware,
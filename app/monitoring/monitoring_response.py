@@ -0,0 +1,116 @@
+from pydantic import BaseModel
+
+
+class HttpPoolStatsResponse(BaseModel):
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    open_connections: int
+    idle_connections: int
+    total_requests: int
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    l2_hits: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class CpuExecutorStatsResponse(BaseModel):
+    name: str
+    kind: str
+    max_workers: int
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+    avg_queue_wait_ms: float
+    max_queue_wait_ms: float
+    avg_cpu_ms: float
+    total_cpu_ms: float
+
+
+class ImagePreprocessStatsResponse(BaseModel):
+    images: int
+    reencoded: int
+    bytes_in: int
+    bytes_out: int
+    bytes_saved: int
+
+
+class OcrMergeStatsResponse(BaseModel):
+    requests: int
+    images: int
+    duplicate_images: int
+    overlaps: int
+    chars_in: int
+    chars_saved: int
+
+
+class LimiterStatsResponse(BaseModel):
+    name: str
+    limit: float
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+    acquired: int
+    timeouts: int
+    overloads: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class CircuitBreakerStatsResponse(BaseModel):
+    name: str
+    state: str
+    consecutive_failures: int
+    failures: int
+    successes: int
+    rejected: int
+    opened: int
+    probes: int
+
+
+class SingleFlightStatsResponse(BaseModel):
+    name: str
+    leaders: int
+    coalesced: int
+    cancelled: int
+    in_flight: int
+    coalesce_rate: float
+
+
+class RetryPolicyStatsResponse(BaseModel):
+    name: str
+    retries: int
+    budget_exhausted: int
+    tokens: float
+    capacity: float
+
+
+class RequestRetryStatsResponse(BaseModel):
+    requests: int
+    requests_with_retries: int
+    total_retries: int
+    max_retries_per_request: int
+
+
+class RetryStatsResponse(BaseModel):
+    policies: list[RetryPolicyStatsResponse]
+    requests: RequestRetryStatsResponse
+
+
+class SpeculationStatsResponse(BaseModel):
+    started: int
+    skipped: int
+    completed: int
+    failed: int
+    hits: int
+    misses: int
+    in_flight: int
+    entries: int
+    hit_rate: float
+    waste_rate: float
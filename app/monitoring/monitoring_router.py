@@ -0,0 +1,94 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+
+from ai.services.agent.agent_registry import agents
+from ai.utils.circuit_breaker import circuit_breakers
+from ai.utils.clova_http import clova_http
+from ai.utils.cpu_executor import image_executor
+from ai.utils.concurrency_limiter import upstream_limiters
+from ai.utils.llm_cache import llm_cache
+from ai.utils.ocr_cache import ocr_cache
+from ai.utils.retry_policy import retry_policies
+from app.monitoring.monitoring_response import (
+    CacheStatsResponse,
+    CircuitBreakerStatsResponse,
+    CpuExecutorStatsResponse,
+    HttpPoolStatsResponse,
+    ImagePreprocessStatsResponse,
+    LimiterStatsResponse,
+    OcrMergeStatsResponse,
+    RequestRetryStatsResponse,
+    RetryPolicyStatsResponse,
+    RetryStatsResponse,
+    SingleFlightStatsResponse,
+    SpeculationStatsResponse,
+)
+from app.suggester.suggester_service import SuggesterService
+from app.suggester.suggestion_speculator import suggestion_speculator
+
+router = APIRouter(prefix="/monitoring", tags=["monitoring"])
+
+
+@router.get("/http-pool", response_model=HttpPoolStatsResponse, summary="Clova Studio 커넥션 풀 사용 현황")
+async def get_http_pool_stats() -> HttpPoolStatsResponse:
+    return HttpPoolStatsResponse(**asdict(clova_http.stats()))
+
+
+@router.get("/llm-cache", response_model=CacheStatsResponse, summary="LLM 응답 캐시 적중률")
+async def get_llm_cache_stats() -> CacheStatsResponse:
+    return CacheStatsResponse(**asdict(llm_cache.stats()))
+
+
+@router.get("/ocr-cache", response_model=CacheStatsResponse, summary="OCR 결과 캐시 적중률")
+async def get_ocr_cache_stats() -> CacheStatsResponse:
+    return CacheStatsResponse(**asdict(ocr_cache.stats()))
+
+
+@router.get("/limiters", response_model=list[LimiterStatsResponse], summary="업스트림 동시 요청 제한기 현황")
+async def get_limiter_stats() -> list[LimiterStatsResponse]:
+    return [LimiterStatsResponse(**asdict(stats)) for stats in upstream_limiters.stats()]
+
+
+@router.get("/circuit-breakers", response_model=list[CircuitBreakerStatsResponse], summary="업스트림 회로 차단기 상태")
+async def get_circuit_breaker_stats() -> list[CircuitBreakerStatsResponse]:
+    return [CircuitBreakerStatsResponse(**asdict(stats)) for stats in circuit_breakers.stats()]
+
+
+@router.get("/single-flight", response_model=list[SingleFlightStatsResponse], summary="동일 생성 요청 합치기 현황")
+async def get_single_flight_stats() -> list[SingleFlightStatsResponse]:
+    return [SingleFlightStatsResponse(**asdict(stats)) for stats in SuggesterService.flight_stats()]
+
+
+@router.get("/retries", response_model=RetryStatsResponse, summary="업스트림별 재시도/예산 현황과 요청별 재시도 횟수")
+async def get_retry_stats() -> RetryStatsResponse:
+    return RetryStatsResponse(
+        policies=[RetryPolicyStatsResponse(**asdict(stats)) for stats in retry_policies.stats()],
+        requests=RequestRetryStatsResponse(**asdict(retry_policies.request_stats())),
+    )
+
+
+@router.get("/speculation", response_model=SpeculationStatsResponse, summary="글 제안 예측 생성 적중률 및 낭비율")
+async def get_speculation_stats() -> SpeculationStatsResponse:
+    return SpeculationStatsResponse(**asdict(suggestion_speculator.stats()))
+
+
+@router.get(
+    "/image-preprocess", response_model=ImagePreprocessStatsResponse, summary="OCR 업로드 전 이미지 처리로 줄인 바이트"
+)
+async def get_image_preprocess_stats() -> ImagePreprocessStatsResponse:
+    return ImagePreprocessStatsResponse(**asdict(agents.ocr.preprocessor.stats()))
+
+
+@router.get(
+    "/ocr-merge", response_model=OcrMergeStatsResponse, summary="연속 스크린샷 OCR 텍스트 병합으로 줄인 글자 수"
+)
+async def get_ocr_merge_stats() -> OcrMergeStatsResponse:
+    return OcrMergeStatsResponse(**asdict(agents.ocr.merger.stats()))
+
+
+@router.get(
+    "/cpu-executor", response_model=CpuExecutorStatsResponse, summary="이미지 전처리 실행기 대기 시간 및 CPU 시간"
+)
+async def get_cpu_executor_stats() -> CpuExecutorStatsResponse:
+    return CpuExecutorStatsResponse(**asdict(image_executor.stats()))
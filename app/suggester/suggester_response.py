@@ -20,6 +20,21 @@ class GenerateSuggestionsResponse(BaseModel):
     suggestions: list[GenerateSuggestion]
 
 
+class AnalyzeAndGenerateResponse(BaseModel):
+    analysis: AnalyzeImagesConversationResponse
+    suggestions: list[GenerateSuggestion]
+
+
+class SuggestionStreamEvent(BaseModel):
+    index: int
+    content: str
+
+
+class StreamErrorEvent(BaseModel):
+    status_code: int
+    detail: str
+
+
 class SuggestionResponse(BaseModel):
     id: str
     title: str
@@ -1,8 +1,14 @@
-from typing import Optional
+import asyncio
+from collections.abc import AsyncIterator, Callable, Coroutine
+from typing import Any, Optional
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form, Query
+from fastapi.responses import StreamingResponse
 
 from ai.glee_agent import GleeAgent
+from ai.services.agent.orchestrator_agent import OnSuggestionEvent, SuggestionEvent
+from ai.utils.cpu_executor import CpuExecutorBusyError
+from ai.utils.ocr_cache import ocr_cache_scope
 from app.history.history_service import HistoryService
 from app.suggester.suggester_request import (
     GenerateSuggestionRequest,
@@ -11,6 +17,7 @@ from app.suggester.suggester_request import (
     RegenerateSuggestionRequest,
 )
 from app.suggester.suggester_response import (
+    AnalyzeAndGenerateResponse,
     AnalyzeImagesConversationResponse,
     SuggestionResponse,
     DeleteSuggestionResponse,
@@ -19,17 +26,71 @@ from app.suggester.suggester_response import (
     SuggestionsResponse,
     SearchSuggestionResponse,
     GetSuggestionCounts,
+    StreamErrorEvent,
+    SuggestionStreamEvent,
 )
 from app.core.enums import PurposeType
+from app.suggester.suggester_dto import AiSuggestionDto
 from app.suggester.suggester_service import SuggesterService
+from app.suggester.suggestion_speculator import suggestion_speculator
 from app.user.user_document import UserDocument
 from app.utils.jwt_handler import JwtHandler
 from app.utils.models.suggestion import Suggestion
+from app.utils.sse import SSE_HEADERS, sse_event
 from loguru import logger
 
 router = APIRouter(prefix="/suggester", tags=["suggester"])
 
 
+def _to_generate_suggestions(response: AiSuggestionDto) -> list[GenerateSuggestion]:
+    return [
+        GenerateSuggestion(title=title, content=suggestion)
+        for title, suggestion in zip(response.titles, response.suggestions)
+    ]
+
+
+async def _save_history(user: UserDocument | None, result: list[GenerateSuggestion]) -> None:
+    if user:
+        _suggestions = [Suggestion(title=suggestion.title, content=suggestion.content) for suggestion in result]
+        await HistoryService.create_history(user.id, _suggestions)
+
+
+async def _stream_suggestions(
+    generate: Callable[[OnSuggestionEvent], Coroutine[Any, Any, AiSuggestionDto]], user: UserDocument | None
+) -> AsyncIterator[str]:
+    """
+    제목/답장이 완성될 때마다 title/reply 이벤트를 보내고, 마지막에 result 이벤트로 전체 응답을 보냄
+
+    히스토리는 모든 생성이 끝난 뒤 저장하고, 클라이언트 연결이 끊기면 생성 작업을 취소
+    """
+    queue: asyncio.Queue[SuggestionEvent | None] = asyncio.Queue()
+
+    async def on_event(event: SuggestionEvent) -> None:
+        await queue.put(event)
+
+    task = asyncio.create_task(generate(on_event))
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while (event := await queue.get()) is not None:
+            yield sse_event(event.kind, SuggestionStreamEvent(index=event.index, content=event.content))
+        response = await task
+    except HTTPException as e:
+        yield sse_event("error", StreamErrorEvent(status_code=e.status_code, detail=str(e.detail)))
+        return
+    except Exception as e:
+        logger.error(f"Failed to stream suggestions - User: {user.nickname if user else 'Guest'}, Error: {e}")
+        yield sse_event("error", StreamErrorEvent(status_code=500, detail="Failed to generate suggestions"))
+        return
+    finally:
+        if not task.done():
+            task.cancel()
+
+    result = _to_generate_suggestions(response)
+    logger.info(f"Streamed suggestions - User: {user.nickname if user else 'Guest'}, Suggestions: {result}")
+    await _save_history(user, result)
+    yield sse_event("result", GenerateSuggestionsResponse(suggestions=result))
+
+
 @router.get("/count", response_model=GetSuggestionCounts, summary="내 제안 개수 및 추천 제안 개수 가져오기")
 async def get_suggestion_counts(
     user: UserDocument | None = Depends(JwtHandler.get_optional_current_user),  # ✅ JWT 인증된 사용자
@@ -98,6 +159,42 @@ async def get_recommend_suggestions(
     )
 
 
+async def _read_images(image_files: list[UploadFile | None]) -> list[tuple[str, bytes]]:
+    """업로드된 이미지 개수를 확인하고 (파일명, 바이트) 목록으로 읽음"""
+    files = [file for file in image_files if file is not None]
+    if len(files) > 4:
+        logger.error("User tried to upload more than 4 images")
+        raise HTTPException(status_code=400, detail="You can only upload up to 4 images.")
+
+    elif len(files) == 0:
+        logger.error("User tried to upload 0 images")
+        raise HTTPException(status_code=400, detail="You must upload at least one image.")
+
+    return [(file.filename, await file.read()) for file in files if file and file.filename]
+
+
+async def _analyze(
+    purpose: PurposeType, files_data: list[tuple[str, bytes]], user: UserDocument | None
+) -> AnalyzeImagesConversationResponse:
+    """용도에 맞게 이미지의 상황(과 말투, 용도)을 분석 (비슷한 이미지의 OCR 캐시는 같은 사용자끼리만 공유)"""
+    try:
+        with ocr_cache_scope(user.id if user else None):
+            if purpose == PurposeType.PHOTO_RESPONSE:
+                situation = await GleeAgent.analyze_situation(files_data)
+                tone = ""
+                usage = ""
+            elif purpose == PurposeType.SIMILAR_VIBE_RESPONSE:
+                situation, tone, usage = await GleeAgent.analyze_situation_accent_purpose(files_data)
+            else:
+                logger.error(f"Failed to analyze images - Invalid purpose: {purpose}")
+                raise HTTPException(status_code=400, detail="Invalid purpose.")
+    except CpuExecutorBusyError as e:
+        logger.warning(f"Failed to analyze images - {e}")
+        raise HTTPException(status_code=503, detail="Server is busy. Please try again later.")
+    logger.info(f"Analyzed images - Situation: {situation}, Tone: {tone}, Usage: {usage}, Purpose: {purpose}")
+    return AnalyzeImagesConversationResponse(situation=situation, tone=tone, usage=usage, purpose=purpose)
+
+
 @router.post(
     "/analyze/image",
     summary="최대 사진 4장까지 보내면 ai 상황을 분석하여 대답함",
@@ -109,31 +206,89 @@ async def analyze_images(
     image_file_2: Optional[UploadFile] = File(None),
     image_file_3: Optional[UploadFile] = File(None),
     image_file_4: Optional[UploadFile] = File(None),
+    user: UserDocument | None = Depends(JwtHandler.get_optional_current_user),  # ✅ JWT 인증된 사용자
 ) -> AnalyzeImagesConversationResponse:
 
     logger.info("Received image analysis request")
-    image_files = [file for file in [image_file_1, image_file_2, image_file_3, image_file_4] if file is not None]
-    if len(image_files) > 4:
-        logger.error("User tried to upload more than 4 images")
-        raise HTTPException(status_code=400, detail="You can only upload up to 4 images.")
+    files_data = await _read_images([image_file_1, image_file_2, image_file_3, image_file_4])
+    analysis = await _analyze(purpose, files_data, user)
 
-    elif len(image_files) == 0:
-        logger.error("User tried to upload 0 images")
-        raise HTTPException(status_code=400, detail="You must upload at least one image.")
+    if purpose == PurposeType.PHOTO_RESPONSE:
+        # 대부분 바로 같은 상황으로 /generate 를 호출하므로 미리 생성 시작
+        suggestion_speculator.speculate(analysis.situation, user.id if user else None)
+    return analysis
 
-    files_data = [(file.filename, await file.read()) for file in image_files if file and file.filename]
 
-    if purpose == PurposeType.PHOTO_RESPONSE:
-        situation = await GleeAgent.analyze_situation(files_data)
-        tone = ""
-        usage = ""
-    elif purpose == PurposeType.SIMILAR_VIBE_RESPONSE:
-        situation, tone, usage = await GleeAgent.analyze_situation_accent_purpose(files_data)
-    else:
-        logger.error(f"Failed to analyze images - Invalid purpose: {purpose}")
-        raise HTTPException(status_code=400, detail="Invalid purpose.")
-    logger.info(f"Analyzed images - Situation: {situation}, Tone: {tone}, Usage: {usage}, Purpose: {purpose}")
-    return AnalyzeImagesConversationResponse(situation=situation, tone=tone, usage=usage, purpose=purpose)
+@router.post(
+    "/analyze-and-generate",
+    summary="이미지 분석과 글 생성을 한 번에 수행 (stream=true 이면 analysis/title/reply/result 이벤트를 SSE 로 전송)",
+    response_model=AnalyzeAndGenerateResponse,
+)
+async def analyze_and_generate(
+    purpose: PurposeType = Form(...),
+    image_file_1: Optional[UploadFile] = File(None),
+    image_file_2: Optional[UploadFile] = File(None),
+    image_file_3: Optional[UploadFile] = File(None),
+    image_file_4: Optional[UploadFile] = File(None),
+    situation: Optional[str] = Form(None, description="분석된 상황 대신 사용할 상황"),
+    tone: Optional[str] = Form(None, description="분석된 말투 대신 사용할 말투"),
+    usage: Optional[str] = Form(None, description="분석된 용도 대신 사용할 용도"),
+    detail: Optional[str] = Form(None, description="추가 정보"),
+    stream: bool = Query(False, description="단계별 결과를 SSE 로 전송"),
+    user: UserDocument | None = Depends(JwtHandler.get_optional_current_user),  # ✅ JWT 인증된 사용자
+) -> AnalyzeAndGenerateResponse | StreamingResponse:
+    logger.info(f"Received analyze-and-generate request - User: {user.nickname if user else 'Guest'}")
+    files_data = await _read_images([image_file_1, image_file_2, image_file_3, image_file_4])
+
+    async def analyze() -> AnalyzeImagesConversationResponse:
+        # 덮어쓸 값만으로 생성에 필요한 입력이 모두 채워지면 분석을 생략
+        if situation and (purpose == PurposeType.PHOTO_RESPONSE or (tone and usage)):
+            analysis = AnalyzeImagesConversationResponse(situation=situation, tone="", usage="", purpose=purpose)
+        else:
+            analysis = await _analyze(purpose, files_data, user)
+        return analysis.model_copy(
+            update={
+                "situation": situation or analysis.situation,
+                "tone": tone or analysis.tone,
+                "usage": usage or analysis.usage,
+            }
+        )
+
+    def generate(
+        analysis: AnalyzeImagesConversationResponse, on_event: OnSuggestionEvent | None = None
+    ) -> Coroutine[Any, Any, AiSuggestionDto]:
+        return SuggesterService.generate_suggestions(
+            situation=analysis.situation,
+            tone=analysis.tone,
+            usage=analysis.usage,
+            detail=detail,
+            on_event=on_event,
+            user_id=user.id if user else None,
+        )
+
+    if stream:
+
+        async def stream_stages() -> AsyncIterator[str]:
+            try:
+                analysis = await analyze()
+            except HTTPException as e:
+                yield sse_event("error", StreamErrorEvent(status_code=e.status_code, detail=str(e.detail)))
+                return
+            except Exception as e:
+                logger.error(f"Failed to analyze images - User: {user.nickname if user else 'Guest'}, Error: {e}")
+                yield sse_event("error", StreamErrorEvent(status_code=500, detail="Failed to analyze images"))
+                return
+            yield sse_event("analysis", analysis)
+            async for event in _stream_suggestions(lambda on_event: generate(analysis, on_event), user):
+                yield event
+
+        return StreamingResponse(stream_stages(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+    analysis = await analyze()
+    result = _to_generate_suggestions(await generate(analysis))
+    logger.info(f"Generated suggestions - User: {user.nickname if user else 'Guest'}, Suggestions: {result}")
+    await _save_history(user, result)
+    return AnalyzeAndGenerateResponse(analysis=analysis, suggestions=result)
 
 
 @router.post(
@@ -148,23 +303,46 @@ async def generate_suggestion(
     logger.info(f"Generating suggestions - User: {user.nickname if user else 'Guest'}, Request: {request}")
 
     response = await SuggesterService.generate_suggestions(
-        situation=request.situation, tone=request.tone, usage=request.usage, detail=request.detail
+        situation=request.situation,
+        tone=request.tone,
+        usage=request.usage,
+        detail=request.detail,
+        user_id=user.id if user else None,
     )
 
-    result = [
-        GenerateSuggestion(title=title, content=suggestion)
-        for title, suggestion in zip(response.titles, response.suggestions)
-    ]
+    result = _to_generate_suggestions(response)
 
     logger.info(f"Generated suggestions - User: {user.nickname if user else 'Guest'}, Suggestions: {result}")
 
-    if user:
-        _suggestions = [Suggestion(title=suggestion.title, content=suggestion.content) for suggestion in result]
-        await HistoryService.create_history(user.id, _suggestions)
+    await _save_history(user, result)
 
     return GenerateSuggestionsResponse(suggestions=result)
 
 
+@router.post(
+    "/generate/stream",
+    summary="/generate 의 SSE 버전 - 제목과 답장을 완성되는 대로 title/reply 이벤트로, 전체 응답을 result 이벤트로 전송",
+    response_class=StreamingResponse,
+)
+async def generate_suggestion_stream(
+    request: GenerateSuggestionRequest,
+    user: UserDocument | None = Depends(JwtHandler.get_optional_current_user),  # ✅ JWT 인증된 사용자
+) -> StreamingResponse:
+    logger.info(f"Streaming suggestions - User: {user.nickname if user else 'Guest'}, Request: {request}")
+
+    def generate(on_event: OnSuggestionEvent) -> Coroutine[Any, Any, AiSuggestionDto]:
+        return SuggesterService.generate_suggestions(
+            situation=request.situation,
+            tone=request.tone,
+            usage=request.usage,
+            detail=request.detail,
+            on_event=on_event,
+            user_id=user.id if user else None,
+        )
+
+    return StreamingResponse(_stream_suggestions(generate, user), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.post(
     "/regenerate",
     summary="기존 생성된 글과 추가 정보를 받아 ai 글을 다시 생성하여 반환",
@@ -177,23 +355,44 @@ async def regenerate_suggestion(
     logger.info(f"Regenerating suggestions - User: {user.nickname if user else 'Guest'}, Request: {request}")
 
     response = await SuggesterService.regenerate_suggestions(
-        exist_suggestion=request.exist_suggestion, length=request.length.value, detail=request.detail
+        exist_suggestion=request.exist_suggestion,
+        length=request.length.value,
+        detail=request.detail,
+        user_id=user.id if user else None,
     )
 
-    result = [
-        GenerateSuggestion(title=title, content=suggestion)
-        for title, suggestion in zip(response.titles, response.suggestions)
-    ]
+    result = _to_generate_suggestions(response)
 
     logger.info(f"Regenerated suggestions - User: {user.nickname if user else 'Guest'}, Suggestions: {result}")
 
-    if user:
-        _suggestions = [Suggestion(title=suggestion.title, content=suggestion.content) for suggestion in result]
-        await HistoryService.create_history(user.id, _suggestions)
+    await _save_history(user, result)
 
     return GenerateSuggestionsResponse(suggestions=result)
 
 
+@router.post(
+    "/regenerate/stream",
+    summary="/regenerate 의 SSE 버전 - 제목과 답장을 완성되는 대로 title/reply 이벤트로, 전체 응답을 result 이벤트로 전송",
+    response_class=StreamingResponse,
+)
+async def regenerate_suggestion_stream(
+    request: RegenerateSuggestionRequest,
+    user: UserDocument | None = Depends(JwtHandler.get_optional_current_user),  # ✅ JWT 인증된 사용자
+) -> StreamingResponse:
+    logger.info(f"Streaming regenerated suggestions - User: {user.nickname if user else 'Guest'}, Request: {request}")
+
+    def generate(on_event: OnSuggestionEvent) -> Coroutine[Any, Any, AiSuggestionDto]:
+        return SuggesterService.regenerate_suggestions(
+            exist_suggestion=request.exist_suggestion,
+            length=request.length.value,
+            detail=request.detail,
+            on_event=on_event,
+            user_id=user.id if user else None,
+        )
+
+    return StreamingResponse(_stream_suggestions(generate, user), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.post("", response_model=SuggestionResponse, summary="유저가 생성한 글제안 - 저장")
 async def save_suggestion(
     request: SuggestionRequest,
@@ -4,10 +4,18 @@ from bson import ObjectId
 from fastapi import HTTPException
 
 from ai.glee_agent import GleeAgent
+from ai.services.agent.orchestrator_agent import OnSuggestionEvent, SuggestionEvent
+from ai.utils.single_flight import SingleFlight, SingleFlightStats, make_flight_key
 from app.core.enums import SuggestionTagType
 from app.suggester.suggester_collection import SuggesterCollection
 from app.suggester.suggester_document import SuggesterDocument, SuggesterDTO
 from app.suggester.suggester_dto import AiSuggestionDto
+from app.suggester.suggestion_speculator import suggestion_speculator
+
+
+# 동일 입력으로 동시에 들어온 생성 요청은 하나의 GleeAgent 실행을 공유
+generate_flight: SingleFlight[AiSuggestionDto, SuggestionEvent] = SingleFlight("generate")
+regenerate_flight: SingleFlight[AiSuggestionDto, SuggestionEvent] = SingleFlight("regenerate")
 
 
 class SuggesterService:
@@ -58,23 +66,74 @@ class SuggesterService:
 
     @staticmethod
     async def generate_suggestions(
-        situation: str, tone: str | None = None, usage: str | None = None, detail: str | None = None
+        situation: str,
+        tone: str | None = None,
+        usage: str | None = None,
+        detail: str | None = None,
+        on_event: OnSuggestionEvent | None = None,
+        user_id: ObjectId | None = None,
+    ) -> AiSuggestionDto:
+        """
+        글 제안 생성 (on_event 가 있으면 제목/답장이 완성될 때마다 호출)
+
+        같은 사용자의 동일한 입력이 진행 중이면 새로 생성하지 않고 그 결과를 함께 받음
+        """
+        key = make_flight_key(str(user_id) if user_id else "guest", situation, tone, usage, detail)
+
+        async def generate(emit: OnSuggestionEvent) -> AiSuggestionDto:
+            return await SuggesterService._generate_suggestions(situation, tone, usage, detail, emit, user_id)
+
+        return await generate_flight.do(key, generate, on_event)
+
+    @staticmethod
+    async def _generate_suggestions(
+        situation: str,
+        tone: str | None,
+        usage: str | None,
+        detail: str | None,
+        on_event: OnSuggestionEvent | None,
+        user_id: ObjectId | None,
     ) -> AiSuggestionDto:
         if situation and tone and usage and detail:
-            response = await GleeAgent.generate_reply_suggestions_detail(situation, tone, usage, detail)
+            response = await GleeAgent.generate_reply_suggestions_detail(situation, tone, usage, detail, on_event)
         elif situation and tone and usage:
-            response = await GleeAgent.generate_reply_suggestions_accent_purpose(situation, tone, usage)
+            response = await GleeAgent.generate_reply_suggestions_accent_purpose(situation, tone, usage, on_event)
+        elif situation and (speculated := await suggestion_speculator.take(situation, user_id)) is not None:
+            # 이미지 분석 직후 미리 생성해 둔 결과 사용
+            if on_event is not None:
+                for index, title in enumerate(speculated.titles):
+                    await on_event(SuggestionEvent(kind="title", index=index, content=title))
+                for index, suggestion in enumerate(speculated.suggestions):
+                    await on_event(SuggestionEvent(kind="reply", index=index, content=suggestion))
+            response = speculated
         elif situation:
-            response = await GleeAgent.generate_suggestions_situation(situation)
+            response = await GleeAgent.generate_suggestions_situation(situation, on_event)
         else:
             raise HTTPException(status_code=400, detail="Invalid Generate Suggestion Request")
         return response
 
     @staticmethod
-    async def regenerate_suggestions(exist_suggestion: str, length: str, detail: str) -> AiSuggestionDto:
-        return await GleeAgent.generate_reply_suggestions_detail_length(
-            suggestion=exist_suggestion, length=length, add_description=detail
-        )
+    async def regenerate_suggestions(
+        exist_suggestion: str,
+        length: str,
+        detail: str,
+        on_event: OnSuggestionEvent | None = None,
+        user_id: ObjectId | None = None,
+    ) -> AiSuggestionDto:
+        """기존 글 재생성 (동일 입력이 진행 중이면 그 결과를 함께 받음)"""
+        key = make_flight_key(str(user_id) if user_id else "guest", exist_suggestion, length, detail)
+
+        async def regenerate(emit: OnSuggestionEvent) -> AiSuggestionDto:
+            return await GleeAgent.generate_reply_suggestions_detail_length(
+                suggestion=exist_suggestion, length=length, add_description=detail, on_event=emit
+            )
+
+        return await regenerate_flight.do(key, regenerate, on_event)
+
+    @staticmethod
+    def flight_stats() -> list[SingleFlightStats]:
+        """동일 요청 합치기 현황"""
+        return [generate_flight.stats(), regenerate_flight.stats()]
 
     @staticmethod
     async def update_suggestion_tags(
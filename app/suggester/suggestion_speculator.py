@@ -0,0 +1,152 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from bson import ObjectId
+from loguru import logger
+
+from ai.glee_agent import GleeAgent
+from ai.utils.concurrency_limiter import PRIORITY_LOW, priority_scope
+from ai.utils.deadline import deadline_scope
+from ai.utils.response_cache import TtlLruCache
+from ai.utils.single_flight import make_flight_key
+from app.core.settings import settings
+from app.suggester.suggester_dto import AiSuggestionDto
+
+
+@dataclass(frozen=True)
+class SpeculationStats:
+    started: int
+    skipped: int
+    completed: int
+    failed: int
+    hits: int
+    misses: int
+    in_flight: int
+    entries: int
+    hit_rate: float
+    waste_rate: float
+
+
+def _dto_size(dto: AiSuggestionDto) -> int:
+    return sum(len(text.encode("utf-8")) for text in (*dto.titles, *dto.suggestions))
+
+
+def _speculation_key(situation: str, user_id: ObjectId | None) -> str:
+    # 다른 사용자의 예측 결과를 가져가지 않도록 사용자별로 구분
+    return make_flight_key("speculation", str(user_id) if user_id else "guest", situation)
+
+
+class SuggestionSpeculator:
+    """
+    이미지 분석 직후 같은 상황으로 글 제안을 미리 생성해 두는 도구
+
+    - 분석 결과(상황)로 백그라운드 생성을 시작하고, 결과는 사용자별로 짧은 TTL 캐시에 보관
+    - 동시에 진행하는 예측 생성 수는 max_concurrency 로 제한하고, 넘치면 시작하지 않음
+    - 예측 생성은 낮은 우선순위로 업스트림을 호출해 실제 요청을 방해하지 않음
+    - 뒤이은 /generate 는 take 로 결과를 한 번만 가져감 (진행 중이면 완료를 기다림)
+    - 적중률은 예측 생성을 시작한 키의 take 만 셈 (예측하지 않은 요청은 적중/실패에 넣지 않음)
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, max_concurrency: int) -> None:
+        self.max_concurrency = max_concurrency
+        self._cache: TtlLruCache[AiSuggestionDto] = TtlLruCache(
+            max_entries=max_entries, max_bytes=max_entries * 4096, ttl_seconds=ttl_seconds, sizeof=_dto_size
+        )
+        self._in_flight: dict[str, asyncio.Task[AiSuggestionDto | None]] = {}
+        # 예측 생성을 시작했지만 아직 take 되지 않은 키 (오래된 것부터 버림)
+        self._speculated: OrderedDict[str, None] = OrderedDict()
+        self._max_speculated = max_entries + max_concurrency
+        self.started = 0
+        self.skipped = 0
+        self.completed = 0
+        self.failed = 0
+        self.hits = 0
+        self.misses = 0
+
+    def speculate(self, situation: str, user_id: ObjectId | None = None) -> None:
+        """상황으로 글 제안 생성을 백그라운드에서 시작"""
+        if not situation.strip():
+            return
+        key = _speculation_key(situation, user_id)
+        if key in self._in_flight or self._cache.get(key) is not None:
+            return
+        if len(self._in_flight) >= self.max_concurrency:
+            self.skipped += 1
+            logger.info("예측 생성 한도에 도달해 시작하지 않습니다.")
+            return
+
+        self.started += 1
+        task = asyncio.create_task(self._generate(key, situation))
+        self._in_flight[key] = task
+        self._speculated[key] = None
+        while len(self._speculated) > self._max_speculated:
+            self._speculated.popitem(last=False)
+
+    async def take(self, situation: str, user_id: ObjectId | None = None) -> AiSuggestionDto | None:
+        """미리 생성된 결과를 가져옴 (없거나 실패했으면 None)"""
+        key = _speculation_key(situation, user_id)
+        if key not in self._speculated:
+            return None
+        del self._speculated[key]
+
+        result = self._cache.pop(key)
+        if result is None and key in self._in_flight:
+            result = await asyncio.shield(self._in_flight[key])
+            self._cache.pop(key)
+
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        logger.info("예측 생성 결과 사용")
+        return result
+
+    async def close(self) -> None:
+        """앱 종료 시 진행 중인 예측 생성을 취소"""
+        tasks = list(self._in_flight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._in_flight.clear()
+        self._speculated.clear()
+
+    def stats(self) -> SpeculationStats:
+        lookups = self.hits + self.misses
+        return SpeculationStats(
+            started=self.started,
+            skipped=self.skipped,
+            completed=self.completed,
+            failed=self.failed,
+            hits=self.hits,
+            misses=self.misses,
+            in_flight=len(self._in_flight),
+            entries=len(self._cache),
+            hit_rate=round(self.hits / lookups, 4) if lookups else 0.0,
+            # 완료되었지만 사용되지 않은 (사용 전이거나 만료된) 예측 생성 비율
+            waste_rate=round(max(0.0, 1 - self.hits / self.completed), 4) if self.completed else 0.0,
+        )
+
+    async def _generate(self, key: str, situation: str) -> AiSuggestionDto | None:
+        try:
+            # 분석 요청이 끝난 뒤에도 계속 실행되므로 요청의 마감 시간 대신 별도 마감 시간 사용
+            with priority_scope(PRIORITY_LOW), deadline_scope(settings.request_deadline_seconds, inherit=False):
+                result = await GleeAgent.generate_suggestions_situation(situation)
+        except Exception as e:
+            # 아무도 기다리지 않을 수 있으므로 예외 대신 None 으로 실패를 알림
+            self.failed += 1
+            logger.error(f"예측 생성 실패: {e}")
+            return None
+        finally:
+            self._in_flight.pop(key, None)
+
+        self.completed += 1
+        self._cache.set(key, result)
+        return result
+
+
+suggestion_speculator = SuggestionSpeculator(
+    ttl_seconds=settings.speculation_ttl_seconds,
+    max_entries=settings.speculation_max_entries,
+    max_concurrency=settings.speculation_max_concurrency,
+)
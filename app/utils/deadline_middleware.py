@@ -0,0 +1,39 @@
+from loguru import logger
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ai.utils.deadline import deadline_scope
+from app.core.settings import settings
+
+
+class DeadlineMiddleware:
+    """
+    요청마다 마감 시간을 지정하는 ASGI 미들웨어
+
+    기본값은 settings.request_deadline_seconds 이고, 클라이언트가 헤더(초 단위)로 더 짧거나 긴 값을 보낼 수 있음
+    (request_deadline_max_seconds 를 넘지 않도록 제한). 스트리밍 응답도 같은 마감 시간 안에서 생성됨
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.header = settings.request_deadline_header.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with deadline_scope(self._deadline_seconds(scope)):
+            await self.app(scope, receive, send)
+
+    def _deadline_seconds(self, scope: Scope) -> float:
+        for name, value in scope["headers"]:
+            if name == self.header:
+                try:
+                    seconds = float(value.decode("latin-1"))
+                except ValueError:
+                    logger.warning(f"잘못된 마감 시간 헤더: {value!r}")
+                    break
+                if seconds > 0:
+                    return min(seconds, settings.request_deadline_max_seconds)
+                break
+        return settings.request_deadline_seconds
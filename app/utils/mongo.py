@@ -10,6 +10,14 @@ db = client[settings.db_name]
 async def set_indexes() -> None:
     from app.user.user_collection import UserCollection
     from app.suggester.suggester_collection import SuggesterCollection
+    from app.job.job_collection import JobCollection
+    from ai.utils.llm_cache import llm_cache
+    from ai.utils.ocr_cache import ocr_cache
 
     await UserCollection.set_index()
     await SuggesterCollection.set_index()
+    await JobCollection.set_index()
+    if llm_cache.mongo_tier is not None:
+        await llm_cache.mongo_tier.set_index()
+    if ocr_cache.mongo_tier is not None:
+        await ocr_cache.mongo_tier.set_index()
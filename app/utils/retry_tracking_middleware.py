@@ -0,0 +1,24 @@
+from loguru import logger
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ai.utils.retry_policy import retry_policies, retry_tracking
+
+
+class RetryTrackingMiddleware:
+    """요청마다 업스트림 재시도 횟수를 집계해 로그와 모니터링 통계에 남기는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with retry_tracking() as retries:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                retry_policies.record_request(retries)
+                if retries.total:
+                    logger.info(f"{scope['method']} {scope['path']} - 재시도 {retries.total}회 {retries.by_upstream}")
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+def sse_event(event: str, data: BaseModel | str) -> str:
+    """Server-Sent Events 한 건을 직렬화 (data 는 한 줄 JSON)"""
+    payload = data.model_dump_json() if isinstance(data, BaseModel) else data
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+# 프록시(nginx)가 이벤트를 모아서 보내지 않도록 하는 헤더
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
@@ -0,0 +1,56 @@
+"""
+Clova Studio SSE 파서 마이크로 벤치마크
+
+기존 서비스별 파서(모든 data 줄 이어붙이기 + deduplicate_sentences)와
+ai.utils.clova_stream_parser 의 result 이벤트 기반 파서를 녹화된 스트림으로 비교합니다.
+
+    poetry run python -m benchmarks.bench_clova_stream_parser
+"""
+
+import json
+import timeit
+from pathlib import Path
+from typing import Any
+
+from ai.utils.clova_stream_parser import parse_clova_stream_lines
+from ai.utils.deduplicate_sentence import deduplicate_sentences
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "test" / "assets"
+STREAMS = ["clova_stream_title.txt", "clova_stream_reply.txt"]
+
+
+def legacy_parse(lines: list[str]) -> str:
+    """기존 Analyze / ReplySuggestion 파서와 동일한 방식"""
+    result_text = ""
+    previous_token = ""
+    for line in lines:
+        if line and line.startswith("data:"):
+            data_str = line[len("data:") :].strip()
+            try:
+                data_json: dict[str, Any] = json.loads(data_str)
+                token: str = data_json.get("message", {}).get("content", "")
+                if token != previous_token:
+                    result_text += token
+                    previous_token = token
+            except Exception:
+                continue
+    return deduplicate_sentences(result_text.strip())
+
+
+def event_aware_parse(lines: list[str]) -> str:
+    return deduplicate_sentences(parse_clova_stream_lines(lines).text)
+
+
+def main(number: int = 2000) -> None:
+    for stream in STREAMS:
+        lines = (ASSETS_DIR / stream).read_text(encoding="utf-8").splitlines()
+        legacy = timeit.timeit(lambda: legacy_parse(lines), number=number) / number * 1e6
+        current = timeit.timeit(lambda: event_aware_parse(lines), number=number) / number * 1e6
+        print(
+            f"{stream:<28} lines={len(lines):<4} legacy={legacy:8.1f}us  event-aware={current:8.1f}us  "
+            f"speedup={legacy / current:4.1f}x  same_output={legacy_parse(lines) == event_aware_parse(lines)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+deduplicate_sentences 벤치마크
+
+기존 구현(문자 단위 += 와 리스트 포함 검사)과 현재 구현을 LLM 이 같은 문장을 조금씩 바꿔 반복하는
+긴 답장 형태의 합성 텍스트로 비교합니다. 모드별 실행 시간과 남은 글자 수를 출력합니다.
+
+    poetry run python -m benchmarks.bench_deduplicate_sentence
+"""
+
+import random
+import time
+from collections.abc import Callable
+
+from ai.utils.deduplicate_sentence import deduplicate_sentences
+
+SENTENCES = [
+    "오늘 만나서 정말 반가웠어",
+    "다음에는 내가 맛있는 거 살게",
+    "주말에 시간 괜찮으면 영화 보러 갈래",
+    "요즘 일이 많아서 연락이 늦었어 미안해",
+    "천천히 생각해보고 편할 때 답장 줘",
+]
+VARIATIONS = ["", "요", "!", " ㅎㅎ", "~"]
+
+
+def legacy_deduplicate_sentences(text: str) -> str:
+    """기존 구현 (문자 단위 문자열 더하기, 리스트에서 중복 검사)"""
+    if not text:
+        return text
+    text = text.strip()
+    half_len = len(text) // 2
+    if len(text) % 2 == 0 and text[:half_len] == text[half_len:]:
+        return text[:half_len].strip()
+
+    sentences: list[str] = []
+    separators: list[str] = []
+    current_sentence = ""
+    for i, char in enumerate(text):
+        current_sentence += char
+        if char in [".", "?", "!", "\n"] or i == len(text) - 1:
+            current_sentence = current_sentence.strip()
+            if current_sentence and current_sentence not in sentences:
+                sentences.append(current_sentence)
+                separators.append("\n" if char == "\n" else " ")
+            elif not current_sentence and char == "\n" and separators:
+                separators[-1] = "\n"
+            current_sentence = ""
+
+    result = ""
+    for i, sentence in enumerate(sentences):
+        if i > 0:
+            result += separators[i - 1]
+        result += sentence
+    return result
+
+
+def generated_reply(sentences: int, unique_ratio: float, seed: int = 0) -> str:
+    """같은 문장을 조금씩 바꿔 반복하는 긴 생성 결과"""
+    rng = random.Random(seed)
+    parts = []
+    for i in range(sentences):
+        if rng.random() < unique_ratio:
+            parts.append(f"{rng.choice(SENTENCES)} {i}번째 이야기야.")
+        else:
+            parts.append(f"{rng.choice(SENTENCES)}{rng.choice(VARIATIONS)}.")
+    return " ".join(parts)
+
+
+def timed(func: Callable[[str], str], text: str, repeat: int) -> tuple[float, str]:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(text)
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main() -> None:
+    for sentences, repeat in ((20, 200), (200, 20), (2000, 3)):
+        text = generated_reply(sentences, unique_ratio=0.7)
+        print(f"sentences={sentences} chars={len(text)}")
+        runs = {
+            "legacy": lambda value: legacy_deduplicate_sentences(value),
+            "exact": lambda value: deduplicate_sentences(value, "exact"),
+            "normalized": lambda value: deduplicate_sentences(value, "normalized"),
+            "fuzzy": lambda value: deduplicate_sentences(value, "fuzzy", 0.85),
+        }
+        for name, func in runs.items():
+            elapsed_ms, result = timed(func, text, repeat)
+            print(f"  {name:<10} {elapsed_ms:9.3f}ms  kept_chars={len(result)}")
+
+
+if __name__ == "__main__":
+    main()
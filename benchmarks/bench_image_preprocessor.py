@@ -0,0 +1,113 @@
+"""
+OCR 업로드 전 이미지 처리 벤치마크
+
+기존 전처리(원본 해상도로 EXIF 회전 후 같은 포맷으로 다시 저장)와 ImagePreprocessor 정책을
+채팅 스크린샷 형태의 합성 이미지로 비교합니다. 업로드 크기, 전처리 시간, 느린 회선 기준 업로드 시간을 출력하고,
+--ocr 를 주면 Clova OCR 에 실제로 요청해 응답 시간도 측정합니다 (CLOVA_OCR_URL / CLOVA_OCR_SECRET_KEY 필요).
+
+    poetry run python -m benchmarks.bench_image_preprocessor [--ocr]
+"""
+
+import asyncio
+import random
+import sys
+import time
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+from ai.services.agent.image_pre_processor import ImagePreprocessor, PreprocessPolicy
+
+UPLINK_MBPS = (1.0, 10.0)
+MESSAGES = [
+    "내일 몇 시에 만날까?",
+    "7시 어때? 저녁 먹고 영화 보자",
+    "좋아! 그럼 강남역 11번 출구에서 봐",
+    "ㅋㅋㅋ 알겠어",
+]
+
+
+def chat_screenshot(width: int, height: int, image_format: str, seed: int, photo: bool = False) -> bytes:
+    """말풍선과 한글 텍스트가 있는 채팅 스크린샷 형태의 이미지 (photo 면 대화 중간에 공유된 사진 포함)"""
+    rng = random.Random(seed)
+    image = Image.new("RGB", (width, height), (186, 206, 224))
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=max(16, width // 28))
+    y = 40
+    if photo:
+        shared = Image.effect_noise((width // 2, height // 3), 64).convert("RGB")
+        image.paste(shared, (40, y))
+        y += shared.height + 40
+    while y < height - 120:
+        mine = rng.random() < 0.5
+        text = rng.choice(MESSAGES)
+        bubble_width = int(width * rng.uniform(0.35, 0.7))
+        left = width - bubble_width - 40 if mine else 40
+        draw.rounded_rectangle(
+            (left, y, left + bubble_width, y + 80), radius=24, fill=(254, 229, 0) if mine else (255, 255, 255)
+        )
+        draw.text((left + 24, y + 22), text, fill=(20, 20, 20), font=font)
+        y += 80 + rng.randint(20, 60)
+
+    with BytesIO() as buffer:
+        image.save(buffer, format=image_format, quality=92)
+        return buffer.getvalue()
+
+
+def legacy_preprocess(image_bytes: bytes, output_format: str = "PNG") -> bytes:
+    """기존 ImagePreprocessor.preprocess 와 동일한 방식"""
+    with BytesIO(image_bytes) as input_buffer:
+        with Image.open(input_buffer) as image:
+            transposed = ImageOps.exif_transpose(image)
+            with BytesIO() as output_buffer:
+                transposed.save(output_buffer, format=image.format or output_format)
+                return output_buffer.getvalue()
+
+
+async def ocr_latency(data: bytes, extension: str) -> float:
+    from ai.utils.services import services
+
+    started = time.perf_counter()
+    await services.ocr.request_text(data, f"bench.{extension}")
+    elapsed = time.perf_counter() - started
+    await services.close()
+    return elapsed
+
+
+def main(use_ocr: bool = False) -> None:
+    samples = {
+        "iphone-png 1170x2532": chat_screenshot(1170, 2532, "PNG", seed=1),
+        "android-png 1080x2400": chat_screenshot(1080, 2400, "PNG", seed=2),
+        "tablet-jpeg 2048x2732": chat_screenshot(2048, 2732, "JPEG", seed=3),
+        "photo-png 1170x2532": chat_screenshot(1170, 2532, "PNG", seed=4, photo=True),
+        "small-png 720x1280": chat_screenshot(720, 1280, "PNG", seed=5),
+    }
+    preprocessor = ImagePreprocessor(PreprocessPolicy())
+
+    for name, data in samples.items():
+        started = time.perf_counter()
+        legacy = legacy_preprocess(data)
+        legacy_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        result = preprocessor.preprocess_image(data)
+        policy_ms = (time.perf_counter() - started) * 1000
+
+        uploads = "  ".join(
+            f"upload@{mbps:g}Mbps {len(legacy) * 8 / mbps / 1e6:5.2f}s -> {len(result.data) * 8 / mbps / 1e6:5.2f}s"
+            for mbps in UPLINK_MBPS
+        )
+        print(
+            f"{name:<24} legacy={len(legacy) / 1024:7.1f}KiB ({legacy_ms:6.1f}ms)  "
+            f"policy={len(result.data) / 1024:7.1f}KiB ({policy_ms:6.1f}ms, reencoded={result.reencoded})  {uploads}"
+        )
+        if use_ocr:
+            legacy_s = asyncio.run(ocr_latency(legacy, "png" if "png" in name else "jpg"))
+            policy_s = asyncio.run(ocr_latency(result.data, result.extension))
+            print(f"{'':<24} ocr latency legacy={legacy_s:5.2f}s policy={policy_s:5.2f}s")
+
+    stats = preprocessor.stats()
+    print(f"total bytes_in={stats.bytes_in} bytes_out={stats.bytes_out} saved={stats.bytes_saved}")
+
+
+if __name__ == "__main__":
+    main(use_ocr="--ocr" in sys.argv)
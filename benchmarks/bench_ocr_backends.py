@@ -0,0 +1,81 @@
+"""
+OCR 엔진 처리량 벤치마크
+
+test/assets 의 이미지(와 채팅 스크린샷 형태의 합성 이미지)를 OCR 엔진별로 동시에 요청해
+초당 처리 이미지 수와 이미지당 지연 시간(p50/p95)을 출력합니다. OCR 캐시는 거치지 않습니다.
+tesseract 는 실행 파일이 있을 때만, clova 는 --clova 를 줄 때만(CLOVA_OCR_URL / CLOVA_OCR_SECRET_KEY 필요) 측정합니다.
+
+    poetry run python -m benchmarks.bench_ocr_backends [--clova] [--rounds N] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import shutil
+import statistics
+import time
+from pathlib import Path
+
+from ai.services.ocr.ocr_backend import OcrBackend, create_ocr_backend
+from app.core.settings import settings
+from benchmarks.bench_image_preprocessor import chat_screenshot
+
+ASSETS = Path(__file__).resolve().parent.parent / "test" / "assets"
+
+
+def load_images() -> list[tuple[str, bytes]]:
+    images = [(path.name, path.read_bytes()) for path in sorted(ASSETS.glob("*.png"))]
+    images += [(f"synthetic-{seed}.png", chat_screenshot(1170, 2532, "PNG", seed=seed)) for seed in range(3)]
+    return images
+
+
+async def measure(backend: OcrBackend, images: list[tuple[str, bytes]], rounds: int, concurrency: int) -> None:
+    slots = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    failures = 0
+
+    async def one(name: str, data: bytes) -> None:
+        nonlocal failures
+        async with slots:
+            started = time.perf_counter()
+            try:
+                await backend.request_text(data, name)
+            except Exception:
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(name, data) for _ in range(rounds) for name, data in images))
+    elapsed = time.perf_counter() - started
+    await backend.close()
+
+    quantiles = statistics.quantiles(latencies, n=20) if len(latencies) > 1 else latencies * 19
+    print(
+        f"{backend.name:<10} images={len(latencies):4d} failures={failures:3d} "
+        f"throughput={len(latencies) / elapsed:8.1f}/s p50={statistics.median(latencies) * 1000:8.1f}ms "
+        f"p95={quantiles[18] * 1000:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clova", action="store_true")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    backends = ["fixture"]
+    if shutil.which(settings.ocr_tesseract_command):
+        backends.append("tesseract")
+    if args.clova:
+        backends.append("clova")
+
+    # 합성 이미지는 이름/sha256 픽스처가 없으므로 저장된 Clova 응답으로 답하게 함
+    settings.ocr_fixture_default = settings.ocr_fixture_default or "clova_ocr_chat.json"
+    images = load_images()
+    print(f"images={len(images)} rounds={args.rounds} concurrency={args.concurrency}")
+    for name in backends:
+        asyncio.run(measure(create_ocr_backend(name), images, args.rounds, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+from ai.utils.candidate_parser import parse_candidates
+
+
+def test_parse_bracket_numbered_candidates() -> None:
+    text = '[1] 정말 미안해.\n[2] "내가 잘못했어, 용서해줄래?"\n[3] 다음엔 꼭 조심할게!'
+
+    assert parse_candidates(text, 3) == ["정말 미안해.", "내가 잘못했어, 용서해줄래?", "다음엔 꼭 조심할게!"]
+
+
+def test_parse_dot_numbered_candidates_with_multiline_body() -> None:
+    text = "1. 첫 번째 답장\n이어지는 문장\n2. 두 번째 답장\n3. 세 번째 답장"
+
+    assert parse_candidates(text, 3) == ["첫 번째 답장\n이어지는 문장", "두 번째 답장", "세 번째 답장"]
+
+
+def test_parse_returns_none_when_not_enough_distinct_candidates() -> None:
+    assert parse_candidates("그냥 한 문장만 있는 답장", 3) is None
+    assert parse_candidates("[1] 같은 답장\n[2] 같은 답장\n[3] 다른 답장", 3) is None
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from ai.services.generation.reply_seggestion import ReplySuggestion
+from ai.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, is_upstream_failure
+from ai.utils.clova_http import clova_http
+from ai.utils.concurrency_limiter import LimiterTimeoutError
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+
+async def _fail(breaker: CircuitBreaker) -> None:
+    with pytest.raises(httpx.ConnectError):
+        async with breaker.guard():
+            raise httpx.ConnectError("down")
+
+
+@pytest.mark.asyncio
+async def test_opens_after_consecutive_failures_and_rejects_fast() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=60.0)
+    await _fail(breaker)
+    assert breaker.state is CircuitState.CLOSED
+
+    await _fail(breaker)
+    assert breaker.is_open
+
+    with pytest.raises(CircuitOpenError):
+        async with breaker.guard():
+            pass
+    assert breaker.stats().rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1)
+    request = httpx.Request("POST", "http://test")
+    response = httpx.Response(400, request=request)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async with breaker.guard():
+            raise httpx.HTTPStatusError("bad request", request=request, response=response)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_allows_single_trial(monkeypatch: pytest.MonkeyPatch) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=1.0)
+    await _fail(breaker)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 2.0)
+
+    async with breaker.guard():
+        assert breaker.stats().state == "half_open"
+        with pytest.raises(CircuitOpenError):
+            async with breaker.guard():
+                pass
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_failed_trial_reopens(monkeypatch: pytest.MonkeyPatch) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=1.0)
+    await _fail(breaker)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 2.0)
+
+    await _fail(breaker)
+    assert breaker.is_open
+    assert breaker.stats().opened == 2
+
+
+@pytest.mark.asyncio
+async def test_background_probe_moves_to_half_open() -> None:
+    probes: list[bool] = [False, True]
+
+    async def probe() -> bool:
+        return probes.pop(0)
+
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.01, probe=probe)
+    await _fail(breaker)
+    assert breaker.is_open
+
+    for _ in range(100):
+        if breaker.state is CircuitState.HALF_OPEN:
+            break
+        await asyncio.sleep(0.01)
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.stats().probes == 2
+    await breaker.close()
+
+
+def test_limiter_timeout_is_not_an_upstream_failure() -> None:
+    assert not is_upstream_failure(LimiterTimeoutError("queue full"))
+    assert is_upstream_failure(httpx.ConnectError("down"))
+
+
+@pytest.mark.asyncio
+async def test_limiter_timeout_on_trial_keeps_half_open(monkeypatch: pytest.MonkeyPatch) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=1.0)
+    await _fail(breaker)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 2.0)
+
+    with pytest.raises(LimiterTimeoutError):
+        async with breaker.guard():
+            raise LimiterTimeoutError("queue full")
+
+    stats = breaker.stats()
+    assert (stats.state, stats.successes, stats.failures) == ("half_open", 0, 1)
+    # 시험 호출 자리는 비워져 다음 요청이 다시 시험
+    async with breaker.guard():
+        pass
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_non_upstream_errors_do_not_reset_failures() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=2)
+    await _fail(breaker)
+
+    with pytest.raises(ValueError):
+        async with breaker.guard():
+            raise ValueError("parse error")
+
+    assert breaker.stats().consecutive_failures == 1
+    await _fail(breaker)
+    assert breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_reply_generation_sends_trial_after_recovery_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = (ASSETS_DIR / "clova_stream_reply.txt").read_bytes()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=stream))
+    monkeypatch.setattr(clova_http, "_client", httpx.AsyncClient(transport=transport))
+
+    reply = ReplySuggestion()
+    reply.breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=1.0)
+    await _fail(reply.breaker)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 2.0)
+
+    await reply.generate_suggestions("상황: 약속 시간 정하기", "config_reply_suggestions.yaml", 1)
+
+    assert reply.breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_mid_stream_transport_error_counts_as_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    class BrokenStream(httpx.AsyncByteStream):
+        async def __aiter__(self) -> AsyncIterator[bytes]:
+            yield b"event: token\n"
+            raise httpx.RemoteProtocolError("peer closed connection")
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=BrokenStream()))
+    monkeypatch.setattr(clova_http, "_client", httpx.AsyncClient(transport=transport))
+    reply = ReplySuggestion()
+    reply.breaker = CircuitBreaker("test", failure_threshold=1)
+
+    result = await reply.generate_suggestions("상황: 약속 시간 정하기", "config_reply_suggestions.yaml", 1)
+
+    assert result[0] in reply.fallback_replies
+    assert reply.breaker.is_open
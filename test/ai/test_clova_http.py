@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ai.utils.clova_http import ClovaHttpClient
+
+
+@pytest.fixture
+def http() -> ClovaHttpClient:
+    return ClovaHttpClient(max_connections=4, max_keepalive_connections=2, keepalive_expiry=5.0, http2=False)
+
+
+async def test_stats_without_private_pool(http: ClovaHttpClient) -> None:
+    await http.start()
+    http._transport = SimpleNamespace()  # type: ignore[assignment]
+
+    stats = http.stats()
+
+    assert stats.open_connections == 0
+    assert stats.idle_connections == 0
+    await http.close()
+
+
+async def test_stats_skips_connections_without_is_idle(http: ClovaHttpClient) -> None:
+    await http.start()
+    connections = [SimpleNamespace(is_idle=lambda: True), SimpleNamespace()]
+    http._transport = SimpleNamespace(_pool=SimpleNamespace(connections=connections))  # type: ignore[assignment]
+
+    stats = http.stats()
+
+    assert stats.open_connections == 2
+    assert stats.idle_connections == 1
+    await http.close()
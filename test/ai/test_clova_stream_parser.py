@@ -0,0 +1,59 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from ai.utils.clova_stream_parser import ClovaStreamError, parse_clova_stream, parse_clova_stream_lines
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+
+def test_parse_uses_result_event() -> None:
+    lines = (ASSETS_DIR / "clova_stream_title.txt").read_text(encoding="utf-8").splitlines()
+
+    result = parse_clova_stream_lines(lines)
+
+    assert result.text == "제목: 친구에게 건네는 진심 어린 사과"
+    assert result.stop_reason == "stop_before"
+    assert result.input_length == 312
+    assert result.token_events > 0
+
+
+def test_parse_without_result_event_joins_tokens() -> None:
+    lines = [
+        "event: token",
+        'data: {"message": {"role": "assistant", "content": "안녕"}}',
+        "",
+        "event: token",
+        'data: {"message": {"role": "assistant", "content": "하세요"}}',
+        "",
+    ]
+
+    assert parse_clova_stream_lines(lines).text == "안녕하세요"
+
+
+def test_parse_error_event_raises() -> None:
+    lines = ["event: error", 'data: {"status": {"code": "42901", "message": "Too many requests"}}']
+
+    with pytest.raises(ClovaStreamError) as exc_info:
+        parse_clova_stream_lines(lines)
+
+    assert exc_info.value.code == "42901"
+
+
+@pytest.mark.asyncio
+async def test_parse_stream_stops_after_result_event() -> None:
+    lines = (ASSETS_DIR / "clova_stream_reply.txt").read_text(encoding="utf-8").splitlines()
+    lines += ["event: token", 'data: {"message": {"content": "무시되어야 함"}}']
+    consumed = 0
+
+    async def aiter_lines() -> AsyncIterator[str]:
+        nonlocal consumed
+        for line in lines:
+            consumed += 1
+            yield line
+
+    result = await parse_clova_stream(aiter_lines())
+
+    assert "무시되어야 함" not in result.text
+    assert consumed < len(lines)
@@ -0,0 +1,92 @@
+import asyncio
+
+import httpx
+import pytest
+
+from ai.utils.concurrency_limiter import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    AdaptiveLimiter,
+    LimiterTimeoutError,
+    priority_scope,
+)
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_by_priority() -> None:
+    limiter = AdaptiveLimiter("test", max_limit=1)
+    await limiter.acquire()
+    order: list[str] = []
+
+    async def wait(name: str, priority: int) -> None:
+        await limiter.acquire(priority=priority)
+        order.append(name)
+        limiter.release()
+
+    low = asyncio.create_task(wait("low", PRIORITY_LOW))
+    high = asyncio.create_task(wait("high", PRIORITY_HIGH))
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 2
+
+    limiter.release()
+    await asyncio.gather(low, high)
+    assert order == ["high", "low"]
+
+
+@pytest.mark.asyncio
+async def test_priority_scope_overrides_call_priority() -> None:
+    limiter = AdaptiveLimiter("test", max_limit=1)
+    await limiter.acquire()
+    order: list[str] = []
+
+    async def wait(name: str, priority: int) -> None:
+        await limiter.acquire(priority=priority)
+        order.append(name)
+        limiter.release()
+
+    with priority_scope(PRIORITY_LOW):
+        background = asyncio.create_task(wait("background", PRIORITY_HIGH))
+    normal = asyncio.create_task(wait("normal", PRIORITY_LOW - 1))
+    await asyncio.sleep(0)
+
+    limiter.release()
+    await asyncio.gather(background, normal)
+    assert order == ["normal", "background"]
+
+
+@pytest.mark.asyncio
+async def test_acquire_times_out_when_saturated() -> None:
+    limiter = AdaptiveLimiter("test", max_limit=1, queue_timeout=0.01)
+    await limiter.acquire()
+
+    with pytest.raises(LimiterTimeoutError):
+        await limiter.acquire()
+
+    assert limiter.stats().timeouts == 1
+    assert limiter.queue_depth == 0
+
+    # 취소된 대기자가 남아 있어도 다음 요청은 바로 슬롯을 받음
+    limiter.release()
+    await asyncio.wait_for(limiter.acquire(), 0.1)
+
+
+@pytest.mark.asyncio
+async def test_overload_decreases_limit_and_success_recovers() -> None:
+    limiter = AdaptiveLimiter("test", max_limit=8, min_limit=1)
+
+    with pytest.raises(httpx.ReadTimeout):
+        async with limiter.slot():
+            raise httpx.ReadTimeout("timeout")
+    assert limiter.limit == 4
+
+    # 쿨다운 안의 연속 과부하는 한 번만 반영
+    async with limiter.slot() as slot:
+        slot.mark_overloaded()
+    assert limiter.limit == 4
+    assert limiter.stats().overloads == 2
+
+    for _ in range(10):
+        async with limiter.slot():
+            pass
+    assert limiter.limit > 4
+    assert limiter.stats().in_flight == 0
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+import pytest
+
+from ai.utils.cpu_executor import CpuExecutor, CpuExecutorBusyError
+
+
+@pytest.mark.asyncio
+async def test_runs_off_event_loop_and_records_stats() -> None:
+    executor = CpuExecutor("test", kind="thread", max_workers=2, max_queue=2, queue_timeout=1.0)
+    loop_thread = threading.get_ident()
+
+    results = await asyncio.gather(*(executor.run(threading.get_ident) for _ in range(4)))
+
+    assert loop_thread not in results
+    stats = executor.stats()
+    assert (stats.completed, stats.running, stats.queued, stats.rejected) == (4, 0, 0, 0)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_saturated() -> None:
+    executor = CpuExecutor("test", kind="thread", max_workers=1, max_queue=0, queue_timeout=0.05)
+    release = threading.Event()
+
+    blocked = asyncio.create_task(executor.run(release.wait, 5))
+    await asyncio.sleep(0.01)
+    with pytest.raises(CpuExecutorBusyError):
+        await executor.run(sum, [1, 2])
+
+    release.set()
+    assert await blocked is True
+    assert executor.stats().rejected == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_pool() -> None:
+    executor = CpuExecutor("test", kind="process", max_workers=1, max_queue=1, queue_timeout=1.0)
+    assert await executor.run(sum, [1, 2, 3]) == 6
+    executor.shutdown()
+
+
+def test_unknown_kind_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        CpuExecutor("test", kind="gpu", max_workers=1, max_queue=0, queue_timeout=1.0)
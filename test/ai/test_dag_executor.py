@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import pytest
+
+from ai.services.agent.orchestrator_agent import OrchestratorAgent
+from ai.utils.dag_executor import DagExecutor
+
+
+async def _value(value: str, delay: float = 0.0) -> str:
+    await asyncio.sleep(delay)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_independent_nodes_run_concurrently() -> None:
+    dag = DagExecutor("test")
+    dag.add("a", lambda: _value("a", 0.1))
+    dag.add("b", lambda: _value("b", 0.1))
+
+    async def join(a: str, b: str) -> str:
+        return a + b
+
+    dag.add("ab", join, "a", "b")
+
+    started = time.monotonic()
+    run = await dag.run()
+
+    assert run.results["ab"] == "ab"
+    assert time.monotonic() - started < 0.18
+    assert {timing.name for timing in run.timings} == {"a", "b", "ab"}
+
+
+@pytest.mark.asyncio
+async def test_map_node_keeps_order_and_reports_each_item() -> None:
+    dag = DagExecutor("test")
+
+    async def items() -> list[str]:
+        return ["x", "y", "z"]
+
+    async def upper(item: str, suffix: str) -> str:
+        await asyncio.sleep(0.03 if item == "x" else 0.0)
+        return item.upper() + suffix
+
+    dag.add("items", items)
+    dag.add("suffix", lambda: _value("!"))
+    dag.add_map("upper", upper, "items", "suffix")
+
+    completed: list[str] = []
+
+    async def on_complete(name: str, result: object) -> None:
+        completed.append(name)
+
+    run = await dag.run(on_complete)
+
+    assert run.results["upper"] == ["X!", "Y!", "Z!"]
+    assert completed.index("upper[1]") < completed.index("upper[0]") < completed.index("upper")
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_remaining_nodes() -> None:
+    dag = DagExecutor("test")
+
+    async def fail() -> str:
+        raise RuntimeError("boom")
+
+    dag.add("slow", lambda: _value("slow", 5.0))
+    dag.add("fail", fail)
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(dag.run(), 1.0)
+
+
+def test_unknown_dependency_is_rejected() -> None:
+    dag = DagExecutor("test")
+    with pytest.raises(ValueError):
+        dag.add("a", lambda: _value("a"), "missing")
+
+
+@pytest.mark.asyncio
+async def test_reply_mode_outputs_match_sequential_pipeline(monkeypatch: pytest.MonkeyPatch) -> None:
+    orchestrator = OrchestratorAgent()
+
+    async def summarize(input_text: str) -> str:
+        return f"요약({input_text})"
+
+    async def improve_summary(output: str, original_input: str, agent: object) -> str:
+        return output + "+보완"
+
+    async def titles(input_text: str) -> list[str]:
+        return [f"제목({input_text})"]
+
+    async def replies(input_text: str) -> list[str]:
+        return [f"답장1({input_text})", f"답장2({input_text})"]
+
+    improved: list[str] = []
+
+    async def improve_reply(output: str, original_input: str, agent: object) -> str:
+        improved.append(output)
+        return output + "+보완"
+
+    monkeypatch.setattr(orchestrator.summarizer_agent, "run", summarize)
+    monkeypatch.setattr(orchestrator.feedback_agent, "improve_summary", improve_summary)
+    monkeypatch.setattr(orchestrator.title_agent, "run", titles)
+    monkeypatch.setattr(orchestrator.reply_agent_old, "run", replies)
+    monkeypatch.setattr(orchestrator.reply_agent_new, "run", replies)
+    monkeypatch.setattr(orchestrator.feedback_agent, "improve_reply", improve_reply)
+
+    assert await orchestrator.run_reply_mode("대화") == (
+        ["제목(요약(대화)+보완)"],
+        ["답장1(요약(대화))", "답장2(요약(대화))"],
+    )
+    # 답장 모드는 보완 전 답장을 반환하므로 답장별 보완을 호출하지 않음
+    assert improved == []
+    manual_titles, manual_replies = await orchestrator.run_manual_mode("상황", "말투", "용도", "")
+    assert manual_titles == ["제목(상황)"]
+    assert [reply.endswith("+보완") for reply in manual_replies] == [True, True]
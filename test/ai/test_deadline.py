@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from ai.utils.deadline import (
+    DeadlineExceededError,
+    clamp_timeout,
+    deadline_scope,
+    has_budget,
+    remaining,
+    within_deadline,
+)
+
+
+def test_nested_scope_keeps_earlier_deadline() -> None:
+    assert remaining() is None
+    with deadline_scope(1.0):
+        with deadline_scope(10.0):
+            left = remaining()
+            assert left is not None and left <= 1.0
+        with deadline_scope(10.0, inherit=False):
+            left = remaining()
+            assert left is not None and left > 9.0
+        assert clamp_timeout(15.0) <= 1.0
+        assert has_budget(0.5)
+        assert not has_budget(3.0)
+    assert remaining() is None
+    assert clamp_timeout(15.0) == 15.0
+
+
+@pytest.mark.asyncio
+async def test_within_deadline_cancels_upstream_call() -> None:
+    with deadline_scope(0.05):
+        with pytest.raises(DeadlineExceededError):
+            async with within_deadline():
+                await asyncio.sleep(1)
+
+
+@pytest.mark.asyncio
+async def test_within_deadline_keeps_unrelated_timeout_errors() -> None:
+    with deadline_scope(1.0):
+        with pytest.raises(TimeoutError):
+            async with within_deadline():
+                raise TimeoutError
+
+
+@pytest.mark.asyncio
+async def test_deadline_propagates_to_child_tasks() -> None:
+    async def child() -> float | None:
+        return remaining()
+
+    with deadline_scope(5.0):
+        left = await asyncio.create_task(child())
+    assert left is not None and left <= 5.0
@@ -0,0 +1,42 @@
+import pytest
+
+from ai.utils.deduplicate_sentence import deduplicate_sentences
+
+
+def test_whole_text_repeated_twice() -> None:
+    assert deduplicate_sentences("그래 좋아그래 좋아") == "그래 좋아"
+
+
+def test_default_mode_keeps_sentences_that_differ_only_in_punctuation() -> None:
+    assert deduplicate_sentences("정말? 정말!") == "정말? 정말!"
+
+
+def test_exact_repeats_keep_original_separators() -> None:
+    text = "내일 보자.\n좋아! 내일 보자. 몇 시?\n\n7시"
+
+    assert deduplicate_sentences(text, "exact") == "내일 보자.\n좋아! 몇 시?\n7시"
+
+
+def test_normalized_mode_ignores_spacing_and_punctuation() -> None:
+    text = "오늘 정말 즐거웠어! 오늘 정말  즐거웠어. 다음에 또 보자"
+
+    assert deduplicate_sentences(text, "exact") == text
+    assert deduplicate_sentences(text, "normalized") == "오늘 정말 즐거웠어! 다음에 또 보자"
+
+
+def test_fuzzy_mode_drops_near_duplicates() -> None:
+    text = "오늘 만나서 정말 반가웠고 즐거웠어. 오늘 만나서 정말 반가웠고 즐거웠어요. 다음 주에 또 보자."
+
+    assert deduplicate_sentences(text, "normalized") == text
+    assert deduplicate_sentences(text, "fuzzy", 0.8) == "오늘 만나서 정말 반가웠고 즐거웠어. 다음 주에 또 보자."
+
+
+def test_unknown_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        deduplicate_sentences("하나. 둘.", "semantic")
+
+
+@pytest.mark.parametrize("threshold", [0.0, -0.5, 1.5])
+def test_threshold_outside_unit_interval_is_rejected(threshold: float) -> None:
+    with pytest.raises(ValueError):
+        deduplicate_sentences("하나. 둘.", "fuzzy", threshold)
@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from ai.utils.get_headers_payloads import CONFIG_DIR, PromptConfigCache, get_headers_payloads
+
+CONFIG_TEMPLATE = """
+SYSTEM_PROMPT:
+  '{prompt}'
+
+HYPER_PARAM:
+  topP: 0.8
+  topK: 0
+  maxTokens: 256
+  temperature: 0.5
+  repeatPenalty: 5.0
+  stopBefore: []
+  includeAiFilters: True
+  seed: 0
+"""
+
+
+def test_get_headers_payloads_fills_message_and_seed() -> None:
+    config_path = str(CONFIG_DIR / "config_situation_summary.yaml")
+
+    headers, payload = get_headers_payloads(config_path, "대화 내용")
+    _, random_payload = get_headers_payloads(config_path, "대화 내용", random_seed=True)
+
+    assert headers["Accept"] == "text/event-stream"
+    assert payload["messages"][1] == {"role": "user", "content": "대화 내용"}
+    assert payload["seed"] == 0
+    assert random_payload["topP"] == payload["topP"]
+
+
+def test_prompt_config_cache_rejects_invalid_config(tmp_path: Path) -> None:
+    config_path = tmp_path / "config_invalid.yaml"
+    config_path.write_text("PROMPT:\n  text: hi\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        PromptConfigCache(tmp_path).get(str(config_path))
+
+
+def test_prompt_config_cache_reloads_on_mtime_change(tmp_path: Path) -> None:
+    config_path = tmp_path / "config_test.yaml"
+    config_path.write_text(CONFIG_TEMPLATE.format(prompt="first"), encoding="utf-8")
+    cache = PromptConfigCache(tmp_path, reload_on_change=True)
+    cache.load_all()
+    assert cache.get(str(config_path)).system_prompt == "first"
+
+    config_path.write_text(CONFIG_TEMPLATE.format(prompt="second"), encoding="utf-8")
+    os.utime(config_path, (0, 1))
+
+    assert cache.get(str(config_path)).system_prompt == "second"
@@ -0,0 +1,67 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from ai.services.agent.image_pre_processor import EXIF_ORIENTATION, ImagePreprocessor, PreprocessPolicy
+
+
+def _encode(image: Image.Image, image_format: str, orientation: int | None = None) -> bytes:
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[EXIF_ORIENTATION] = orientation
+    with BytesIO() as buffer:
+        image.save(buffer, format=image_format, exif=exif)
+        return buffer.getvalue()
+
+
+def test_small_supported_image_is_not_reencoded() -> None:
+    data = _encode(Image.new("RGB", (300, 600), "white"), "PNG")
+    result = ImagePreprocessor(PreprocessPolicy(max_side=1024)).preprocess_image(data)
+
+    assert result.data == data
+    assert result.extension == "png"
+    assert not result.reencoded
+
+
+def test_large_image_is_downscaled_and_recompressed() -> None:
+    preprocessor = ImagePreprocessor(PreprocessPolicy(max_side=1000, output_format="JPEG", quality=80))
+    data = _encode(Image.new("RGBA", (1170, 2532), "white"), "PNG")
+    result = preprocessor.preprocess_image(data)
+
+    with Image.open(BytesIO(result.data)) as image:
+        assert image.format == "JPEG"
+        assert max(image.size) == 1000
+    assert result.extension == "jpg"
+    assert preprocessor.stats().bytes_saved == len(data) - len(result.data)
+
+
+def test_rotated_jpeg_is_transposed() -> None:
+    data = _encode(Image.new("RGB", (200, 100), "white"), "JPEG", orientation=6)
+    result = ImagePreprocessor(PreprocessPolicy(max_side=1024)).preprocess_image(data)
+
+    with Image.open(BytesIO(result.data)) as image:
+        assert image.size == (100, 200)
+    assert result.reencoded
+
+
+def test_unsupported_format_is_converted() -> None:
+    data = _encode(Image.new("RGB", (100, 100), "white"), "BMP")
+    result = ImagePreprocessor(PreprocessPolicy(max_side=1024)).preprocess_image(data)
+    assert result.extension == "jpg"
+
+
+def test_invalid_image_raises_value_error() -> None:
+    with pytest.raises(ValueError):
+        ImagePreprocessor().preprocess(b"not an image")
+
+
+@pytest.mark.asyncio
+async def test_preprocess_image_async_records_stats() -> None:
+    preprocessor = ImagePreprocessor(PreprocessPolicy(max_side=100))
+    data = _encode(Image.new("RGB", (400, 200), "white"), "JPEG")
+    result = await preprocessor.preprocess_image_async(data)
+
+    with Image.open(BytesIO(result.data)) as image:
+        assert image.size == (100, 50)
+    assert preprocessor.stats().images == 1
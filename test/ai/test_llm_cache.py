@@ -0,0 +1,39 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ai.services.generation.title_suggestion import TitleSuggestion
+from ai.utils.circuit_breaker import CircuitBreaker
+from ai.utils.clova_http import clova_http
+from ai.utils.llm_cache import llm_cache
+from app.core.settings import settings
+
+
+@pytest.mark.asyncio
+async def test_concurrent_title_fetches_fill_cache_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0.01)
+        data = {"message": {"role": "assistant", "content": "저녁 약속"}, "stopReason": "stop_before"}
+        return httpx.Response(200, content=f"event: result\ndata: {json.dumps(data, ensure_ascii=False)}\n\n")
+
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    monkeypatch.setattr(clova_http, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    llm_cache.memory.clear()
+    title = TitleSuggestion()
+    title.breaker = CircuitBreaker("test")
+    config_path = str(title.BASE_DIR / "config" / "config_title_suggestion.yaml")
+
+    titles = await asyncio.gather(
+        *(title.fetch_title(clova_http.client, "내일 7시에 만나기로 함", config_path) for _ in range(3))
+    )
+
+    assert titles == ["저녁 약속"] * 3
+    assert requests == 1
+    assert await title.fetch_title(clova_http.client, "내일 7시에 만나기로 함", config_path) == "저녁 약속"
+    assert requests == 1
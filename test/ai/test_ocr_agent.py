@@ -0,0 +1,79 @@
+from io import BytesIO
+
+import httpx
+import pytest
+from PIL import Image, ImageDraw
+
+from ai.services.agent.ocr_agent import OcrAgent
+from ai.utils.ocr_result import OcrStatus
+from ai.utils.services import services
+from app.core.settings import settings
+
+
+def _png(index: int) -> bytes:
+    image = Image.new("RGB", (120, 240), "white")
+    ImageDraw.Draw(image).rectangle((10, 10 + index * 20, 100, 30 + index * 20), fill="black")
+    with BytesIO() as buffer:
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+def _server_error() -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://ocr.test")
+    return httpx.HTTPStatusError("server error", request=request, response=httpx.Response(503, request=request))
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ocr_cache_enabled", False)
+    monkeypatch.setattr(settings, "retry_base_delay", 0.0)
+
+
+async def test_only_failed_image_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    async def request_text(image_data: bytes, filename: str) -> str:
+        calls.append(filename)
+        if filename.startswith("b") and calls.count(filename) == 1:
+            raise _server_error()
+        return f"text-{filename[0]}"
+
+    monkeypatch.setattr(services.ocr, "request_text", request_text)
+    images = [(f"{name}.png", _png(index)) for index, name in enumerate("abcd")]
+    results = await OcrAgent().ocr_images(images)
+
+    assert [result.text for result in results] == ["text-a", "text-b", "text-c", "text-d"]
+    assert [result.attempts for result in results] == [1, 2, 1, 1]
+    assert sorted(calls) == ["a.png", "b.png", "b.png", "c.png", "d.png"]
+
+
+async def test_partial_text_is_kept_when_image_keeps_failing(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def request_text(image_data: bytes, filename: str) -> str:
+        if filename.startswith("b"):
+            raise httpx.HTTPStatusError(
+                "bad request",
+                request=httpx.Request("POST", "https://ocr.test"),
+                response=httpx.Response(400, request=httpx.Request("POST", "https://ocr.test")),
+            )
+        return f"text-{filename[0]}"
+
+    monkeypatch.setattr(services.ocr, "request_text", request_text)
+    results = await OcrAgent().ocr_images([("a.png", _png(0)), ("b.png", _png(1))])
+
+    assert results[0].status == OcrStatus.OK
+    assert results[1].status == OcrStatus.FAILED
+    assert results[1].attempts == 1
+
+
+async def test_empty_result_is_retried_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    async def request_text(image_data: bytes, filename: str) -> str:
+        calls.append(filename)
+        return ""
+
+    monkeypatch.setattr(services.ocr, "request_text", request_text)
+    results = await OcrAgent(max_retries=3).ocr_images([("a.png", _png(0))])
+
+    assert results[0].status == OcrStatus.EMPTY
+    assert results[0].attempts == 2
@@ -0,0 +1,111 @@
+import asyncio
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ai.services.agent.image_pre_processor import PreprocessedImage
+from ai.services.agent.ocr_agent import OcrAgent
+from ai.services.ocr.fixture_ocr import FixtureOcr
+from ai.services.ocr.ocr_backend import create_ocr_backend
+from ai.services.ocr.tesseract_ocr import TesseractOcr, parse_tsv
+from ai.utils.services import ServiceRegistry
+from app.core.settings import settings
+
+TSV = "\n".join(
+    [
+        "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext",
+        "1\t1\t0\t0\t0\t0\t0\t0\t1170\t2532\t-1\t",
+        "5\t1\t1\t1\t1\t1\t170\t310\t70\t40\t96.5\t내일",
+        "5\t1\t1\t1\t1\t2\t245\t310\t110\t40\t91.0\t만날까?",
+        "5\t1\t1\t1\t2\t1\t900\t430\t160\t40\t88.0\t좋아",
+        "5\t1\t1\t1\t2\t2\t1070\t430\t60\t40\t12.0\t@@",
+    ]
+)
+
+
+def test_backend_is_selected_by_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ocr_backend", "fixture")
+
+    assert isinstance(ServiceRegistry().ocr, FixtureOcr)
+    assert isinstance(create_ocr_backend("tesseract"), TesseractOcr)
+    with pytest.raises(ValueError):
+        create_ocr_backend("paddle")
+
+
+def test_tesseract_tsv_words_become_transcript_fields() -> None:
+    fields = parse_tsv(TSV)
+
+    assert [field.text for field in fields] == ["내일", "만날까?", "좋아", "@@"]
+    assert fields[0].confidence == pytest.approx(0.965)
+    assert fields[2].right == 1060
+
+
+async def test_fixture_backend_answers_from_saved_clova_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ocr_fixture_default", "clova_ocr_chat.json")
+    backend = FixtureOcr()
+
+    text = await backend.request_text(b"any image", "upload.png")
+
+    assert text.startswith("A: 민지 내일 몇 시에 만날까?")
+    assert backend.retry_policy is None
+
+
+async def test_fixture_backend_fails_without_matching_fixture() -> None:
+    with pytest.raises(FileNotFoundError):
+        await FixtureOcr().request_text(b"any image", "upload.png")
+
+
+async def test_fixture_backend_stays_inside_fixture_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    fixture_dir = tmp_path / "fixtures"
+    fixture_dir.mkdir()
+    shutil.copy("test/assets/clova_ocr_chat.json", tmp_path / "secret.json")
+    shutil.copy("test/assets/clova_ocr_chat.json", fixture_dir / "chat.json")
+    backend = FixtureOcr(str(fixture_dir))
+
+    # 업로드 파일 이름의 디렉터리 부분은 무시
+    assert await backend.request_text(b"any image", "../../chat.png")
+    for filename in ("../secret.png", str(tmp_path / "secret.png")):
+        with pytest.raises(FileNotFoundError):
+            await backend.request_text(b"any image", filename)
+    monkeypatch.setattr(settings, "ocr_fixture_default", "../secret.json")
+    with pytest.raises(FileNotFoundError):
+        await backend.request_text(b"any image", "upload.png")
+
+
+async def test_tesseract_process_is_killed_on_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ocr_tesseract_timeout", 0.05)
+    backend = TesseractOcr()
+    processes: list[asyncio.subprocess.Process] = []
+    create = asyncio.create_subprocess_exec
+
+    async def spawn(*args: str, **kwargs: Any) -> asyncio.subprocess.Process:
+        # sleep 에는 tesseract 인자 대신 대기 시간만 넘김
+        process = await create("sleep", "5", **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", spawn)
+
+    with pytest.raises(TimeoutError):
+        await backend.request_text(b"image", "upload.png")
+    assert processes[0].returncode is not None
+
+
+async def test_local_backend_is_not_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = ServiceRegistry()
+    monkeypatch.setattr(settings, "ocr_cache_enabled", False)
+    monkeypatch.setattr(registry, "ocr", FixtureOcr())
+    monkeypatch.setattr("ai.services.agent.ocr_agent.services", registry)
+
+    agent = OcrAgent()
+    monkeypatch.setattr(agent.preprocessor, "preprocess_image_async", _passthrough)
+    results = await agent.ocr_images([("missing.png", b"not an image")])
+
+    assert results[0].attempts == 1
+    assert results[0].text == ""
+
+
+async def _passthrough(image_bytes: bytes) -> PreprocessedImage:
+    return PreprocessedImage(image_bytes, "png", len(image_bytes), reencoded=False)
@@ -0,0 +1,107 @@
+import random
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageDraw
+
+from ai.services.agent.ocr_agent import OcrAgent
+from ai.utils.image_dto import ImageDto
+from ai.utils.ocr_result import OcrStatus
+from ai.utils.ocr_cache import (
+    OCR_TEXT_FORMAT_VERSION,
+    PerceptualKeyIndex,
+    make_ocr_cache_key,
+    ocr_cache,
+    ocr_cache_scope,
+)
+from ai.utils.services import services
+from app.core.settings import settings
+
+
+def _screenshot(seed: int, image_format: str, quality: int = 95) -> bytes:
+    rng = random.Random(seed)
+    image = Image.new("RGB", (360, 720), (186, 206, 224))
+    draw = ImageDraw.Draw(image)
+    for y in range(20, 680, 70):
+        left = rng.randint(10, 150)
+        draw.rectangle((left, y, left + rng.randint(80, 190), y + 50), fill=(255, 255, 255))
+    with BytesIO() as buffer:
+        image.save(buffer, format=image_format, quality=quality)
+        return buffer.getvalue()
+
+
+async def test_sha256_key_matches_identical_bytes_only() -> None:
+    png = _screenshot(1, "PNG")
+
+    assert await make_ocr_cache_key(png, "clova", "sha256") == await make_ocr_cache_key(bytes(png), "clova", "sha256")
+    assert await make_ocr_cache_key(png, "clova", "sha256") != await make_ocr_cache_key(
+        _screenshot(1, "JPEG"), "clova", "sha256"
+    )
+
+
+async def test_phash_key_matches_recompressed_duplicate() -> None:
+    png = _screenshot(1, "PNG")
+
+    with ocr_cache_scope("user-1"):
+        assert await make_ocr_cache_key(png, "clova", "phash") == await make_ocr_cache_key(
+            _screenshot(1, "JPEG", 90), "clova", "phash"
+        )
+        assert await make_ocr_cache_key(png, "clova", "phash") != await make_ocr_cache_key(
+            _screenshot(2, "PNG"), "clova", "phash"
+        )
+
+
+async def test_phash_key_is_not_shared_across_users() -> None:
+    png = _screenshot(4, "PNG")
+
+    with ocr_cache_scope("user-1"):
+        key = await make_ocr_cache_key(png, "clova", "phash")
+    with ocr_cache_scope("user-2"):
+        assert await make_ocr_cache_key(png, "clova", "phash") != key
+    # 비로그인 사용자는 바이트가 같은 이미지만 적중
+    assert await make_ocr_cache_key(png, "clova", "phash") == await make_ocr_cache_key(png, "clova", "sha256")
+
+
+def test_phash_index_reuses_key_within_distance() -> None:
+    index = PerceptualKeyIndex(max_entries=4, max_distance=2)
+    key = index.resolve("user-1", 50, 0b1111)
+
+    assert index.resolve("user-1", 50, 0b1100) == key
+    assert index.resolve("user-2", 50, 0b1111) != key
+    assert index.resolve("user-1", 60, 0b1111) != key
+    assert index.resolve("user-1", 50, 0b0000) != key
+
+
+async def test_key_depends_on_backend_and_transcript_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    png = _screenshot(5, "PNG")
+    key = await make_ocr_cache_key(png, "clova", "sha256")
+
+    # 다른 엔진이나 이전 대화록 형식으로 저장된 텍스트는 공유하지 않음
+    assert await make_ocr_cache_key(png, "fixture", "sha256") != key
+    assert key.startswith(f"clova:v{OCR_TEXT_FORMAT_VERSION}-layout:")
+    monkeypatch.setattr(settings, "ocr_layout_transcript", False)
+    assert await make_ocr_cache_key(png, "clova", "sha256") != key
+
+
+async def test_unknown_key_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        await make_ocr_cache_key(b"data", "clova", "md5")
+
+
+async def test_repeated_image_skips_ocr(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    async def request_text(image_data: bytes, filename: str) -> str:
+        calls.append(filename)
+        return "내일 몇 시에 만날까?"
+
+    monkeypatch.setattr(services.ocr, "request_text", request_text)
+    ocr_cache.memory.clear()
+    image = ImageDto(name="chat.png", data=_screenshot(3, "PNG"))
+    agent = OcrAgent()
+
+    assert (await agent._ocr_image(image)).status == OcrStatus.OK
+    cached = await agent._ocr_image(image)
+    assert cached.status == OcrStatus.CACHED
+    assert cached.text == "내일 몇 시에 만날까?"
+    assert calls == ["chat.png"]
@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ai.services.agent.ocr_post_processing_agent import OcrPostProcessingAgent
+from ai.services.ocr.clova_ocr import ClovaOcr
+from ai.services.ocr.ocr_layout import OcrField, build_transcript
+from app.core.settings import settings
+
+ASSET = Path(__file__).resolve().parent.parent / "assets" / "clova_ocr_chat.json"
+
+
+@pytest.fixture
+def ocr_result() -> dict[str, Any]:
+    result: dict[str, Any] = json.loads(ASSET.read_text(encoding="utf-8"))
+    return result
+
+
+def test_transcript_groups_bubbles_by_speaker(ocr_result: dict[str, Any]) -> None:
+    text = ClovaOcr.extract_text_from_result(ocr_result, "chat.png")
+
+    assert text.splitlines() == [
+        "A: 민지 내일 몇 시에 만날까?",
+        "B: 7시 어때? 저녁 먹고 영화 보자",
+        "A: 좋아! 그럼 강남역 11번 출구에서 봐",
+        "B: ㅋㅋㅋ 알겠어",
+    ]
+
+
+def test_ui_chrome_and_low_confidence_fields_are_dropped(ocr_result: dict[str, Any]) -> None:
+    text = ClovaOcr.extract_text_from_result(ocr_result, "chat.png")
+
+    for noise in ("87%", "3:41", "3:40", "2024년", "메시지", "흐릿"):
+        assert noise not in text
+
+
+def test_fields_without_geometry_fall_back_to_flat_text(ocr_result: dict[str, Any]) -> None:
+    for field in ocr_result["images"][0]["fields"]:
+        del field["boundingPoly"]
+
+    assert ClovaOcr.extract_text_from_result(ocr_result, "chat.png").startswith("오후 3:41 87%")
+
+
+def test_layout_transcript_can_be_disabled(ocr_result: dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ocr_layout_transcript", False)
+
+    assert "\n" not in ClovaOcr.extract_text_from_result(ocr_result, "chat.png")
+
+
+def test_empty_fields_build_empty_transcript() -> None:
+    assert build_transcript([OcrField("흐릿", 0.1, 0, 0, 10, 10)]) == ""
+
+
+def test_post_processing_keeps_speakers_and_lines() -> None:
+    text = OcrPostProcessingAgent().run("A: 내일  몇 시에 만날까? 😀\nB: 7시 어때?")
+
+    assert text == "A: 내일 몇 시에 만날까?\nB: 7시 어때?"
@@ -0,0 +1,59 @@
+from ai.services.agent.ocr_merger import OcrMerger
+
+FIRST = "오후 3:41 내일 몇 시에 만날까? 7시 어때? 저녁 먹고 영화 보자 좋아! 그럼 강남역 11번 출구에서"
+# 상태 표시줄 시각이 다르고, 앞 이미지 끝에서 잘렸던 말풍선이 온전히 보이는 다음 스크린샷
+SECOND = "오후 3:42 저녁 먹고 영화 보자 좋아! 그럼 강남역 11번 출구에서 봐 ㅋㅋㅋ 알겠어 늦지 마"
+
+
+def test_overlapping_screenshots_are_merged_once() -> None:
+    merger = OcrMerger()
+    result = merger.merge([FIRST, SECOND])
+
+    assert result.text == f"{FIRST}\n봐 ㅋㅋㅋ 알겠어 늦지 마"
+    assert result.overlaps == 1
+    assert result.chars_saved == len(FIRST) + len(SECOND) + 1 - len(result.text)
+    assert merger.stats().chars_saved == result.chars_saved
+
+
+def test_duplicate_image_is_dropped() -> None:
+    result = OcrMerger().merge([FIRST, SECOND, FIRST.replace("?", "")])
+
+    assert result.duplicate_images == 1
+    assert result.text.count("내일 몇 시에 만날까") == 1
+
+
+def test_unrelated_screenshots_are_kept() -> None:
+    other = "다음 주 토요일에 부산 여행 갈래? 기차표는 내가 알아볼게"
+    result = OcrMerger().merge([FIRST, other])
+
+    assert result.text == f"{FIRST}\n{other}"
+    assert result.chars_saved == 0
+
+
+def test_line_transcripts_are_merged_by_line() -> None:
+    first = "A: 내일 몇 시에 만날까?\nB: 7시 어때?\nA: 좋아!"
+    second = "B: 7시 어때?\nA: 좋아!\nB: 강남역에서 봐"
+    result = OcrMerger().merge([first, second])
+
+    assert result.text == f"{first}\nB: 강남역에서 봐"
+
+
+def test_short_repeated_exchange_is_not_dropped() -> None:
+    first = (
+        "A: 내일 몇 시에 만날까?\nB: ㅋㅋ\nA: ㅇㅇ\nB: 7시 어때?\nA: 좋아!\nB: 강남역에서 봐\n"
+        "A: 11번 출구?\nB: 응 거기\nA: 알겠어"
+    )
+    second = "B: ㅋㅋ\nA: ㅇㅇ"
+    result = OcrMerger().merge([first, second])
+
+    assert result.duplicate_images == 0
+    assert result.text == f"{first}\n{second}"
+
+
+def test_cropped_part_of_earlier_image_is_dropped() -> None:
+    first = "A: 내일 몇 시에 만날까?\nB: 7시 어때?\nA: 좋아!\nB: 강남역에서 봐\nA: 알겠어\nB: 늦지 마"
+    second = "B: 7시 어때?\nA: 좋아!\nB: 강남역에서 봐\nA: 알겠어"
+    result = OcrMerger().merge([first, second])
+
+    assert result.duplicate_images == 1
+    assert result.text == first
@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from ai.utils.response_cache import ResponseCache, TtlLruCache
+
+
+def _cache(max_entries: int = 10, max_bytes: int = 1024, ttl_seconds: float = 60.0) -> TtlLruCache[str]:
+    return TtlLruCache(max_entries=max_entries, max_bytes=max_bytes, ttl_seconds=ttl_seconds, sizeof=len)
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = _cache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+
+
+def test_lru_respects_byte_cap() -> None:
+    cache = _cache(max_bytes=10)
+    cache.set("a", "12345")
+    cache.set("b", "12345")
+
+    assert cache.get("a") is None
+    assert cache.size_bytes <= 10
+
+
+def test_lru_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = _cache(ttl_seconds=1.0)
+    cache.set("a", "1")
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 2.0)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_response_cache_counts_hits_and_misses() -> None:
+    cache: ResponseCache[str] = ResponseCache(_cache())
+
+    assert await cache.get("key") is None
+    await cache.set("key", "value")
+    assert await cache.get("key") == "value"
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from ai.services.generation.reply_seggestion import ReplySuggestion
+from ai.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from ai.utils.clova_http import clova_http
+from ai.utils.deadline import DeadlineExceededError, deadline_scope
+from ai.utils.retry_policy import RetryBudget, RetryPolicy, is_retryable, retry_tracking
+
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://example.com")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status_code, request=request))
+
+
+def test_retryable_error_classification() -> None:
+    assert is_retryable(_status_error(503))
+    assert is_retryable(_status_error(429))
+    assert is_retryable(httpx.ConnectError("connect"))
+    assert not is_retryable(_status_error(400))
+    assert not is_retryable(CircuitOpenError("open"))
+    assert not is_retryable(DeadlineExceededError("deadline"))
+
+
+def test_backoff_uses_full_jitter_with_cap() -> None:
+    policy = RetryPolicy("test", base_delay=0.5, max_delay=2.0, budget=RetryBudget(capacity=1, refill_per_second=0))
+    delays = [policy.backoff_delay(10) for _ in range(100)]
+    assert all(0 <= delay <= 2.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_call_retries_only_retryable_errors_within_budget() -> None:
+    policy = RetryPolicy("test", base_delay=0.0, max_delay=0.0, budget=RetryBudget(capacity=1, refill_per_second=0))
+    calls = 0
+
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        raise _status_error(503)
+
+    with retry_tracking() as retries, pytest.raises(httpx.HTTPStatusError):
+        await policy.call(flaky, max_retries=3)
+
+    # 예산이 1개뿐이므로 한 번만 재시도
+    assert calls == 2
+    assert retries.by_upstream == {"test": 1}
+    assert policy.stats().budget_exhausted == 1
+
+    async def bad_request() -> str:
+        raise _status_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await policy.call(bad_request, max_retries=3)
+
+
+@pytest.mark.asyncio
+async def test_retry_skipped_when_deadline_is_near() -> None:
+    policy = RetryPolicy("test", base_delay=0.0, max_delay=0.0, budget=RetryBudget(capacity=5, refill_per_second=0))
+    with deadline_scope(0.5):
+        assert not await policy.retry(0)
+    assert await policy.retry(0)
+
+
+@pytest.mark.asyncio
+async def test_studio_reply_retries_server_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = (ASSETS_DIR / "clova_stream_reply.txt").read_bytes()
+    responses = [httpx.Response(503, text="busy"), httpx.Response(200, content=stream)]
+    transport = httpx.MockTransport(lambda request: responses.pop(0))
+    monkeypatch.setattr(clova_http, "_client", httpx.AsyncClient(transport=transport))
+
+    reply = ReplySuggestion()
+    reply.breaker = CircuitBreaker("test", failure_threshold=5)
+    reply.retry_policy = RetryPolicy(
+        "test", base_delay=0.0, max_delay=0.0, budget=RetryBudget(capacity=5, refill_per_second=0)
+    )
+
+    with retry_tracking() as retries:
+        result = await reply.generate_suggestions("상황: 약속 시간 정하기", "config_reply_suggestions.yaml", 1)
+
+    assert result[0] not in reply.fallback_replies
+    assert responses == []
+    assert retries.by_upstream == {"test": 1}
@@ -0,0 +1,26 @@
+import pytest
+
+from ai.services.agent.agent_registry import AgentRegistry
+from ai.services.ocr.clova_ocr import ClovaOcr
+from ai.utils.services import ServiceRegistry
+
+
+def test_agents_are_created_once_and_shared_with_orchestrator() -> None:
+    registry = AgentRegistry()
+    assert registry.summarizer is registry.summarizer
+    assert registry.orchestrator.summarizer_agent is registry.summarizer
+    assert registry.orchestrator.reply_agent_old is registry.reply_old
+    assert registry.orchestrator.feedback_agent is registry.feedback
+
+
+@pytest.mark.asyncio
+async def test_close_only_closes_created_clients() -> None:
+    registry = ServiceRegistry()
+    await registry.close()
+    assert "ocr" not in registry.__dict__
+
+    ocr = registry.ocr
+    assert isinstance(ocr, ClovaOcr)
+    client = ocr.client
+    await registry.close()
+    assert client.is_closed
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from ai.utils.single_flight import Emit, SingleFlight, make_flight_key
+
+
+def test_flight_key_normalizes_whitespace_and_scope() -> None:
+    assert make_flight_key("user", "사과  하려는\n상황", None) == make_flight_key("user", "사과 하려는 상황", "")
+    assert make_flight_key("user", "상황") != make_flight_key("guest", "상황")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    flight: SingleFlight[str, str] = SingleFlight("test")
+    calls = 0
+
+    async def work(emit: Emit[str]) -> str:
+        nonlocal calls
+        calls += 1
+        await emit("first")
+        await asyncio.sleep(0.05)
+        await emit("second")
+        return "result"
+
+    leader_events: list[str] = []
+    follower_events: list[str] = []
+
+    def collect(events: list[str]) -> Emit[str]:
+        async def on_event(event: str) -> None:
+            events.append(event)
+
+        return on_event
+
+    leader = asyncio.create_task(flight.do("key", work, collect(leader_events)))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(flight.do("key", work, collect(follower_events)))
+
+    assert list(await asyncio.gather(leader, follower)) == ["result", "result"]
+    assert calls == 1
+    # 늦게 합류한 요청도 지난 이벤트부터 모두 받음
+    assert leader_events == follower_events == ["first", "second"]
+    assert flight.stats().coalesced == 1
+    assert flight.stats().coalesce_rate == 0.5
+    assert flight.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_execution_cancelled_when_all_waiters_leave() -> None:
+    flight: SingleFlight[str, str] = SingleFlight("test")
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work(emit: Emit[str]) -> str:
+        started.set()
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "result"
+
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1.0)
+    assert flight.stats().cancelled == 1
+    assert flight.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter() -> None:
+    flight: SingleFlight[str, str] = SingleFlight("test")
+
+    async def work(emit: Emit[str]) -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(flight.do("key", work), flight.do("key", work), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
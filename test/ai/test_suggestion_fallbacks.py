@@ -0,0 +1,101 @@
+import dataclasses
+import json
+
+import httpx
+import pytest
+
+from ai.services.generation.reply_seggestion import ReplySuggestion
+from ai.services.generation.title_suggestion import TitleSuggestion
+from ai.utils.circuit_breaker import CircuitBreaker
+from ai.utils.clova_http import clova_http
+from ai.utils.get_headers_payloads import MultiCandidateConfig, PromptTemplate, prompt_configs
+
+
+def _stream(content: str) -> bytes:
+    data = {"message": {"role": "assistant", "content": content}, "stopReason": "stop_before"}
+    return f"event: result\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+
+
+@pytest.fixture
+def multi_candidate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """설정과 무관하게 MULTI_CANDIDATE 를 켠 템플릿 사용"""
+    get = prompt_configs.get
+
+    def get_with_multi_candidate(config_path: str) -> PromptTemplate:
+        multi = MultiCandidateConfig(instruction="후보를 {count}개 작성해주세요.", max_tokens=500)
+        return dataclasses.replace(get(config_path), multi_candidate=multi)
+
+    monkeypatch.setattr(prompt_configs, "get", get_with_multi_candidate)
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, contents: list[str]) -> list[dict[str, object]]:
+    """요청마다 contents 를 차례로 응답하고, 받은 페이로드를 기록"""
+    payloads: list[dict[str, object]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, content=_stream(contents[len(payloads) - 1]))
+
+    monkeypatch.setattr(clova_http, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return payloads
+
+
+def _open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=60.0)
+    breaker.record_failure()
+    return breaker
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("multi_candidate")
+async def test_reply_falls_back_to_fan_out_when_candidates_are_malformed(monkeypatch: pytest.MonkeyPatch) -> None:
+    payloads = _serve(monkeypatch, ["번호 없이 쓴 답장 하나", "첫 번째 답장", "두 번째 답장", "세 번째 답장"])
+    reply = ReplySuggestion()
+    reply.breaker = CircuitBreaker("test")
+
+    result = await reply.generate_suggestions("상황: 약속 시간 정하기", "config_reply_suggestions.yaml")
+
+    assert sorted(result) == ["두 번째 답장", "세 번째 답장", "첫 번째 답장"]
+    assert len(payloads) == 4
+    assert "후보를 3개" in str(payloads[0]["messages"])
+    assert all("후보를" not in str(payload["messages"]) for payload in payloads[1:])
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("multi_candidate")
+async def test_reply_returns_fallbacks_when_circuit_is_open(monkeypatch: pytest.MonkeyPatch) -> None:
+    payloads = _serve(monkeypatch, [])
+    reply = ReplySuggestion()
+    reply.breaker = _open_breaker()
+
+    result = await reply.generate_suggestions("상황: 약속 시간 정하기", "config_reply_suggestions.yaml")
+
+    assert len(result) == 3
+    assert set(result) <= set(reply.fallback_replies)
+    assert payloads == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("multi_candidate")
+async def test_title_falls_back_to_fan_out_when_candidates_are_malformed(monkeypatch: pytest.MonkeyPatch) -> None:
+    payloads = _serve(monkeypatch, ["[1] 제목 하나뿐", "약속 잡기", "저녁 약속", "강남역 만남"])
+    title = TitleSuggestion()
+    title.breaker = CircuitBreaker("test")
+
+    result = await title.generate_title_suggestions("내일 7시에 강남역에서 만나기로 함", use_cache=False)
+
+    assert sorted(result) == ["강남역 만남", "약속 잡기", "저녁 약속"]
+    assert len(payloads) == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("multi_candidate")
+async def test_title_returns_fallbacks_when_circuit_is_open(monkeypatch: pytest.MonkeyPatch) -> None:
+    payloads = _serve(monkeypatch, [])
+    title = TitleSuggestion()
+    title.breaker = _open_breaker()
+
+    result = await title.generate_title_suggestions("내일 7시에 강남역에서 만나기로 함", use_cache=False)
+
+    assert result == title.fallback_titles
+    assert payloads == []
@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from app.core.enums import JobStatus
+from app.core.settings import settings
+from app.job.job_collection import JobCollection
+from app.job.job_router import _stream_job
+from app.main import app
+
+
+@pytest.mark.asyncio
+async def test_create_and_get_job(auth_header: dict[str, str]) -> None:
+    data = {
+        "regenerate": {
+            "exist_suggestion": "내가 저번에 한 말 때문에 상처 받았다면 정말 미안해.",
+            "length": "long",
+            "detail": "앞으로 잘 지내자는 내용을 추가 해줘",
+        }
+    }
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        created = await client.post("/suggester/jobs", headers=auth_header, json=data)
+        job_id = created.json()["job_id"]
+        response = await client.get(f"/suggester/jobs/{job_id}", headers=auth_header)
+        forbidden = await client.get(f"/suggester/jobs/{job_id}")
+
+    assert created.status_code == 202
+    assert created.json()["status"] == "pending"
+    assert response.status_code == 200
+    assert response.json()["job_type"] == "regenerate"
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_get_unknown_job() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/suggester/jobs/unknown")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stream_closes_after_max_duration(monkeypatch: pytest.MonkeyPatch) -> None:
+    pending = MagicMock(status=JobStatus.PENDING.value, attempts=0, events=[])
+    monkeypatch.setattr(JobCollection, "get_by_id", AsyncMock(return_value=pending))
+    monkeypatch.setattr(settings, "job_stream_max_seconds", 0.0)
+
+    events = [event async for event in _stream_job("job-1")]
+
+    assert events[0].startswith("event: status")
+    assert events[-1].startswith("event: error")
+    assert "504" in events[-1]
@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from ai.services.agent.orchestrator_agent import OnSuggestionEvent, SuggestionEvent
+from app.core.enums import JobStatus
+from app.history.history_service import HistoryService
+from app.job.job_collection import JobCollection
+from app.job.job_request import CreateJobRequest
+from app.job.job_service import JobService
+from app.job.job_worker import JobWorkerPool
+from app.suggester.suggester_dto import AiSuggestionDto
+from app.suggester.suggester_request import GenerateSuggestionRequest
+from app.user.user_document import UserDocument
+
+
+def _request() -> CreateJobRequest:
+    return CreateJobRequest(
+        generate=GenerateSuggestionRequest(situation="카카오톡으로 사과하려는 상황이야", tone="", usage="", detail="")
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_job_requires_exactly_one_request() -> None:
+    with pytest.raises(HTTPException) as e:
+        await JobService.create_job(None, CreateJobRequest())
+
+    assert e.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_claim_takes_job_once(test_user: UserDocument) -> None:
+    job = await JobService.create_job(test_user, _request())
+
+    claimed = await JobCollection.claim("worker-1", lease_seconds=60, max_attempts=3)
+    assert claimed is not None
+    assert claimed.id == job.id
+    assert claimed.status == JobStatus.RUNNING.value
+    assert claimed.attempts == 1
+
+    assert await JobCollection.claim("worker-2", lease_seconds=60, max_attempts=3) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed(test_user: UserDocument) -> None:
+    job = await JobService.create_job(test_user, _request())
+    await JobCollection.claim("worker-1", lease_seconds=-1, max_attempts=3)
+
+    reclaimed = await JobCollection.claim("worker-2", lease_seconds=60, max_attempts=3)
+
+    assert reclaimed is not None
+    assert reclaimed.id == job.id
+    assert reclaimed.attempts == 2
+    assert not await JobCollection.renew_lease(job.id, "worker-1", 60)
+    assert await JobCollection.renew_lease(job.id, "worker-2", 60)
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_job(test_user: UserDocument) -> None:
+    async def fake_generate(**kwargs: object) -> AiSuggestionDto:
+        on_event = kwargs["on_event"]
+        assert callable(on_event)
+        emit: OnSuggestionEvent = on_event
+        await emit(SuggestionEvent("title", 0, "제목"))
+        await emit(SuggestionEvent("reply", 0, "답장"))
+        return AiSuggestionDto(titles=["제목"], suggestions=["답장"])
+
+    pool = JobWorkerPool(concurrency=1, lease_seconds=60, poll_interval=0.05, max_attempts=3)
+    with patch("app.suggester.suggester_service.SuggesterService.generate_suggestions", side_effect=fake_generate):
+        await pool.start()
+        job = await JobService.create_job(test_user, _request())
+        pool.notify()
+
+        for _ in range(100):
+            job = await JobService.get_job(str(job.id), test_user)
+            if job.status == JobStatus.SUCCEEDED.value:
+                break
+            await asyncio.sleep(0.05)
+        await pool.stop()
+
+    response = JobService.to_response(job)
+    assert response.status == JobStatus.SUCCEEDED
+    assert response.titles == ["제목"]
+    assert response.replies == ["답장"]
+    assert response.result is not None
+    assert response.result.suggestions[0].content == "답장"
+    assert len(await HistoryService.get_histories_by_user(test_user.id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_lease_errors_and_cancels_work() -> None:
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def slow_job(job: object, on_event: object) -> None:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    claims = iter([MagicMock(id="job-1", job_type="generate", attempts=1)])
+    pool = JobWorkerPool(concurrency=1, lease_seconds=0.03, poll_interval=0.01, max_attempts=3)
+    with (
+        patch.object(JobCollection, "claim", AsyncMock(side_effect=lambda *args: next(claims, None))),
+        patch.object(JobCollection, "renew_lease", AsyncMock(side_effect=RuntimeError("mongo down"))),
+        patch.object(JobService, "run_job", side_effect=slow_job),
+    ):
+        await pool.start()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0.05)
+        assert started.is_set()
+        assert not pool._workers[0].done()
+        await pool.stop()
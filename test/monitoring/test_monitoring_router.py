@@ -0,0 +1,32 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+
+
+@pytest.mark.asyncio
+async def test_get_http_pool_stats() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/monitoring/http-pool")
+
+    assert response.status_code == 200
+    assert response.json()["max_connections"] > 0
+    assert response.json()["open_connections"] >= response.json()["idle_connections"]
+
+
+@pytest.mark.asyncio
+async def test_get_limiter_stats() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/monitoring/limiters")
+
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+@pytest.mark.asyncio
+async def test_get_circuit_breaker_stats() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/monitoring/circuit-breakers")
+
+    assert response.status_code == 200
+    assert all(stats["state"] in ("closed", "open", "half_open") for stats in response.json())
@@ -4,9 +4,11 @@ import pytest
 from unittest.mock import patch, AsyncMock
 from bson import ObjectId
 from httpx import AsyncClient, ASGITransport
+from ai.services.agent.orchestrator_agent import OnSuggestionEvent, SuggestionEvent
 from app.main import app
 from app.core.enums import PurposeType, SuggestionTagType, ToneType, ContentLength
 from app.suggester.suggester_document import SuggesterDocument
+from app.suggester.suggester_dto import AiSuggestionDto
 from app.user.user_document import UserDocument
 
 
@@ -326,3 +328,71 @@ async def test_regenerate_suggestion(auth_header: dict[str, str]) -> None:
     data = response.json()
     assert "suggestions" in data
     assert len(data["suggestions"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_generate_suggestion_stream() -> None:
+    async def fake_generate(**kwargs: object) -> AiSuggestionDto:
+        on_event = kwargs["on_event"]
+        assert callable(on_event)
+        emit: OnSuggestionEvent = on_event
+        await emit(SuggestionEvent("reply", 0, "답장"))
+        await emit(SuggestionEvent("title", 0, "제목"))
+        return AiSuggestionDto(titles=["제목"], suggestions=["답장"])
+
+    data = {"situation": "카카오톡으로 사과하려는 상황이야", "tone": "", "usage": "", "detail": ""}
+    with patch("app.suggester.suggester_service.SuggesterService.generate_suggestions", side_effect=fake_generate):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/suggester/generate/stream", json=data)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [line.removeprefix("event: ") for line in response.text.splitlines() if line.startswith("event:")]
+    assert events == ["reply", "title", "result"]
+    assert '{"suggestions":[{"title":"제목","content":"답장"}]}' in response.text
+
+
+@pytest.mark.asyncio
+async def test_analyze_and_generate() -> None:
+    files = {"image_file_1": ("test_image.jpg", b"image", "image/png")}
+    data = {"purpose": PurposeType.PHOTO_RESPONSE.value, "detail": "친한 친구야"}
+    with (
+        patch("ai.glee_agent.GleeAgent.analyze_situation", new_callable=AsyncMock) as mock_analyze,
+        patch(
+            "app.suggester.suggester_service.SuggesterService.generate_suggestions", new_callable=AsyncMock
+        ) as mock_generate,
+    ):
+        mock_analyze.return_value = "생일 축하 상황"
+        mock_generate.return_value = AiSuggestionDto(titles=["축하"], suggestions=["생일 축하해!"])
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/suggester/analyze-and-generate", files=files, data=data)
+
+    assert response.status_code == 200
+    assert response.json()["analysis"]["situation"] == "생일 축하 상황"
+    assert response.json()["suggestions"] == [{"title": "축하", "content": "생일 축하해!"}]
+    assert mock_generate.await_args is not None
+    assert mock_generate.await_args.kwargs["detail"] == "친한 친구야"
+
+
+@pytest.mark.asyncio
+async def test_analyze_and_generate_stream_skips_analysis_with_overrides() -> None:
+    files = {"image_file_1": ("test_image.jpg", b"image", "image/png")}
+    data = {"purpose": PurposeType.PHOTO_RESPONSE.value, "situation": "사과하려는 상황"}
+
+    async def fake_generate(on_event: OnSuggestionEvent | None = None, **_: object) -> AiSuggestionDto:
+        assert on_event is not None
+        await on_event(SuggestionEvent(kind="title", index=0, content="사과"))
+        return AiSuggestionDto(titles=["사과"], suggestions=["미안해"])
+
+    with (
+        patch("ai.glee_agent.GleeAgent.analyze_situation", new_callable=AsyncMock) as mock_analyze,
+        patch("app.suggester.suggester_service.SuggesterService.generate_suggestions", side_effect=fake_generate),
+    ):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/suggester/analyze-and-generate?stream=true", files=files, data=data)
+
+    assert response.status_code == 200
+    mock_analyze.assert_not_awaited()
+    events = [line.removeprefix("event: ") for line in response.text.splitlines() if line.startswith("event: ")]
+    assert events == ["analysis", "title", "result"]
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+from ai.glee_agent import GleeAgent
+from ai.services.agent.orchestrator_agent import OnSuggestionEvent
+from app.suggester.suggester_dto import AiSuggestionDto
+from app.suggester.suggestion_speculator import SuggestionSpeculator
+
+
+def _patch_generate(monkeypatch: pytest.MonkeyPatch, delay: float = 0.0) -> list[str]:
+    calls: list[str] = []
+
+    async def fake_generate(situation: str, on_event: OnSuggestionEvent | None = None) -> AiSuggestionDto:
+        calls.append(situation)
+        await asyncio.sleep(delay)
+        return AiSuggestionDto(titles=["제목"], suggestions=[f"{situation} 답장"])
+
+    monkeypatch.setattr(GleeAgent, "generate_suggestions_situation", fake_generate)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_take_returns_speculated_result_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _patch_generate(monkeypatch)
+    speculator = SuggestionSpeculator(ttl_seconds=60, max_entries=8, max_concurrency=2)
+
+    speculator.speculate("친구 생일 축하")
+    speculator.speculate("친구  생일\n축하")
+    await asyncio.sleep(0.01)
+
+    result = await speculator.take("친구 생일 축하")
+    assert result is not None and result.suggestions == ["친구 생일 축하 답장"]
+    assert await speculator.take("친구 생일 축하") is None
+    assert calls == ["친구 생일 축하"]
+
+    stats = speculator.stats()
+    assert (stats.hits, stats.misses, stats.hit_rate, stats.waste_rate) == (1, 0, 1.0, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_speculation_is_scoped_by_user(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _patch_generate(monkeypatch)
+    speculator = SuggestionSpeculator(ttl_seconds=60, max_entries=8, max_concurrency=2)
+    owner, other = ObjectId(), ObjectId()
+
+    speculator.speculate("상황", owner)
+    await asyncio.sleep(0.01)
+
+    assert await speculator.take("상황", other) is None
+    assert await speculator.take("상황") is None
+    assert await speculator.take("상황", owner) is not None
+    assert calls == ["상황"]
+
+
+@pytest.mark.asyncio
+async def test_only_speculated_lookups_are_counted(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_generate(monkeypatch)
+    speculator = SuggestionSpeculator(ttl_seconds=0.01, max_entries=8, max_concurrency=2)
+
+    assert await speculator.take("예측하지 않은 상황") is None
+    speculator.speculate("상황")
+    await asyncio.sleep(0.05)
+    assert await speculator.take("상황") is None
+
+    stats = speculator.stats()
+    assert (stats.hits, stats.misses, stats.hit_rate) == (0, 1, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_take_waits_for_in_flight_speculation(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_generate(monkeypatch, delay=0.05)
+    speculator = SuggestionSpeculator(ttl_seconds=60, max_entries=8, max_concurrency=2)
+
+    speculator.speculate("상황")
+    assert speculator.stats().in_flight == 1
+    result = await speculator.take("상황")
+
+    assert result is not None
+    assert speculator.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_speculation_cap_and_waste(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _patch_generate(monkeypatch, delay=0.02)
+    speculator = SuggestionSpeculator(ttl_seconds=60, max_entries=8, max_concurrency=1)
+
+    speculator.speculate("첫 번째")
+    speculator.speculate("두 번째")
+    await asyncio.sleep(0.05)
+
+    stats = speculator.stats()
+    assert calls == ["첫 번째"]
+    assert (stats.started, stats.skipped, stats.completed, stats.waste_rate) == (1, 1, 1, 1.0)
+    await speculator.close()